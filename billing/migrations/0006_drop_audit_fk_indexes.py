@@ -0,0 +1,67 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:37
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('billing', '0005_invoice_add_invoice_type_field'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='invoice',
+            name='created_by',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Créé par'),
+        ),
+        migrations.AlterField(
+            model_name='invoice',
+            name='deleted_by',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_deleted', to=settings.AUTH_USER_MODEL, verbose_name='Supprimé par'),
+        ),
+        migrations.AlterField(
+            model_name='invoice',
+            name='due_date',
+            field=models.DateField(help_text='Date limite de paiement', verbose_name="5️⃣ Date d'Échéance"),
+        ),
+        migrations.AlterField(
+            model_name='invoice',
+            name='issue_date',
+            field=models.DateField(default=django.utils.timezone.now, help_text='Date de création de la facture', verbose_name="4️⃣ Date d'Émission"),
+        ),
+        migrations.AlterField(
+            model_name='invoice',
+            name='subject',
+            field=models.CharField(help_text='Ex: Construction villa, Plan et suivi, Travaux de finition...', max_length=255, verbose_name='3️⃣ Objet de la Facture'),
+        ),
+        migrations.AlterField(
+            model_name='invoice',
+            name='tax_percentage',
+            field=models.DecimalField(decimal_places=2, default=0, help_text='Auto-rempli selon le type (ISB=-2, TVA=+5). Modifiable pour taux personnalisé', max_digits=5, verbose_name='6️⃣ Taux de Taxe (%)'),
+        ),
+        migrations.AlterField(
+            model_name='invoice',
+            name='updated_by',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par'),
+        ),
+        migrations.AlterField(
+            model_name='invoiceitem',
+            name='created_by',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_created', to=settings.AUTH_USER_MODEL, verbose_name='Créé par'),
+        ),
+        migrations.AlterField(
+            model_name='invoiceitem',
+            name='deleted_by',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_deleted', to=settings.AUTH_USER_MODEL, verbose_name='Supprimé par'),
+        ),
+        migrations.AlterField(
+            model_name='invoiceitem',
+            name='updated_by',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_updated', to=settings.AUTH_USER_MODEL, verbose_name='Modifié par'),
+        ),
+    ]
@@ -6,9 +6,10 @@ This module contains models for invoicing:
 - InvoiceItem: Line items on an invoice
 """
 
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from core.models import BaseModel
+from core.utils import generate_reference
 
 
 class Invoice(BaseModel):
@@ -183,30 +184,10 @@ class Invoice(BaseModel):
         Example: BH/2025/1, BH/2025/2, etc.
         Counter resets each year.
         """
-        current_year = timezone.now().year
-        prefix = f"BH/{current_year}/"
-        
-        # Find the last invoice number for this year
-        last_invoice = Invoice.all_objects.filter(
-            invoice_number__startswith=prefix
-        ).order_by('-invoice_number').first()
-        
-        if last_invoice:
-            try:
-                last_num = int(last_invoice.invoice_number.split('/')[-1])
-                new_num = last_num + 1
-            except (ValueError, IndexError):
-                new_num = 1
-        else:
-            new_num = 1
-        
-        return f"{prefix}{new_num}"
+        # Counter row is seeded from existing invoices the first time a year is used
+        return generate_reference('BH', Invoice, 'invoice_number', digits=1)
     
     def save(self, *args, **kwargs):
-        # Auto-generate invoice number if not set
-        if not self.invoice_number:
-            self.invoice_number = self.generate_invoice_number()
-        
         # Auto-set tax percentage based on tax type
         if self.tax_type == self.TaxType.ISB:
             self.tax_percentage = -2  # ISB is a deduction
@@ -223,7 +204,12 @@ class Invoice(BaseModel):
             self.client_address = client.address
             self.client_phone = client.phone
         
-        super().save(*args, **kwargs)
+        # Auto-generate invoice number if not set. The counter increment
+        # commits with the INSERT, so a failed save gives its number back.
+        with transaction.atomic():
+            if not self.invoice_number:
+                self.invoice_number = self.generate_invoice_number()
+            super().save(*args, **kwargs)
 
 
 class InvoiceItem(BaseModel):
@@ -29,8 +29,8 @@ def notify_client_new_invoice(sender, instance, created, **kwargs):
         return
     
     try:
-        from core.notifications import notify_new_invoice
-        notify_new_invoice(instance)
-        logger.info(f"Notification sent for invoice: {instance.invoice_number}")
+        from core.tasks import dispatch_on_commit, notify_new_invoice_task
+        dispatch_on_commit(notify_new_invoice_task, instance.id)
+        logger.info(f"Notification queued for invoice: {instance.invoice_number}")
     except Exception as e:
-        logger.error(f"Failed to send invoice notification: {e}")
+        logger.error(f"Failed to queue invoice notification: {e}")
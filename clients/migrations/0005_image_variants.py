@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0004_drop_audit_fk_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='apppromotion',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Fichiers AVIF/WebP/JPEG générés à la compression', verbose_name="Variantes d'image"),
+        ),
+        migrations.AddField(
+            model_name='projectupdate',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Fichiers AVIF/WebP/JPEG générés à la compression', verbose_name="Variantes d'image"),
+        ),
+    ]
@@ -221,6 +221,13 @@ class ProjectUpdate(BaseModel):
         verbose_name="Photo du Chantier",
         help_text="Télécharger une photo du chantier"
     )
+    image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name="Variantes d'image",
+        help_text="Fichiers AVIF/WebP/JPEG générés à la compression"
+    )
     video_url = models.URLField(
         blank=True,
         verbose_name="Lien Vidéo",
@@ -255,6 +262,13 @@ class AppPromotion(BaseModel):
         upload_to='promotions/banners/',
         verbose_name="Image de Bannière"
     )
+    image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name="Variantes d'image",
+        help_text="Fichiers AVIF/WebP/JPEG générés à la compression"
+    )
     linked_portfolio = models.ForeignKey(
         'marketing.PortfolioItem',
         on_delete=models.SET_NULL,
@@ -5,6 +5,7 @@ Mobile app endpoints for authenticated clients.
 """
 
 from rest_framework import serializers
+from core.fields import ImageVariantsField
 from django.contrib.auth.models import User
 from .models import ClientProfile, ActiveProject, ProjectUpdate, AppPromotion
 from billing.serializers import InvoiceListSerializer
@@ -81,10 +82,13 @@ class ClientProfileUpdateSerializer(serializers.ModelSerializer):
 class ProjectUpdateSerializer(serializers.ModelSerializer):
     """Serializer for project updates."""
     
+    variants = ImageVariantsField('image')
+    
     class Meta:
         model = ProjectUpdate
         fields = [
-            'id', 'title', 'description', 'image', 'video_url', 'posted_at'
+            'id', 'title', 'description', 'image', 'variants',
+            'video_url', 'posted_at'
         ]
 
 
@@ -163,11 +167,12 @@ class AppPromotionSerializer(serializers.ModelSerializer):
         read_only=True,
         allow_null=True
     )
+    variants = ImageVariantsField('banner_image')
     
     class Meta:
         model = AppPromotion
         fields = [
-            'id', 'title', 'banner_image',
+            'id', 'title', 'banner_image', 'variants',
             'linked_portfolio', 'linked_portfolio_slug',
             'external_link', 'order'
         ]
@@ -9,7 +9,7 @@ from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.conf import settings
 
-from core.utils import compress_image
+from core.tasks import queue_image_compression
 from .models import ProjectUpdate, AppPromotion
 
 logger = logging.getLogger(__name__)
@@ -18,12 +18,7 @@ logger = logging.getLogger(__name__)
 @receiver(post_save, sender=ProjectUpdate)
 def compress_project_update_image(sender, instance, created, **kwargs):
     """Compress project update image after save."""
-    if instance.image and '_compressed' not in instance.image.name:
-        compressed = compress_image(instance.image, max_size=(1200, 900))
-        if compressed:
-            post_save.disconnect(compress_project_update_image, sender=ProjectUpdate)
-            instance.image.save(compressed.name, compressed, save=True)
-            post_save.connect(compress_project_update_image, sender=ProjectUpdate)
+    queue_image_compression(instance, 'image', max_size=(1200, 900))
 
 
 @receiver(post_save, sender=ProjectUpdate)
@@ -37,19 +32,14 @@ def notify_client_project_update(sender, instance, created, **kwargs):
         return
     
     try:
-        from core.notifications import notify_project_update
-        notify_project_update(instance)
-        logger.info(f"Notification sent for project update: {instance.id}")
+        from core.tasks import dispatch_on_commit, notify_project_update_task
+        dispatch_on_commit(notify_project_update_task, instance.id)
+        logger.info(f"Notification queued for project update: {instance.id}")
     except Exception as e:
-        logger.error(f"Failed to send project update notification: {e}")
+        logger.error(f"Failed to queue project update notification: {e}")
 
 
 @receiver(post_save, sender=AppPromotion)
 def compress_app_promotion_banner(sender, instance, created, **kwargs):
     """Compress app promotion banner image after save."""
-    if instance.banner_image and '_compressed' not in instance.banner_image.name:
-        compressed = compress_image(instance.banner_image, max_size=(1200, 600))
-        if compressed:
-            post_save.disconnect(compress_app_promotion_banner, sender=AppPromotion)
-            instance.banner_image.save(compressed.name, compressed, save=True)
-            post_save.connect(compress_app_promotion_banner, sender=AppPromotion)
+    queue_image_compression(instance, 'banner_image', max_size=(1200, 600))
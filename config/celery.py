@@ -0,0 +1,21 @@
+"""
+Celery application for Belle House Backend.
+
+Runs slow side effects (push notifications, emails) outside the request
+cycle. Start a worker with:
+
+    celery -A config worker -Q notifications,celery -l info
+
+When CELERY_BROKER_URL is not set (development, tests), tasks run eagerly
+in-process, so no broker is needed.
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+app = Celery('config')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
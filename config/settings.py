@@ -82,9 +82,10 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',  # Static files - must be right after SecurityMiddleware
     'corsheaders.middleware.CorsMiddleware',  # CORS - must be before CommonMiddleware
     'django.contrib.sessions.middleware.SessionMiddleware',
-    'django.middleware.locale.LocaleMiddleware',  # For language switching
+    'core.middleware.APIAwareLocaleMiddleware',  # For language switching (skipped on /api/)
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -138,6 +139,25 @@ else:
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
     }
+# =============================================================================
+# AUTHENTICATION
+# =============================================================================
+
+# Single-query login by username or email
+AUTHENTICATION_BACKENDS = [
+    'core.backends.EmailOrUsernameModelBackend',
+]
+
+# First hasher is used for new passwords; existing PBKDF2 hashes keep
+# working and are upgraded to bcrypt on the user's next successful login
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+
 # =============================================================================
 # PASSWORD VALIDATION
 # =============================================================================
@@ -187,6 +207,21 @@ STATICFILES_DIRS = [
     BASE_DIR / 'static',
 ]
 
+# WhiteNoise serves collected static files with gzip/brotli variants and
+# content-hashed filenames, so they can be cached by browsers for a year.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+WHITENOISE_MAX_AGE = 31536000  # 1 year (hashed filenames are immutable)
+# Don't crash a page when a referenced file is missing from the manifest
+# (e.g. the optional Jazzmin custom_css)
+WHITENOISE_MANIFEST_STRICT = False
+
 MEDIA_URL = 'media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
@@ -202,7 +237,16 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # DJANGO REST FRAMEWORK
 # =============================================================================
 
+# The browsable API renders an HTML form around every response; only
+# enable it where someone is actually clicking through the API.
+BROWSABLE_API = config('BROWSABLE_API', default=DEBUG, cast=bool)
+
+DEFAULT_RENDERER_CLASSES = ['core.renderers.ORJSONRenderer']
+if BROWSABLE_API:
+    DEFAULT_RENDERER_CLASSES.append('rest_framework.renderers.BrowsableAPIRenderer')
+
 REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': DEFAULT_RENDERER_CLASSES,
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework_simplejwt.authentication.JWTAuthentication',
         'rest_framework.authentication.SessionAuthentication',  # For browsable API
@@ -237,6 +281,8 @@ SIMPLE_JWT = {
     'UPDATE_LAST_LOGIN': True,
     'AUTH_HEADER_TYPES': ('Bearer',),
     'AUTH_TOKEN_CLASSES': ('rest_framework_simplejwt.tokens.AccessToken',),
+    # Rotation and logout blacklist refresh tokens in the cache (see core.tokens)
+    'TOKEN_REFRESH_SERIALIZER': 'core.serializers.CachedBlacklistTokenRefreshSerializer',
 }
 
 
@@ -275,6 +321,53 @@ DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='Belle House <noreply@
 FIREBASE_CREDENTIALS_PATH = config('FIREBASE_CREDENTIALS_PATH', default=None)
 
 
+# =============================================================================
+# CACHE
+# =============================================================================
+
+# Shared across gunicorn workers and Celery when Redis is configured,
+# per-process memory otherwise. Caches that other processes must see
+# invalidated (list versions, user profiles) are only used when
+# SHARED_CACHE is set; check core.W001 warns when DEBUG is off without it.
+CACHE_URL = config('CACHE_URL', default='')
+SHARED_CACHE = bool(CACHE_URL)
+
+if CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_URL,
+            'KEY_PREFIX': 'bh',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
+# =============================================================================
+# CELERY (Background Tasks)
+# =============================================================================
+
+# Without a broker, tasks run synchronously in the calling process
+CELERY_BROKER_URL = config('CELERY_BROKER_URL', default='')
+CELERY_TASK_ALWAYS_EAGER = not CELERY_BROKER_URL
+CELERY_TASK_EAGER_PROPAGATES = False
+CELERY_TASK_SERIALIZER = 'json'
+CELERY_ACCEPT_CONTENT = ['json']
+CELERY_TASK_IGNORE_RESULT = True
+CELERY_TASK_ACKS_LATE = True
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_TIMEZONE = TIME_ZONE
+# Notifications get their own queue so bursts don't delay other tasks
+CELERY_TASK_ROUTES = {
+    'core.tasks.notify_*': {'queue': 'notifications'},
+}
+
+
 # =============================================================================
 # API DOCUMENTATION (drf-spectacular)
 # =============================================================================
@@ -460,13 +553,16 @@ JAZZMIN_UI_TWEAKS = {
 # LOGGING CONFIGURATION
 # =============================================================================
 
+# Records below LOG_LEVEL are dropped before any formatting happens;
+# set it to WARNING to keep INFO chatter off hot paths.
+LOG_LEVEL = config('LOG_LEVEL', default='INFO')
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
     'formatters': {
         'verbose': {
-            'format': '{levelname} {asctime} {module} {message}',
-            'style': '{',
+            'format': '%(levelname)s %(asctime)s %(module)s %(message)s',
         },
     },
     'handlers': {
@@ -477,12 +573,12 @@ LOGGING = {
     },
     'root': {
         'handlers': ['console'],
-        'level': 'INFO',
+        'level': LOG_LEVEL,
     },
     'loggers': {
         'django': {
             'handlers': ['console'],
-            'level': 'INFO',
+            'level': LOG_LEVEL,
             'propagate': False,
         },
         'django.request': {
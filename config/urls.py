@@ -18,7 +18,6 @@ API Structure:
 from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
-from django.conf.urls.static import static
 from drf_spectacular.views import (
     SpectacularAPIView,
     SpectacularRedocView,
@@ -62,7 +61,10 @@ urlpatterns = [
     path('api/admin-api/', include('config.admin_urls')),
 ]
 
-# Serve media files in development
+# Serve media files in development. In production nginx serves media and
+# WhiteNoise serves static, so django.views.static is never imported there.
 if settings.DEBUG:
+    from django.conf.urls.static import static
+    
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
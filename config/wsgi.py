@@ -14,3 +14,9 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_wsgi_application()
+
+# Resolve the URLconf now instead of on the first request. With gunicorn
+# --preload this happens once in the master and is shared by all workers.
+from django.urls import get_resolver  # noqa: E402
+
+get_resolver().reverse_dict
@@ -1,7 +1,8 @@
 """
 Core admin configuration.
 
-Customizes the Django admin site appearance.
+Customizes the Django admin site appearance and provides shared
+admin helpers.
 """
 
 from django.contrib import admin
@@ -11,3 +12,31 @@ from django.contrib import admin
 admin.site.site_header = "Belle House Administration"
 admin.site.site_title = "Belle House Admin"
 admin.site.index_title = "Bienvenue sur le panneau d'administration Belle House"
+
+
+class SoftDeleteAdminMixin:
+    """
+    Admin mixin for BaseModel subclasses.
+    
+    The change list only reads active rows through the default manager.
+    Soft-deleted rows are included when the "is_deleted" list filter is
+    used, and on the per-object views so deleted records can still be
+    opened and restored.
+    """
+    
+    include_deleted_param = 'is_deleted__exact'
+    
+    def get_queryset(self, request):
+        if self._include_deleted(request):
+            qs = self.model.all_objects.get_queryset()
+            ordering = self.get_ordering(request)
+            if ordering:
+                qs = qs.order_by(*ordering)
+            return qs
+        return super().get_queryset(request)
+    
+    def _include_deleted(self, request):
+        match = getattr(request, 'resolver_match', None)
+        if match is None or not match.url_name or not match.url_name.endswith('_changelist'):
+            return True
+        return self.include_deleted_param in request.GET
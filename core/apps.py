@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core"
+    
+    def ready(self):
+        # Import signals and system checks to register them
+        import core.signals  # noqa: F401
+        import core.checks  # noqa: F401
+        
+        # Build the (cached) password validators now: CommonPasswordValidator
+        # reads a 20k-entry gzip file in __init__, which would otherwise land
+        # on the first registration/password change request.
+        from django.contrib.auth.password_validation import get_default_password_validators
+        get_default_password_validators()
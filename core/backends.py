@@ -0,0 +1,44 @@
+"""
+Authentication backends for Belle House Backend.
+"""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.db.models import Q
+
+
+class EmailOrUsernameModelBackend(ModelBackend):
+    """
+    ModelBackend that accepts a username or an email in the username field.
+    
+    Both are matched in a single query, so email login no longer needs a
+    separate lookup to find the username first. Emails are stored lowercase
+    at registration, so the email comparison is exact on the lowercased
+    value and can use the auth_user email index.
+    """
+    
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        User = get_user_model()
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        
+        candidates = list(
+            User._default_manager.filter(
+                Q(username=username) | Q(email=username.lower())
+            ).order_by('pk')[:2]
+        )
+        
+        if not candidates:
+            # Run the hasher anyway so response time doesn't reveal
+            # whether the account exists
+            User().set_password(password)
+            return None
+        
+        # An exact username match wins over an email that happens to match
+        candidates.sort(key=lambda user: user.username != username)
+        for user in candidates:
+            if user.check_password(password) and self.user_can_authenticate(user):
+                return user
+        return None
@@ -0,0 +1,24 @@
+"""
+System checks for Belle House Backend.
+"""
+
+from django.conf import settings
+from django.core.checks import Warning, register
+
+
+@register()
+def check_shared_cache(app_configs, **kwargs):
+    """Warn when a production deploy has no cache shared between processes."""
+    if settings.DEBUG or settings.SHARED_CACHE:
+        return []
+    return [
+        Warning(
+            "CACHE_URL is not set while DEBUG is off.",
+            hint=(
+                "Point CACHE_URL at Redis (e.g. redis://redis:6379/1). Without "
+                "it each gunicorn worker keeps its own cache, so ETags, cached "
+                "lists and cached profiles are turned off."
+            ),
+            id='core.W001',
+        )
+    ]
@@ -0,0 +1,49 @@
+"""
+Reusable serializer fields for Belle House Backend.
+"""
+
+from rest_framework import serializers
+
+
+class LowercaseEmailField(serializers.EmailField):
+    """
+    EmailField that stores addresses lowercased.
+    
+    The value is lowercased while it is converted, before the validators
+    run, so serializers don't need a separate validate_email hook.
+    Validation itself is Django's EmailValidator, which splits on the last
+    "@" and matches anchored patterns without nested quantifiers.
+    """
+    
+    def to_internal_value(self, data):
+        return super().to_internal_value(data).lower()
+
+
+class ImageVariantsField(serializers.Field):
+    """
+    Read-only URLs of the compressed variants of an image field.
+    
+    Renders the model's image_variants manifest as {format: url}, with
+    absolute URLs when the request is in the serializer context (like
+    DRF's ImageField). The manifest is only rendered while it still
+    describes the current image: between a new upload and its
+    compression, the field is an empty dict.
+    """
+    
+    def __init__(self, image_field, **kwargs):
+        self.image_field = image_field
+        kwargs['source'] = '*'
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+    
+    def to_representation(self, instance):
+        image = getattr(instance, self.image_field)
+        manifest = instance.image_variants or {}
+        if not image or image.name not in manifest.values():
+            return {}
+        request = self.context.get('request')
+        urls = {}
+        for ext, name in manifest.items():
+            url = image.storage.url(name)
+            urls[ext] = request.build_absolute_uri(url) if request else url
+        return urls
@@ -0,0 +1,58 @@
+"""
+DRF filter backends for Belle House Backend.
+"""
+
+import operator
+from functools import reduce
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connections
+from rest_framework.filters import SearchFilter
+
+
+class TrigramSearchFilter(SearchFilter):
+    """
+    SearchFilter that ranks matches by trigram similarity on PostgreSQL.
+    
+    Matching is SearchFilter's own icontains over the view's
+    search_fields, which the pg_trgm GIN indexes on UPPER(column) serve
+    without a sequential scan. On PostgreSQL, matches are then ordered by
+    their summed word similarity to the search terms, best first, with
+    the view's ordering as tie-breaker. An explicit ?ordering= wins.
+    
+    List it after OrderingFilter so the default ordering doesn't replace
+    the ranking. Other databases get plain SearchFilter behaviour.
+    """
+    
+    rank_annotation = 'search_rank'
+    
+    # ORM lookup for each (model, search field). Resolving one walks the
+    # model's _meta, and the answer never changes while the process runs.
+    _lookups = {}
+    
+    def construct_search(self, field_name, queryset):
+        key = (queryset.model, field_name)
+        if key not in self._lookups:
+            self._lookups[key] = super().construct_search(field_name, queryset)
+        return self._lookups[key]
+    
+    def filter_queryset(self, request, queryset, view):
+        queryset = super().filter_queryset(request, queryset, view)
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+        
+        if not search_fields or not search_terms:
+            return queryset
+        if connections[queryset.db].vendor != 'postgresql':
+            return queryset
+        if request.query_params.get('ordering'):
+            return queryset
+        
+        query = ' '.join(search_terms)
+        rank = reduce(operator.add, (
+            TrigramWordSimilarity(query, str(field).lstrip('^=@$'))
+            for field in search_fields
+        ))
+        return queryset.annotate(**{self.rank_annotation: rank}).order_by(
+            f'-{self.rank_annotation}', *queryset.query.order_by
+        )
@@ -0,0 +1,36 @@
+"""
+Custom middleware for Belle House Backend.
+"""
+
+from django.conf import settings
+from django.middleware.locale import LocaleMiddleware
+from django.utils import translation
+
+
+class APIAwareLocaleMiddleware(LocaleMiddleware):
+    """
+    LocaleMiddleware that skips language negotiation for JSON API requests.
+    
+    The API returns hardcoded French messages, so parsing Accept-Language
+    and checking URL prefixes on every /api/ call is wasted work. API requests
+    get the default LANGUAGE_CODE; admin and other pages keep the full
+    language switching behaviour.
+    """
+    api_prefix = '/api/'
+    
+    def _is_api_request(self, request):
+        return request.path_info.startswith(self.api_prefix)
+    
+    def process_request(self, request):
+        if self._is_api_request(request):
+            # Activate the default language so a previous request's
+            # language doesn't leak through the thread-local state
+            translation.activate(settings.LANGUAGE_CODE)
+            request.LANGUAGE_CODE = settings.LANGUAGE_CODE
+            return
+        super().process_request(request)
+    
+    def process_response(self, request, response):
+        if self._is_api_request(request):
+            return response
+        return super().process_response(request, response)
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReferenceCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('prefix', models.CharField(max_length=20, verbose_name='Préfixe')),
+                ('year', models.PositiveIntegerField(verbose_name='Année')),
+                ('last_number', models.PositiveIntegerField(default=0, verbose_name='Dernier numéro')),
+            ],
+            options={
+                'verbose_name': 'Compteur de références',
+                'verbose_name_plural': 'Compteurs de références',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='referencecounter',
+            constraint=models.UniqueConstraint(fields=('prefix', 'year'), name='unique_reference_counter_prefix_year'),
+        ),
+    ]
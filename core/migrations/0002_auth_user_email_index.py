@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:53
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('core', '0001_reference_counter'),
+    ]
+
+    # auth_user belongs to django.contrib.auth, so the index is created with
+    # plain SQL; registration and email login look users up by exact email.
+    operations = [
+        migrations.RunSQL(
+            sql="CREATE INDEX IF NOT EXISTS auth_user_email_idx ON auth_user (email);",
+            reverse_sql="DROP INDEX IF EXISTS auth_user_email_idx;",
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_auth_user_email_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CompressedImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('src_digest', models.CharField(max_length=32, verbose_name='Empreinte source')),
+                ('max_width', models.PositiveIntegerField(verbose_name='Largeur max')),
+                ('max_height', models.PositiveIntegerField(verbose_name='Hauteur max')),
+                ('dst_name', models.CharField(max_length=255, verbose_name='Fichier compressé')),
+            ],
+            options={
+                'verbose_name': 'Image compressée',
+                'verbose_name_plural': 'Images compressées',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='compressedimage',
+            constraint=models.UniqueConstraint(fields=('src_digest', 'max_width', 'max_height'), name='unique_compressed_image_digest_size'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_compressed_image'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='compressedimage',
+            name='variants',
+            field=models.JSONField(blank=True, default=dict, help_text='Fichier par format (avif, webp, jpg...)', verbose_name='Variantes'),
+        ),
+    ]
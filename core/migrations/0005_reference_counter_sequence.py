@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-16 00:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_compressed_image_variants'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='referencecounter',
+            name='prefix',
+            field=models.CharField(max_length=100, verbose_name='Séquence'),
+        ),
+    ]
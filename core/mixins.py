@@ -0,0 +1,131 @@
+"""
+Reusable view mixins for Belle House Backend.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response, quote_etag
+from rest_framework.response import Response
+
+from .utils import get_list_version
+
+
+class ConditionalListMixin:
+    """
+    ETag support for list endpoints.
+    
+    The ETag combines the model's list version (see bump_list_version)
+    with the query string and renderer, so a client polling an unchanged
+    list gets a 304 without the queryset being evaluated.
+    
+    Views must bump the version for every write that bypasses save
+    signals (queryset.update()). Without a shared cache
+    (settings.SHARED_CACHE) a bump would only reach the worker that
+    handled the write, so no ETag is sent at all.
+    """
+    
+    def get_list_etag(self, request):
+        model = self.get_queryset().model
+        signature = ':'.join([
+            get_list_version(model),
+            request.accepted_renderer.format,
+            request.GET.urlencode(),
+        ])
+        return quote_etag(hashlib.md5(signature.encode()).hexdigest())
+    
+    def list(self, request, *args, **kwargs):
+        if not settings.SHARED_CACHE:
+            return super().list(request, *args, **kwargs)
+        
+        etag = self.get_list_etag(request)
+        not_modified = get_conditional_response(request._request, etag=etag)
+        if not_modified is not None:
+            response = not_modified
+        else:
+            response = super().list(request, *args, **kwargs)
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, must-revalidate'
+        return response
+
+
+class ConditionalRetrieveMixin:
+    """
+    ETag support for detail endpoints with large bodies.
+    
+    The ETag is built from the row's updated_at and the model's list
+    version (bumped by writes that don't touch updated_at, such as image
+    compression), so revalidating an unchanged object reads one column
+    and returns a 304 without loading or rendering the full row. Like
+    ConditionalListMixin, it is a no-op without a shared cache.
+    """
+    
+    def get_retrieve_etag(self, request, updated_at):
+        model = self.get_queryset().model
+        signature = ':'.join([
+            get_list_version(model),
+            updated_at.isoformat(),
+            request.accepted_renderer.format,
+        ])
+        return quote_etag(hashlib.md5(signature.encode()).hexdigest())
+    
+    def retrieve(self, request, *args, **kwargs):
+        if not settings.SHARED_CACHE:
+            return super().retrieve(request, *args, **kwargs)
+        
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        updated_at = self.filter_queryset(self.get_queryset()).filter(
+            **{self.lookup_field: kwargs[lookup_url_kwarg]}
+        ).values_list('updated_at', flat=True).first()
+        if updated_at is None:
+            # Let the regular lookup raise the 404
+            return super().retrieve(request, *args, **kwargs)
+        
+        etag = self.get_retrieve_etag(request, updated_at)
+        not_modified = get_conditional_response(request._request, etag=etag)
+        if not_modified is not None:
+            response = not_modified
+        else:
+            response = super().retrieve(request, *args, **kwargs)
+        response['ETag'] = etag
+        response['Cache-Control'] = 'private, must-revalidate'
+        return response
+
+
+class CachedListMixin:
+    """
+    Cache list response data per model version and URL.
+    
+    The key includes the model's list version (see bump_list_version), so
+    a write invalidates every cached page at once; list_cache_timeout only
+    bounds how long unused entries linger. Meant for small public lists
+    whose rows are only written through save()/delete(). Without a shared
+    cache (settings.SHARED_CACHE) other workers would miss the version
+    bump and serve stale pages, so nothing is cached.
+    """
+    
+    list_cache_timeout = 300
+    
+    def get_list_cache_key(self, request):
+        model = self.get_queryset().model
+        signature = ':'.join([
+            get_list_version(model),
+            request.accepted_renderer.format,
+            request.build_absolute_uri(),
+        ])
+        return f"listcache:{model._meta.label_lower}:{hashlib.md5(signature.encode()).hexdigest()}"
+    
+    def list(self, request, *args, **kwargs):
+        if not settings.SHARED_CACHE:
+            return super().list(request, *args, **kwargs)
+        
+        cache_key = self.get_list_cache_key(request)
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+        
+        response = super().list(request, *args, **kwargs)
+        cache.set(cache_key, response.data, self.list_cache_timeout)
+        return response
+
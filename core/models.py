@@ -6,6 +6,9 @@ for all other models in the system:
 - Soft delete capability
 - Audit trail (created_at, updated_at, created_by, updated_by)
 - Custom managers for filtering deleted records
+
+It also holds ReferenceCounter, the per-year sequence behind generated
+references such as invoice numbers.
 """
 
 from django.db import models
@@ -13,6 +16,11 @@ from django.conf import settings
 from django.utils import timezone
 
 
+# Fields written by BaseModel.soft_delete() / restore()
+SOFT_DELETE_FIELDS = ('is_deleted', 'deleted_at', 'deleted_by', 'updated_at')
+RESTORE_FIELDS = ('is_deleted', 'deleted_at', 'deleted_by', 'updated_by', 'updated_at')
+
+
 class ActiveManager(models.Manager):
     """
     Custom manager that filters out soft-deleted records by default.
@@ -51,13 +59,15 @@ class BaseModel(models.Model):
         verbose_name="Modifié le"
     )
     
-    # Audit fields
+    # Audit fields (not indexed: nothing filters on them, and an index per
+    # FK per table only slows down every INSERT)
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
         null=True,
         blank=True,
         related_name="%(class)s_created",
+        db_index=False,
         verbose_name="Créé par"
     )
     updated_by = models.ForeignKey(
@@ -66,6 +76,7 @@ class BaseModel(models.Model):
         null=True,
         blank=True,
         related_name="%(class)s_updated",
+        db_index=False,
         verbose_name="Modifié par"
     )
     
@@ -85,6 +96,7 @@ class BaseModel(models.Model):
         null=True,
         blank=True,
         related_name="%(class)s_deleted",
+        db_index=False,
         verbose_name="Supprimé par"
     )
     
@@ -103,7 +115,7 @@ class BaseModel(models.Model):
         self.is_deleted = True
         self.deleted_at = timezone.now()
         self.deleted_by = user
-        self.save(update_fields=['is_deleted', 'deleted_at', 'deleted_by', 'updated_at'])
+        self.save(update_fields=SOFT_DELETE_FIELDS)
     
     def restore(self, user=None):
         """
@@ -115,7 +127,7 @@ class BaseModel(models.Model):
         self.deleted_by = None
         if user:
             self.updated_by = user
-        self.save(update_fields=['is_deleted', 'deleted_at', 'deleted_by', 'updated_by', 'updated_at'])
+        self.save(update_fields=RESTORE_FIELDS)
     
     def hard_delete(self):
         """
@@ -142,3 +154,83 @@ class TimeStampedModel(models.Model):
     
     class Meta:
         abstract = True
+
+
+class ReferenceCounter(models.Model):
+    """
+    Last number issued for a reference sequence in a given year.
+    
+    One row per (sequence, year); the row is locked while incremented so
+    concurrent creates never mint the same reference. The prefix column
+    holds the sequence name (see core.utils.reference_sequence).
+    """
+    
+    prefix = models.CharField(
+        max_length=100,
+        verbose_name="Séquence"
+    )
+    year = models.PositiveIntegerField(
+        verbose_name="Année"
+    )
+    last_number = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Dernier numéro"
+    )
+    
+    class Meta:
+        verbose_name = "Compteur de références"
+        verbose_name_plural = "Compteurs de références"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['prefix', 'year'],
+                name='unique_reference_counter_prefix_year'
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.prefix}/{self.year}: {self.last_number}"
+
+
+class CompressedImage(models.Model):
+    """
+    Compressed output already produced for a source image.
+    
+    Keyed by a digest of the uploaded bytes and the target size, so an
+    image uploaded again (re-saved admin forms, the same photo on several
+    records) reuses the stored result instead of being decoded again.
+    """
+    
+    src_digest = models.CharField(
+        max_length=32,
+        verbose_name="Empreinte source"
+    )
+    max_width = models.PositiveIntegerField(
+        verbose_name="Largeur max"
+    )
+    max_height = models.PositiveIntegerField(
+        verbose_name="Hauteur max"
+    )
+    dst_name = models.CharField(
+        max_length=255,
+        verbose_name="Fichier compressé"
+    )
+    variants = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name="Variantes",
+        help_text="Fichier par format (avif, webp, jpg...)"
+    )
+    
+    class Meta:
+        verbose_name = "Image compressée"
+        verbose_name_plural = "Images compressées"
+        constraints = [
+            models.UniqueConstraint(
+                fields=['src_digest', 'max_width', 'max_height'],
+                name='unique_compressed_image_digest_size'
+            ),
+        ]
+    
+    def __str__(self):
+        return f"{self.src_digest} ({self.max_width}x{self.max_height})"
+
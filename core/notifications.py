@@ -7,18 +7,85 @@ This module provides:
 - Centralized notification dispatcher
 """
 
+import asyncio
 import logging
+import threading
+from datetime import datetime, timezone
+from functools import lru_cache, wraps
 from typing import Optional, List, Dict, Any
 
 from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.template import TemplateDoesNotExist
+from django.template.loader import get_template
 from django.utils.html import strip_tags
 
 logger = logging.getLogger(__name__)
 
 # Firebase initialization (lazy loading)
+# _messaging holds the firebase_admin.messaging module once the app is ready,
+# so send functions don't re-run the import on every notification.
 _firebase_app = None
+_messaging = None
+_firebase_lock = threading.Lock()
+# 'uninit' until the first push, then 'ready' or 'disabled' for the life of
+# the process, so an unconfigured deployment decides once and returns early
+_firebase_state = 'uninit'
+
+# Multicast sends: tokens per send_each_for_multicast_async call (FCM allows
+# up to 500, but ~100 concurrent HTTP/2 streams per connection is the sweet spot)
+FCM_MULTICAST_BATCH_SIZE = 100
+
+# Pushes go through the SDK's async HTTP/2 client on one long-lived event
+# loop, so every send in the process multiplexes over the same connection
+# instead of the sync SDK spawning a thread per message.
+_push_loop = None
+_push_loop_lock = threading.Lock()
+FCM_SEND_TIMEOUT = 60
+
+# Google access tokens live for 1h; the shared copy expires 5 min early so
+# no worker ever sends a request with a token about to be rejected.
+FCM_ACCESS_TOKEN_CACHE_KEY = 'fcm:access_token'
+FCM_ACCESS_TOKEN_TTL = 3300
+FCM_ACCESS_TOKEN_SAFETY_MARGIN = 300
+
+
+def _share_access_token(google_credential):
+    """
+    Make a Google credential reuse the access token stored in the cache.
+    
+    Each worker process otherwise mints its own OAuth token from the
+    service account. Wrapping refresh() lets the first worker publish its
+    token and the others pick it up until it nears expiry.
+    
+    Args:
+        google_credential: google.auth credential backing the Firebase app
+    """
+    from django.core.cache import cache
+    
+    original_refresh = google_credential.refresh
+    
+    def refresh(request):
+        cached = cache.get(FCM_ACCESS_TOKEN_CACHE_KEY)
+        if cached:
+            google_credential.token, google_credential.expiry = cached
+            return
+        
+        original_refresh(request)
+        
+        timeout = FCM_ACCESS_TOKEN_TTL
+        if google_credential.expiry:
+            remaining = google_credential.expiry - datetime.now(timezone.utc).replace(tzinfo=None)
+            timeout = min(timeout, int(remaining.total_seconds()) - FCM_ACCESS_TOKEN_SAFETY_MARGIN)
+        if timeout > 0:
+            # add() keeps the first token published when workers race
+            cache.add(
+                FCM_ACCESS_TOKEN_CACHE_KEY,
+                (google_credential.token, google_credential.expiry),
+                timeout=timeout
+            )
+    
+    google_credential.refresh = refresh
 
 
 def get_firebase_app():
@@ -26,28 +93,62 @@ def get_firebase_app():
     Get or initialize Firebase app.
     Uses lazy loading to avoid initialization errors when credentials are not set.
     """
-    global _firebase_app
+    global _firebase_app, _messaging, _firebase_state
     
-    if _firebase_app is not None:
+    if _firebase_state == 'ready':
         return _firebase_app
-    
-    credentials_path = getattr(settings, 'FIREBASE_CREDENTIALS_PATH', None)
-    
-    if not credentials_path:
-        logger.warning("Firebase credentials not configured. Push notifications disabled.")
+    if _firebase_state == 'disabled':
         return None
     
-    try:
-        import firebase_admin
-        from firebase_admin import credentials
+    with _firebase_lock:
+        # Another thread may have initialized it while we waited for the lock
+        if _firebase_state != 'uninit':
+            return _firebase_app
         
-        cred = credentials.Certificate(credentials_path)
-        _firebase_app = firebase_admin.initialize_app(cred)
-        logger.info("Firebase initialized successfully.")
-        return _firebase_app
-    except Exception as e:
-        logger.error(f"Failed to initialize Firebase: {e}")
-        return None
+        credentials_path = getattr(settings, 'FIREBASE_CREDENTIALS_PATH', None)
+        
+        if not credentials_path:
+            logger.warning("Firebase credentials not configured. Push notifications disabled.")
+            _firebase_state = 'disabled'
+            return None
+        
+        try:
+            import firebase_admin
+            from firebase_admin import credentials, messaging
+            
+            cred = credentials.Certificate(credentials_path)
+            _share_access_token(cred.get_credential())
+            _firebase_app = firebase_admin.initialize_app(cred)
+            _messaging = messaging
+            _firebase_state = 'ready'
+            logger.info("Firebase initialized successfully.")
+            return _firebase_app
+        except Exception as e:
+            logger.error(f"Failed to initialize Firebase: {e}. Push notifications disabled.")
+            _firebase_state = 'disabled'
+            return None
+
+
+def _run_on_push_loop(coro):
+    """
+    Run a coroutine on the shared push event loop and wait for its result.
+    
+    The loop (and its thread) is started on first use, after any gunicorn
+    or Celery fork, and lives for the rest of the process.
+    """
+    global _push_loop
+    
+    if _push_loop is None:
+        with _push_loop_lock:
+            if _push_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name='fcm-push-loop', daemon=True
+                ).start()
+                _push_loop = loop
+    
+    future = asyncio.run_coroutine_threadsafe(coro, _push_loop)
+    return future.result(timeout=FCM_SEND_TIMEOUT)
 
 
 def send_push_notification(
@@ -79,7 +180,7 @@ def send_push_notification(
         return False
     
     try:
-        from firebase_admin import messaging
+        messaging = _messaging
         
         # Build notification
         notification = messaging.Notification(
@@ -114,8 +215,10 @@ def send_push_notification(
         )
         
         # Send message
-        response = messaging.send(message)
-        logger.info(f"Push notification sent: {response}")
+        response = _run_on_push_loop(messaging.send_each_async([message])).responses[0]
+        if not response.success:
+            raise response.exception
+        logger.info(f"Push notification sent: {response.message_id}")
         return True
         
     except Exception as e:
@@ -123,6 +226,15 @@ def send_push_notification(
         return False
 
 
+async def _send_multicast_batches(messages):
+    """Send multicast messages concurrently; failed batches come back as exceptions."""
+    messaging = _messaging
+    return await asyncio.gather(
+        *(messaging.send_each_for_multicast_async(message) for message in messages),
+        return_exceptions=True
+    )
+
+
 def send_push_to_multiple(
     fcm_tokens: List[str],
     title: str,
@@ -132,6 +244,9 @@ def send_push_to_multiple(
     """
     Send push notification to multiple devices.
     
+    Tokens are sent in batches of FCM_MULTICAST_BATCH_SIZE, all batches
+    running concurrently as HTTP/2 streams on the shared push loop.
+    
     Args:
         fcm_tokens: List of FCM tokens
         title: Notification title
@@ -148,32 +263,117 @@ def send_push_to_multiple(
     if not app:
         return {'success_count': 0, 'failure_count': len(fcm_tokens)}
     
-    try:
-        from firebase_admin import messaging
-        
-        notification = messaging.Notification(title=title, body=body)
-        
-        message = messaging.MulticastMessage(
-            notification=notification,
+    batches = [
+        fcm_tokens[i:i + FCM_MULTICAST_BATCH_SIZE]
+        for i in range(0, len(fcm_tokens), FCM_MULTICAST_BATCH_SIZE)
+    ]
+    
+    messaging = _messaging
+    messages = [
+        messaging.MulticastMessage(
+            notification=messaging.Notification(title=title, body=body),
             data=data or {},
-            tokens=fcm_tokens
+            tokens=batch
         )
-        
-        response = messaging.send_each_for_multicast(message)
-        
-        logger.info(
-            f"Multicast push: {response.success_count} success, "
-            f"{response.failure_count} failures"
-        )
-        
-        return {
-            'success_count': response.success_count,
-            'failure_count': response.failure_count
-        }
-        
+        for batch in batches
+    ]
+    
+    try:
+        responses = _run_on_push_loop(_send_multicast_batches(messages))
     except Exception as e:
-        logger.error(f"Failed to send multicast push: {e}")
-        return {'success_count': 0, 'failure_count': len(fcm_tokens)}
+        responses = [e] * len(batches)
+    
+    success_count = 0
+    failure_count = 0
+    for batch, response in zip(batches, responses):
+        if isinstance(response, Exception):
+            logger.error(f"Failed to send multicast push batch: {response}")
+            failure_count += len(batch)
+        else:
+            success_count += response.success_count
+            failure_count += response.failure_count
+    
+    logger.info(
+        f"Multicast push: {success_count} success, "
+        f"{failure_count} failures ({len(batches)} batches)"
+    )
+    
+    return {
+        'success_count': success_count,
+        'failure_count': failure_count
+    }
+
+
+def _load_email_template(template_name: str, extension: str):
+    try:
+        return get_template(f'emails/{template_name}.{extension}')
+    except TemplateDoesNotExist:
+        if extension == 'html':
+            raise
+        return None
+
+
+_load_cached_email_template = lru_cache(maxsize=None)(_load_email_template)
+
+
+def get_email_template(template_name: str, extension: str = 'html'):
+    """
+    Return the compiled template for emails/{template_name}.{extension}.
+    
+    Compiled templates are kept per process so repeated sends skip the
+    loader lookup and parsing. In DEBUG the cache is bypassed so template
+    edits show up without a restart.
+    
+    Returns None for a missing plain text ('txt') template.
+    """
+    if settings.DEBUG:
+        return _load_email_template(template_name, extension)
+    return _load_cached_email_template(template_name, extension)
+
+
+def build_email(
+    to_email: str,
+    subject: str,
+    template_name: str,
+    context: Dict[str, Any],
+    from_email: Optional[str] = None,
+    connection=None
+) -> EmailMultiAlternatives:
+    """
+    Render a template email into an EmailMultiAlternatives (not sent).
+    
+    Args:
+        to_email: Recipient email address
+        subject: Email subject
+        template_name: Template name (without extension, e.g., 'welcome')
+        context: Template context variables
+        from_email: Sender email (defaults to DEFAULT_FROM_EMAIL)
+        connection: Optional email backend connection to send through
+    
+    Returns:
+        EmailMultiAlternatives with plain text body and HTML alternative
+    """
+    # Render HTML template
+    html_content = get_email_template(template_name).render(context)
+    
+    # Plain text version: use the emails/<name>.txt companion when there is
+    # one, and only fall back to stripping tags from the HTML otherwise
+    text_template = get_email_template(template_name, 'txt')
+    if text_template is not None:
+        text_content = text_template.render(context)
+    else:
+        text_content = strip_tags(html_content)
+    
+    # Create email
+    email = EmailMultiAlternatives(
+        subject=subject,
+        body=text_content,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        to=[to_email],
+        connection=connection
+    )
+    email.attach_alternative(html_content, 'text/html')
+    return email
 
 
 def send_email(
@@ -181,7 +381,8 @@ def send_email(
     subject: str,
     template_name: str,
     context: Dict[str, Any],
-    from_email: Optional[str] = None
+    from_email: Optional[str] = None,
+    connection=None
 ) -> bool:
     """
     Send an HTML email using a template.
@@ -192,26 +393,16 @@ def send_email(
         template_name: Template name (without extension, e.g., 'welcome')
         context: Template context variables
         from_email: Sender email (defaults to DEFAULT_FROM_EMAIL)
+        connection: Optional open email connection to reuse (see send_email_batch)
     
     Returns:
         True if sent successfully, False otherwise
     """
     try:
-        # Render HTML template
-        html_template = f'emails/{template_name}.html'
-        html_content = render_to_string(html_template, context)
-        
-        # Create plain text version
-        text_content = strip_tags(html_content)
-        
-        # Create email
-        email = EmailMultiAlternatives(
-            subject=subject,
-            body=text_content,
-            from_email=from_email or settings.DEFAULT_FROM_EMAIL,
-            to=[to_email]
+        email = build_email(
+            to_email, subject, template_name, context,
+            from_email=from_email, connection=connection
         )
-        email.attach_alternative(html_content, 'text/html')
         
         # Send
         email.send(fail_silently=False)
@@ -223,11 +414,48 @@ def send_email(
         return False
 
 
+def send_email_batch(messages: List[Dict[str, Any]]) -> int:
+    """
+    Send several template emails over a single SMTP connection.
+    
+    Opening a connection (TCP + TLS + auth) costs far more than sending a
+    message, so batches should go through here rather than send_email().
+    
+    Args:
+        messages: List of dicts with send_email() keyword arguments
+            (to_email, subject, template_name, context, optional from_email)
+    
+    Returns:
+        Number of emails sent
+    """
+    if not messages:
+        return 0
+    
+    try:
+        with get_connection() as connection:
+            emails = []
+            for message in messages:
+                try:
+                    emails.append(build_email(connection=connection, **message))
+                except Exception as e:
+                    logger.error(f"Failed to render email to {message.get('to_email')}: {e}")
+            
+            sent = connection.send_messages(emails) or 0
+        
+        logger.info(f"Email batch sent: {sent}/{len(messages)}")
+        return sent
+        
+    except Exception as e:
+        logger.error(f"Failed to send email batch: {e}")
+        return 0
+
+
 def send_simple_email(
     to_email: str,
     subject: str,
     message: str,
-    from_email: Optional[str] = None
+    from_email: Optional[str] = None,
+    connection=None
 ) -> bool:
     """
     Send a simple text email without template.
@@ -237,6 +465,7 @@ def send_simple_email(
         subject: Email subject
         message: Plain text message
         from_email: Sender email
+        connection: Optional open email connection to reuse
     
     Returns:
         True if sent successfully
@@ -249,7 +478,8 @@ def send_simple_email(
             message=message,
             from_email=from_email or settings.DEFAULT_FROM_EMAIL,
             recipient_list=[to_email],
-            fail_silently=False
+            fail_silently=False,
+            connection=connection
         )
         logger.info(f"Simple email sent to {to_email}")
         return True
@@ -263,6 +493,47 @@ def send_simple_email(
 # HIGH-LEVEL NOTIFICATION FUNCTIONS
 # =============================================================================
 
+# How long a sent notification blocks an identical one (task retries,
+# signals firing twice for the same row)
+NOTIFICATION_DEDUP_TTL = 3600
+
+
+def idempotent(key_fn):
+    """
+    Skip a notification that was already sent for the same object.
+    
+    The first call claims the key with cache.add(); later calls with the
+    same key return False without sending. The claim is released when the
+    wrapped function raises or sends nothing, so a retry can try again.
+    
+    Args:
+        key_fn: Callable receiving the notify function's arguments and
+                returning a string identifying the notification
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            from django.core.cache import cache
+            
+            cache_key = f"notify:{func.__name__}:{key_fn(*args, **kwargs)}"
+            if not cache.add(cache_key, True, NOTIFICATION_DEDUP_TTL):
+                logger.info(f"Skipping duplicate notification: {cache_key}")
+                return False
+            
+            try:
+                sent = func(*args, **kwargs)
+            except Exception:
+                cache.delete(cache_key)
+                raise
+            
+            if not sent:
+                cache.delete(cache_key)
+            return sent
+        return wrapper
+    return decorator
+
+
+@idempotent(lambda project_update: f'update:{project_update.id}')
 def notify_project_update(project_update) -> bool:
     """
     Notify client about a project update.
@@ -276,13 +547,15 @@ def notify_project_update(project_update) -> bool:
     """
     project = project_update.project
     client = project.client
+    fcm_token = client.fcm_token
+    email = client.user.email
     
     success = False
     
     # Push notification
-    if client.fcm_token:
+    if fcm_token:
         push_sent = send_push_notification(
-            fcm_token=client.fcm_token,
+            fcm_token=fcm_token,
             title=f"Mise à jour: {project.project_name}",
             body=project_update.title,
             data={
@@ -294,9 +567,9 @@ def notify_project_update(project_update) -> bool:
         success = success or push_sent
     
     # Email notification
-    if client.user.email:
+    if email:
         email_sent = send_email(
-            to_email=client.user.email,
+            to_email=email,
             subject=f"Mise à jour de votre projet - {project.project_name}",
             template_name='project_update',
             context={
@@ -313,6 +586,7 @@ def notify_project_update(project_update) -> bool:
     return success
 
 
+@idempotent(lambda invoice: f'invoice:{invoice.id}')
 def notify_new_invoice(invoice) -> bool:
     """
     Notify client about a new invoice.
@@ -323,17 +597,27 @@ def notify_new_invoice(invoice) -> bool:
     Returns:
         True if notification was sent
     """
+    from django.db.models import prefetch_related_objects
+    
+    # Every total (subtotal, tax, TTC, net) iterates invoice.items; load the
+    # items once so neither the totals nor the template query them again
+    prefetch_related_objects([invoice], 'items')
+    
     project = invoice.project
     client = project.client
+    fcm_token = client.fcm_token
+    email = client.user.email
+    invoice_number = invoice.invoice_number
+    net_to_pay = invoice.net_to_pay
     
     success = False
     
     # Push notification
-    if client.fcm_token:
+    if fcm_token:
         push_sent = send_push_notification(
-            fcm_token=client.fcm_token,
+            fcm_token=fcm_token,
             title="Nouvelle facture",
-            body=f"Facture {invoice.invoice_number} - {invoice.net_to_pay:,.0f} FCFA",
+            body=f"Facture {invoice_number} - {net_to_pay:,.0f} FCFA",
             data={
                 'type': 'new_invoice',
                 'invoice_id': str(invoice.id),
@@ -343,23 +627,23 @@ def notify_new_invoice(invoice) -> bool:
         success = success or push_sent
     
     # Email notification
-    if client.user.email:
+    if email:
         email_sent = send_email(
-            to_email=client.user.email,
-            subject=f"Facture {invoice.invoice_number} - Belle House",
+            to_email=email,
+            subject=f"Facture {invoice_number} - Belle House",
             template_name='new_invoice',
             context={
                 'client_name': client.full_name,
-                'invoice_number': invoice.invoice_number,
+                'invoice_number': invoice_number,
                 'project_name': project.project_name,
                 'subject': invoice.subject,
                 'subtotal': invoice.subtotal,
                 'tax_amount': invoice.tax_amount,
                 'total_ttc': invoice.total_ttc,
                 'advance_payment': invoice.advance_payment,
-                'net_to_pay': invoice.net_to_pay,
+                'net_to_pay': net_to_pay,
                 'due_date': invoice.due_date,
-                'items': invoice.items.all()
+                'items': list(invoice.items.all())
             }
         )
         success = success or email_sent
@@ -378,16 +662,17 @@ def notify_welcome(client_profile, temporary_password: Optional[str] = None) ->
     Returns:
         True if sent successfully
     """
-    if not client_profile.user.email:
+    email = client_profile.user.email
+    if not email:
         return False
     
     return send_email(
-        to_email=client_profile.user.email,
+        to_email=email,
         subject="Bienvenue chez Belle House!",
         template_name='welcome',
         context={
             'client_name': client_profile.full_name,
-            'email': client_profile.user.email,
+            'email': email,
             'temporary_password': temporary_password,
             'app_url': getattr(settings, 'MOBILE_APP_URL', '#')
         }
@@ -0,0 +1,66 @@
+"""
+Pagination classes for Belle House Backend.
+"""
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    Keyset pagination on creation date, newest first.
+    
+    Each page seeks from the previous page's last created_at instead of
+    using OFFSET, and no COUNT(*) is run; responses carry opaque
+    next/previous cursor URLs but no total count.
+    """
+    ordering = '-created_at'
+    page_size = 25
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that trusts the PostgreSQL planner's row estimate on big lists.
+    
+    A bounded count (COUNT over at most estimate_threshold + 1 rows) comes
+    first, so every list below the threshold gets its exact count from a
+    single query, as with Paginator. Only past the threshold does EXPLAIN
+    on the page's own query supply the estimate, which honours filters
+    (including the soft-delete filter every manager adds); an unfiltered
+    pg_class.reltuples lookup would never apply here. Other databases use
+    the exact COUNT(*).
+    """
+    estimate_threshold = 10000
+    
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if connections[queryset.db].vendor != 'postgresql':
+            return super().count
+        
+        bounded = queryset.order_by()[:self.estimate_threshold + 1].count()
+        if bounded <= self.estimate_threshold:
+            return bounded
+        return max(self._planner_estimate(queryset), bounded)
+    
+    @staticmethod
+    def _planner_estimate(queryset):
+        """Rows the planner expects the queryset to return (no execution)."""
+        sql, params = queryset.query.sql_with_params()
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        return int(plan[0]['Plan']['Plan Rows'])
+
+
+class EstimatedCountPagination(PageNumberPagination):
+    """
+    Page-number pagination whose count is estimated on large lists.
+    
+    The count (and the last page number) may be off by the planner's
+    error once a list is past EstimatedCountPaginator.estimate_threshold
+    rows; the rows of each page are exact.
+    """
+    django_paginator_class = EstimatedCountPaginator
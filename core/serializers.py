@@ -5,10 +5,44 @@ Registration, Login, Password Reset endpoints.
 """
 
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
 from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
+from django.conf import settings
 from django.contrib.auth import authenticate
+from django.core.cache import cache
 from clients.models import ClientProfile
+from .tokens import CachedBlacklistRefreshToken
+
+
+# Seconds a "this email/username is taken" answer is reused by the
+# registration validators
+USER_EXISTS_CACHE_TIMEOUT = 30
+
+
+def user_exists(field, value):
+    """
+    Check whether a user with the given field value exists.
+    
+    Only positive answers are cached: accounts can be created outside the
+    registration endpoint (admin, client onboarding), so a cached "free"
+    answer could let a duplicate through.
+    
+    Args:
+        field: User field to match ('email' or 'username')
+        value: Value to look up
+    
+    Returns:
+        True if a matching user exists
+    """
+    cache_key = f"user:{field}_exists:{value}"
+    if cache.get(cache_key):
+        return True
+    
+    exists = User.objects.filter(**{field: value}).exists()
+    if exists:
+        cache.set(cache_key, True, USER_EXISTS_CACHE_TIMEOUT)
+    return exists
 
 
 class UserRegistrationSerializer(serializers.Serializer):
@@ -27,12 +61,12 @@ class UserRegistrationSerializer(serializers.Serializer):
     
     def validate_email(self, value):
         email = value.lower()
-        if User.objects.filter(email=email).exists():
+        if user_exists('email', email):
             raise serializers.ValidationError("Cet email est déjà utilisé.")
         return email
     
     def validate_username(self, value):
-        if User.objects.filter(username=value).exists():
+        if user_exists('username', value):
             raise serializers.ValidationError("Ce nom d'utilisateur est déjà utilisé.")
         return value
     
@@ -85,18 +119,12 @@ class LoginSerializer(serializers.Serializer):
                 "Veuillez fournir un nom d'utilisateur ou un email."
             )
         
-        # If email provided, find username
-        if email and not username:
-            try:
-                user = User.objects.get(email=email.lower())
-                username = user.username
-            except User.DoesNotExist:
-                raise serializers.ValidationError({
-                    'email': "Aucun compte trouvé avec cet email."
-                })
-        
-        # Authenticate
-        user = authenticate(username=username, password=password)
+        # The auth backend matches username or email in one query
+        user = authenticate(
+            request=self.context.get('request'),
+            username=username or email.lower(),
+            password=password
+        )
         
         if not user:
             raise serializers.ValidationError(
@@ -127,6 +155,44 @@ class UserProfileSerializer(serializers.ModelSerializer):
         ]
 
 
+# Seconds a serialized user profile is reused by the login response
+USER_PROFILE_CACHE_TIMEOUT = 300
+
+
+def profile_cache_key(user_id):
+    return f"user:profile:{user_id}"
+
+
+def serialized_profile(user, refresh=False):
+    """
+    UserProfileSerializer data for a user, cached between logins.
+    
+    The entry is dropped by core.signals whenever the user or their client
+    profile is saved. That delete only reaches other workers through a
+    shared cache, so without settings.SHARED_CACHE nothing is cached.
+    
+    Args:
+        user: User to serialize
+        refresh: Skip the lookup and store a fresh representation (used
+                 right after registration, when nothing is cached yet)
+    
+    Returns:
+        Dict of profile fields
+    """
+    if not settings.SHARED_CACHE:
+        return dict(UserProfileSerializer(user).data)
+    
+    cache_key = profile_cache_key(user.pk)
+    if not refresh:
+        data = cache.get(cache_key)
+        if data is not None:
+            return data
+    
+    data = dict(UserProfileSerializer(user).data)
+    cache.set(cache_key, data, USER_PROFILE_CACHE_TIMEOUT)
+    return data
+
+
 class ChangePasswordSerializer(serializers.Serializer):
     """Serializer for changing password."""
     
@@ -160,11 +226,9 @@ class PasswordResetRequestSerializer(serializers.Serializer):
     email = serializers.EmailField()
     
     def validate_email(self, value):
-        email = value.lower()
-        if not User.objects.filter(email=email).exists():
-            # Don't reveal if email exists or not (security)
-            pass
-        return email
+        # No account lookup here: the response must not depend on (or wait
+        # for) whether the email exists
+        return value.lower()
 
 
 class PasswordResetConfirmSerializer(serializers.Serializer):
@@ -180,3 +244,10 @@ class PasswordResetConfirmSerializer(serializers.Serializer):
                 'new_password_confirm': "Les mots de passe ne correspondent pas."
             })
         return attrs
+
+
+class CachedBlacklistTokenRefreshSerializer(TokenRefreshSerializer):
+    """Token refresh that checks and writes the cache-backed blacklist."""
+    
+    token_class = CachedBlacklistRefreshToken
+
@@ -0,0 +1,48 @@
+"""
+Django Signals for Core app.
+
+Keeps cached user data in step with the database, and defines
+soft_deleted for soft deletes that bypass Model.save().
+"""
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from .serializers import profile_cache_key
+from .utils import bump_list_version
+
+
+# Sent after a row is soft deleted with a queryset update() instead of
+# save(). Arguments: sender (model class), instance, user.
+soft_deleted = Signal()
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_profile(sender, instance, update_fields=None, **kwargs):
+    """Drop the cached profile when the user changes."""
+    # Login only touches last_login, which the profile doesn't show
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    cache.delete(profile_cache_key(instance.pk))
+
+
+@receiver([post_save, post_delete], sender='clients.ClientProfile')
+def invalidate_client_user_profile(sender, instance, **kwargs):
+    """The profile includes the client's phone and address."""
+    cache.delete(profile_cache_key(instance.user_id))
+
+
+@receiver(soft_deleted)
+def record_soft_delete(sender, instance, user=None, **kwargs):
+    """Do what post_save would have: drop cached lists and log the change."""
+    from auditlog.models import LogEntry
+    
+    bump_list_version(sender)
+    LogEntry.objects.log_create(
+        instance,
+        action=LogEntry.Action.UPDATE,
+        changes={'is_deleted': ['False', 'True']},
+        actor=user,
+    )
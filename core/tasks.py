@@ -0,0 +1,314 @@
+"""
+Celery tasks for Belle House Backend.
+
+Tasks take primary keys (not model instances) so they can be serialized
+to the broker; the objects are re-fetched in the worker.
+Use dispatch_on_commit() to enqueue from signals so the worker never runs
+before the row it needs is committed.
+"""
+
+import logging
+import threading
+import weakref
+
+from celery import shared_task
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+
+def dispatch_on_commit(task, *args, **kwargs):
+    """Enqueue a task once the current transaction commits."""
+    transaction.on_commit(lambda: task.delay(*args, **kwargs))
+
+
+# =============================================================================
+# IMAGE COMPRESSION
+# =============================================================================
+
+# Seconds during which later saves of the same upload don't queue it again
+IMAGE_COMPRESSION_DEDUP_TTL = 24 * 60 * 60
+
+# Jobs queued by the current thread's transaction (see _add_to_compression_batch)
+_compression_batch = threading.local()
+
+
+def queue_image_compression(instance, field_name, max_size=(1200, 1200)):
+    """
+    Schedule compression of an uploaded image once the save commits.
+    
+    Each upload (model, pk, field, file name) is queued once: saving the
+    row again before the worker has run, or after an image that can't be
+    compressed, doesn't enqueue another decode of the same file. The
+    upload only counts as queued once the broker accepted it, so a rolled
+    back save or a failed send doesn't suppress it.
+    
+    Args:
+        instance: Saved model instance holding the image
+        field_name: Name of the ImageField to compress
+        max_size: Tuple of (max_width, max_height)
+    """
+    image_field = getattr(instance, field_name)
+    
+    # Skip if empty or already compressed (filename contains '_compressed')
+    if not image_field or '_compressed' in image_field.name:
+        return
+    
+    dedup_key = f"compress:{instance._meta.label_lower}:{instance.pk}:{field_name}:{image_field.name}"
+    _add_to_compression_batch(
+        dedup_key, [instance._meta.label, instance.pk, field_name, list(max_size)]
+    )
+
+
+def _send_compression_batch(jobs):
+    """
+    Enqueue the jobs not already queued, then mark them queued.
+    
+    Args:
+        jobs: Dict of dedup key to job
+    """
+    from django.core.cache import cache
+    
+    queued = cache.get_many(list(jobs))
+    jobs = {key: job for key, job in jobs.items() if key not in queued}
+    if not jobs:
+        return
+    compress_images_task.delay(list(jobs.values()))
+    cache.set_many(dict.fromkeys(jobs, True), IMAGE_COMPRESSION_DEDUP_TTL)
+
+
+def _add_to_compression_batch(dedup_key, job):
+    """
+    Add a compression job to the batch of the current transaction.
+    
+    The first job of a transaction registers a single on_commit callback
+    that sends the whole batch to compress_images_task, so an admin form
+    saving fifty gallery images enqueues one task instead of fifty.
+    
+    The thread only keeps a weak reference to that callback. Committing
+    runs it (and it forgets itself); a rollback makes Django drop it, the
+    reference dies with it, and the next job starts a fresh batch instead
+    of joining one that will never be sent.
+    
+    Args:
+        dedup_key: Cache key marking the upload as queued
+        job: [model_label, pk, field_name, max_size]
+    """
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        # Autocommit: on_commit would run right away anyway
+        _send_compression_batch({dedup_key: job})
+        return
+    
+    current = getattr(_compression_batch, 'flush', None)
+    flush = current() if current is not None else None
+    if flush is None:
+        jobs = {}
+        
+        def flush():
+            _compression_batch.flush = None
+            _send_compression_batch(jobs)
+        
+        # No reference cycle, so a dropped callback is freed at once
+        flush.jobs = jobs
+        _compression_batch.flush = weakref.ref(flush)
+        transaction.on_commit(flush)
+    flush.jobs.setdefault(dedup_key, job)
+
+
+@shared_task
+def compress_images_task(jobs):
+    """
+    Compress a batch of uploads queued by one transaction.
+    
+    A job that fails is queued again on its own through
+    compress_image_task, which retries it, so one bad file doesn't hold
+    up or repeat the rest of the batch.
+    
+    Args:
+        jobs: List of [model_label, pk, field_name, max_size]
+    
+    Returns:
+        Number of images compressed
+    """
+    compressed = 0
+    for model_label, pk, field_name, max_size in jobs:
+        try:
+            compressed += compress_stored_image(model_label, pk, field_name, max_size)
+        except Exception:
+            logger.exception(f"Compressing {model_label} {pk} {field_name} failed, retrying alone.")
+            compress_image_task.delay(model_label, pk, field_name, max_size)
+    return compressed
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=30)
+def compress_image_task(self, model_label, pk, field_name, max_size):
+    """Compress a single stored image (see compress_stored_image), with retries."""
+    try:
+        return compress_stored_image(model_label, pk, field_name, max_size)
+    except Exception as e:
+        raise self.retry(exc=e)
+
+
+def compress_stored_image(model_label, pk, field_name, max_size):
+    """
+    Re-open an image from storage, compress it and point the row at the result.
+    
+    Besides the resized fallback that replaces the uploaded file, AVIF and
+    WebP copies are stored under a digest-prefixed path, and models with an
+    image_variants column get a manifest of all of them
+    ({"avif": name, "webp": name, "jpg": name}).
+    
+    Only the image columns are read, and they are written with a single
+    update() (no Model.save(), so no post_save receivers or slug logic run
+    again). The update only applies if the row still holds the original
+    file; if a new image was uploaded meanwhile, the compressed copies of
+    the old one are discarded.
+    
+    Results are remembered by content digest and target size
+    (CompressedImage), so the same bytes are only ever compressed once.
+    
+    Returns:
+        True if the row now points at a compressed image
+    """
+    import os
+    from django.apps import apps
+    from core.models import CompressedImage
+    from core.utils import bump_list_version, compress_image_variants
+    
+    model_class = apps.get_model(model_label)
+    manager = model_class._default_manager
+    try:
+        instance = manager.only(field_name).get(pk=pk)
+    except model_class.DoesNotExist:
+        logger.warning(f"{model_label} {pk} not found, skipping image compression.")
+        return False
+    
+    field = model_class._meta.get_field(field_name)
+    image_field = getattr(instance, field_name)
+    if not image_field or '_compressed' in image_field.name:
+        return False
+    original_name = image_field.name
+    storage = field.storage
+    max_width, max_height = max_size
+    
+    digest = _image_digest(image_field)
+    cached = CompressedImage.objects.filter(
+        src_digest=digest, max_width=max_width, max_height=max_height
+    ).values('dst_name', 'variants').first()
+    reused = bool(cached) and storage.exists(cached['dst_name'])
+    
+    if reused:
+        compressed_name = cached['dst_name']
+        variants = cached['variants']
+    else:
+        result = compress_image_variants(
+            image_field, max_size=(max_width, max_height)
+        )
+        if not result:
+            return False
+        compressed, encoded = result
+        # Straight to storage: the instance is discarded, so FieldFile.save()
+        # re-assigning it through the descriptor would be wasted work
+        compressed_name = storage.save(
+            field.generate_filename(instance, compressed.name),
+            compressed, max_length=field.max_length
+        )
+        
+        # Variants live next to the upload, under the source digest
+        prefix = os.path.join(
+            os.path.dirname(original_name), digest[:2],
+            f"{digest}_{max_width}x{max_height}"
+        )
+        variants = {
+            ext: storage.save(f"{prefix}.{ext}", variant_file)
+            for ext, variant_file in encoded.items()
+        }
+        variants[os.path.splitext(compressed_name)[1].lstrip('.')] = compressed_name
+        CompressedImage.objects.update_or_create(
+            src_digest=digest, max_width=max_width, max_height=max_height,
+            defaults={'dst_name': compressed_name, 'variants': variants}
+        )
+    
+    changes = {field_name: compressed_name}
+    if _has_image_variants(model_class):
+        changes['image_variants'] = variants
+    updated = manager.filter(pk=pk, **{field_name: original_name}).update(**changes)
+    if not updated:
+        # A shared, reused file may still be referenced elsewhere
+        if not reused:
+            for name in {compressed_name, *variants.values()}:
+                storage.delete(name)
+            CompressedImage.objects.filter(dst_name=compressed_name).delete()
+        return False
+    # update() sends no post_save; cached lists still point at the original
+    bump_list_version(model_class)
+    return True
+
+
+def _has_image_variants(model_class):
+    """Whether the model stores a variant manifest (image_variants column)."""
+    from django.core.exceptions import FieldDoesNotExist
+    
+    try:
+        model_class._meta.get_field('image_variants')
+    except FieldDoesNotExist:
+        return False
+    return True
+
+
+def _image_digest(image_field):
+    """BLAKE2b digest of a stored file, read in chunks and rewound after."""
+    import hashlib
+    
+    digest = hashlib.blake2b(digest_size=16)
+    image_field.open('rb')
+    for chunk in image_field.chunks(chunk_size=64 * 1024):
+        digest.update(chunk)
+    image_field.seek(0)
+    return digest.hexdigest()
+
+
+# =============================================================================
+# NOTIFICATIONS
+# =============================================================================
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def notify_project_update_task(self, project_update_id):
+    """Send push + email for a ProjectUpdate."""
+    from clients.models import ProjectUpdate
+    from core.notifications import notify_project_update
+    
+    try:
+        project_update = ProjectUpdate.objects.select_related(
+            'project__client__user'
+        ).get(pk=project_update_id)
+    except ProjectUpdate.DoesNotExist:
+        logger.warning(f"Project update {project_update_id} not found, skipping notification.")
+        return False
+    
+    # The senders log and swallow SMTP/FCM errors; nothing sent means retry
+    if not notify_project_update(project_update):
+        raise self.retry()
+    return True
+
+
+@shared_task(bind=True, max_retries=3, default_retry_delay=60)
+def notify_new_invoice_task(self, invoice_id):
+    """Send push + email for a new Invoice."""
+    from billing.models import Invoice
+    from core.notifications import notify_new_invoice
+    
+    try:
+        invoice = Invoice.objects.select_related(
+            'project__client__user'
+        ).prefetch_related('items').get(pk=invoice_id)
+    except Invoice.DoesNotExist:
+        logger.warning(f"Invoice {invoice_id} not found, skipping notification.")
+        return False
+    
+    # The senders log and swallow SMTP/FCM errors; nothing sent means retry
+    if not notify_new_invoice(invoice):
+        raise self.retry()
+    return True
@@ -0,0 +1,86 @@
+"""
+JWT helpers for Belle House Backend.
+"""
+
+import time
+
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+class SignedOnceRefreshToken(RefreshToken):
+    """
+    RefreshToken that signs its payload only once.
+    
+    With the blacklist app installed, for_user() already encodes the token
+    to store it as an OutstandingToken; the response then needs the same
+    string again. The encoded value is kept until a claim is changed.
+    """
+    
+    _encoded = None
+    
+    def __setitem__(self, key, value):
+        self._encoded = None
+        super().__setitem__(key, value)
+    
+    def __str__(self):
+        if self._encoded is None:
+            self._encoded = super().__str__()
+        return self._encoded
+
+
+class CachedBlacklistRefreshToken(RefreshToken):
+    """
+    RefreshToken whose blacklist checks read through the cache.
+    
+    The BlacklistedToken table stays the source of truth: blacklist()
+    writes the row as usual and also caches the jti until the token
+    expires. check_blacklist() answers from the cache when it can and
+    otherwise asks the database, caching a blacklisted result, so a
+    revoked token that keeps being replayed costs one cache read.
+    """
+    
+    @staticmethod
+    def blacklist_cache_key(jti):
+        return f"jwt:blacklist:{jti}"
+    
+    def _cache_blacklisted(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        timeout = max(int(self.payload['exp'] - time.time()), 1)
+        cache.set(self.blacklist_cache_key(jti), True, timeout)
+    
+    def check_blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        if cache.get(self.blacklist_cache_key(jti)):
+            raise TokenError(_("Token is blacklisted"))
+        try:
+            super().check_blacklist()
+        except TokenError:
+            self._cache_blacklisted()
+            raise
+    
+    def blacklist(self):
+        result = super().blacklist()
+        self._cache_blacklisted()
+        return result
+
+
+def get_tokens_for_user(user):
+    """
+    Issue a refresh/access token pair for a user.
+    
+    Args:
+        user: User to issue tokens for
+    
+    Returns:
+        Dict with 'refresh' and 'access' token strings
+    """
+    refresh = SignedOnceRefreshToken.for_user(user)
+    
+    return {
+        'refresh': str(refresh),
+        'access': str(refresh.access_token),
+    }
@@ -4,10 +4,27 @@ Utility functions for Belle House Backend.
 This module contains reusable helper functions used across the application.
 """
 
+import logging
 import os
 from io import BytesIO
-from PIL import Image
-from django.core.files.base import ContentFile
+from PIL import Image, features
+from django.core.files.base import File
+
+try:
+    import pyvips
+except (ImportError, OSError):
+    # libvips is optional; images are then compressed with Pillow
+    pyvips = None
+
+logger = logging.getLogger(__name__)
+
+
+# Modern formats encoded next to the fallback, smallest first:
+# (Pillow format, file extension, encoder options)
+IMAGE_VARIANT_FORMATS = (
+    ('AVIF', 'avif', {'quality': 50}),
+    ('WEBP', 'webp', {'quality': 70, 'method': 6}),
+)
 
 
 def compress_image(image_field, max_size=(1200, 1200), quality=85):
@@ -20,11 +37,45 @@ def compress_image(image_field, max_size=(1200, 1200), quality=85):
         quality: JPEG quality (1-100)
     
     Returns:
-        ContentFile with compressed image or None if no compression needed
+        File wrapping the compressed image or None if no compression needed
+    """
+    result = compress_image_variants(image_field, max_size, quality, formats=())
+    return result[0] if result else None
+
+
+def compress_image_variants(image_field, max_size=(1200, 1200), quality=85,
+                            formats=IMAGE_VARIANT_FORMATS):
+    """
+    Resize an image once and encode it as a fallback plus modern variants.
+    
+    The fallback keeps the behaviour of compress_image() (PNG/GIF stay
+    as-is for transparency, everything else becomes JPEG). Each variant
+    format the installed encoder can write is encoded from the same
+    resized pixels; unsupported ones are skipped.
+    
+    libvips (pyvips) is used when installed: it decodes with shrink-on-load
+    and resizes with vectorised kernels, several times faster than
+    Pillow. Pillow handles everything else (no libvips, GIF sources, or an
+    image libvips fails on).
+    
+    Args:
+        image_field: Django ImageField instance
+        max_size: Tuple of (max_width, max_height)
+        quality: JPEG quality (1-100) of the fallback
+        formats: Variant formats, as in IMAGE_VARIANT_FORMATS
+    
+    Returns:
+        (fallback File, {extension: File}) or None if compression failed
     """
     if not image_field:
         return None
     
+    if pyvips is not None:
+        result = _compress_with_vips(image_field, max_size, quality, formats)
+        if result is not None:
+            return result
+    
+    img = None
     try:
         # Open the image
         img = Image.open(image_field)
@@ -34,11 +85,28 @@ def compress_image(image_field, max_size=(1200, 1200), quality=85):
         
         # Convert RGBA to RGB if necessary (for JPEG)
         if img.mode in ('RGBA', 'P') and original_format == 'JPEG':
-            img = img.convert('RGB')
+            img = _replace_image(img, img.convert('RGB'))
         
         # Check if resize is needed
         if img.width > max_size[0] or img.height > max_size[1]:
-            img.thumbnail(max_size, Image.Resampling.LANCZOS)
+            # Bilinear is visually equivalent to Lanczos on large reductions
+            # and much cheaper
+            scale = max(img.width / max_size[0], img.height / max_size[1])
+            if scale > 4:
+                resample = Image.Resampling.BILINEAR
+            else:
+                resample = Image.Resampling.LANCZOS
+            img.thumbnail(max_size, resample)
+        
+        name = os.path.splitext(os.path.basename(image_field.name))[0]
+        
+        # Variants first, while the pixels still carry any alpha channel
+        variants = {}
+        for save_format, ext, options in formats:
+            if not features.check(ext):
+                continue
+            variant_buffer = _encode_variant(img, save_format, options)
+            variants[ext] = File(variant_buffer, name=f"{name}_compressed.{ext}")
         
         # Save to buffer
         buffer = BytesIO()
@@ -55,22 +123,113 @@ def compress_image(image_field, max_size=(1200, 1200), quality=85):
             # Convert everything else to JPEG
             save_format = 'JPEG'
             if img.mode != 'RGB':
-                img = img.convert('RGB')
-            img.save(buffer, format='JPEG', quality=quality, optimize=True)
+                img = _replace_image(img, img.convert('RGB'))
+            # Single-pass progressive encode with 4:2:0 chroma subsampling;
+            # optimize=True would run a second Huffman pass for little gain
+            img.save(
+                buffer, format='JPEG', quality=quality,
+                optimize=False, progressive=True, subsampling=2
+            )
         
-        buffer.seek(0)
+        # Release the decoded pixels before handing the bytes to storage
+        img.close()
+        img = None
         
         # Generate new filename
-        name = os.path.splitext(os.path.basename(image_field.name))[0]
         ext = 'jpg' if save_format == 'JPEG' else save_format.lower()
         new_name = f"{name}_compressed.{ext}"
         
-        return ContentFile(buffer.read(), name=new_name)
+        # Wrap the buffer itself so storage streams it without another copy
+        buffer.seek(0)
+        return File(buffer, name=new_name), variants
     
     except Exception as e:
         # Log error but don't crash
-        print(f"Image compression error: {e}")
+        logger.exception(f"Image compression error: {e}")
+        return None
+    finally:
+        if img is not None:
+            img.close()
+
+
+def _compress_with_vips(image_field, max_size, quality, formats):
+    """
+    libvips version of compress_image_variants().
+    
+    Returns:
+        Same as compress_image_variants(), or None to fall back to Pillow
+    """
+    try:
+        image_field.seek(0)
+        img = pyvips.Image.thumbnail_buffer(
+            image_field.read(), max_size[0], height=max_size[1], size='down'
+        )
+        loader = img.get('vips-loader')
+        if loader.startswith('gif'):
+            return None
+        
+        name = os.path.splitext(os.path.basename(image_field.name))[0]
+        
+        variants = {}
+        for _, ext, options in formats:
+            data = _vips_variant(img, ext, options)
+            if data is not None:
+                variants[ext] = File(BytesIO(data), name=f"{name}_compressed.{ext}")
+        
+        if loader.startswith('png'):
+            # Keep PNG format for transparency
+            ext = 'png'
+            data = img.pngsave_buffer(compression=9, strip=True)
+        else:
+            ext = 'jpg'
+            if img.hasalpha():
+                img = img.flatten()
+            # Same encode as the Pillow path: progressive, 4:2:0, one pass
+            data = img.jpegsave_buffer(
+                Q=quality, interlace=True, optimize_coding=False, strip=True
+            )
+        return File(BytesIO(data), name=f"{name}_compressed.{ext}"), variants
+    
+    except pyvips.Error as e:
+        logger.warning(f"Image compression error (libvips, retrying with Pillow): {e}")
         return None
+    finally:
+        image_field.seek(0)
+
+
+def _vips_variant(img, ext, options):
+    """Encode a variant with libvips, or None if this build can't write it."""
+    try:
+        if ext == 'avif':
+            return img.heifsave_buffer(
+                Q=options['quality'], compression='av1', strip=True
+            )
+        if ext == 'webp':
+            return img.webpsave_buffer(
+                Q=options['quality'], effort=options.get('method', 4), strip=True
+            )
+    except pyvips.Error:
+        pass
+    return None
+
+
+def _encode_variant(img, save_format, options):
+    """Encode a PIL image into a rewound buffer, converting modes it can't take."""
+    buffer = BytesIO()
+    if img.mode in ('RGB', 'RGBA'):
+        img.save(buffer, format=save_format, **options)
+    else:
+        has_alpha = 'A' in img.mode or 'transparency' in img.info
+        with img.convert('RGBA' if has_alpha else 'RGB') as converted:
+            converted.save(buffer, format=save_format, **options)
+    buffer.seek(0)
+    return buffer
+
+
+def _replace_image(old, new):
+    """Close a PIL image superseded by a converted copy and return the copy."""
+    old.close()
+    return new
 
 
 def format_currency(amount, currency='FCFA'):
@@ -86,17 +245,114 @@ def format_currency(amount, currency='FCFA'):
     """
     if amount is None:
         return f"0 {currency}"
-    return f"{amount:,.0f} {currency}"
+    # round() gives the same half-even result as ',.0f' but as an int,
+    # which formats without going through the Decimal/float path
+    return f"{round(amount):,} {currency}"
 
 
-def generate_reference(prefix, model_class, field_name='reference'):
+def reference_sequence(prefix, model_class, field_name):
+    """
+    Name of the counter behind one model field's references.
+    
+    Each (prefix, model, field) gets its own sequence, so two models using
+    the same prefix never draw from each other's numbers.
+    """
+    return f"{prefix}:{model_class._meta.label_lower}.{field_name}"
+
+
+def next_reference_number(sequence, year, seed=None):
+    """
+    Atomically increment and return the counter for a sequence and year.
+    
+    Args:
+        sequence: Counter name, as built by reference_sequence()
+        year: Year the counter belongs to
+        seed: Optional callable returning the last number already in use,
+              called only when the year's counter is first created
+    
+    Returns:
+        The next number in the sequence (1 for a fresh counter)
+    
+    Where the database supports UPDATE ... RETURNING, an existing counter
+    is incremented and read in that one statement. Unlike a database
+    sequence, the increment is transactional: call this inside the
+    transaction that saves the numbered row (as Invoice.save() does) and
+    a failed save gives its number back, so numbering stays gapless.
+    """
+    from django.db import connection, transaction
+    from core.models import ReferenceCounter
+    
+    if _supports_update_returning(connection):
+        table = connection.ops.quote_name(ReferenceCounter._meta.db_table)
+        sql = (
+            f"UPDATE {table} SET last_number = last_number + 1 "
+            f"WHERE prefix = %s AND year = %s RETURNING last_number"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [sequence, year])
+            row = cursor.fetchone()
+        if row is not None:
+            return row[0]
+    
+    with transaction.atomic():
+        counters = ReferenceCounter.objects.select_for_update()
+        try:
+            counter = counters.get(prefix=sequence, year=year)
+        except ReferenceCounter.DoesNotExist:
+            ReferenceCounter.objects.get_or_create(
+                prefix=sequence,
+                year=year,
+                defaults={'last_number': seed() if seed else 0}
+            )
+            counter = counters.get(prefix=sequence, year=year)
+        
+        counter.last_number += 1
+        counter.save(update_fields=['last_number'])
+    
+    return counter.last_number
+
+
+def _supports_update_returning(connection):
+    """PostgreSQL, and SQLite 3.35+ (which is also when INSERT gained RETURNING)."""
+    if connection.vendor == 'postgresql':
+        return True
+    return connection.vendor == 'sqlite' and connection.features.can_return_columns_from_insert
+
+
+def last_reference_number(queryset, field_name, full_prefix):
+    """
+    Highest numeric suffix among existing references starting with full_prefix.
+    
+    Used to seed a new ReferenceCounter from rows created before it existed.
+    """
+    last_num = 0
+    references = queryset.filter(
+        **{f"{field_name}__startswith": full_prefix}
+    ).values_list(field_name, flat=True)
+    
+    for reference in references.iterator():
+        try:
+            last_num = max(last_num, int(reference.split('/')[-1]))
+        except (ValueError, IndexError):
+            continue
+    
+    return last_num
+
+
+def generate_reference(prefix, model_class, field_name='reference', digits=3):
     """
     Generate a unique reference number.
     
+    The number comes from the model field's own counter, seeded from the
+    references already stored (soft-deleted rows included). Call it in
+    the transaction that saves the row so a failed save gives the number
+    back.
+    
     Args:
         prefix: String prefix (e.g., 'BH', 'INV')
         model_class: Django model class to check for existing references
         field_name: Name of the reference field
+        digits: Minimum number of digits, zero-padded
     
     Returns:
         String like "BH/2025/001"
@@ -106,17 +362,90 @@ def generate_reference(prefix, model_class, field_name='reference'):
     current_year = timezone.now().year
     full_prefix = f"{prefix}/{current_year}/"
     
-    # Find last reference with this prefix
-    filter_kwargs = {f"{field_name}__startswith": full_prefix}
-    last_obj = model_class.objects.filter(**filter_kwargs).order_by(f'-{field_name}').first()
+    new_num = next_reference_number(
+        reference_sequence(prefix, model_class, field_name),
+        current_year,
+        seed=lambda: last_reference_number(
+            model_class._base_manager.all(), field_name, full_prefix
+        )
+    )
     
-    if last_obj:
-        try:
-            last_num = int(getattr(last_obj, field_name).split('/')[-1])
-            new_num = last_num + 1
-        except (ValueError, IndexError):
-            new_num = 1
+    return f"{full_prefix}{new_num:0{digits}d}"
+
+
+def unique_slug(queryset, base, field_name='slug', taken=None):
+    """
+    First free slug among base, base-1, base-2, ...
+    
+    Args:
+        queryset: Rows whose slugs are taken (exclude the row being saved)
+        base: Slug to start from
+        field_name: Name of the slug field
+        taken: Optional set of slugs already in use. When given, no query
+               is made and the chosen slug is added to it, so bulk imports
+               can load the slugs once and reuse the set.
+    
+    Returns:
+        Unused slug string
+    """
+    if taken is None:
+        # One query for every candidate: all share the base as prefix
+        in_use = set(queryset.filter(
+            **{f"{field_name}__startswith": base}
+        ).values_list(field_name, flat=True))
     else:
-        new_num = 1
+        in_use = taken
+    
+    slug = base
+    counter = 1
+    while slug in in_use:
+        slug = f"{base}-{counter}"
+        counter += 1
+    
+    if taken is not None:
+        taken.add(slug)
+    return slug
+
+
+def _list_version_key(model):
+    return f"listver:{model._meta.label_lower}"
+
+
+def get_list_version(model):
+    """
+    Current version token for a model's list responses.
     
-    return f"{full_prefix}{new_num:03d}"
+    The token only changes when bump_list_version() is called, so it can
+    be used to build ETags without querying the table.
+    
+    Args:
+        model: Django model class
+    
+    Returns:
+        Opaque version string
+    """
+    import uuid
+    from django.core.cache import cache
+    
+    key = _list_version_key(model)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, None)
+        version = cache.get(key)
+    return version
+
+
+def bump_list_version(*models):
+    """
+    Invalidate cached list versions after rows of these models changed.
+    
+    Call this after queryset.update(), which doesn't send save signals.
+    """
+    import uuid
+    from django.core.cache import cache
+    
+    cache.set_many(
+        {_list_version_key(model): uuid.uuid4().hex for model in models},
+        None
+    )
+
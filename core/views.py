@@ -8,12 +8,21 @@ from rest_framework import generics, status, serializers as drf_serializers
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth.models import User
 from drf_spectacular.utils import extend_schema, OpenApiResponse, inline_serializer
 from .serializers import (
     UserRegistrationSerializer, LoginSerializer, UserProfileSerializer,
-    ChangePasswordSerializer, PasswordResetRequestSerializer, PasswordResetConfirmSerializer
+    ChangePasswordSerializer, PasswordResetRequestSerializer, PasswordResetConfirmSerializer,
+    serialized_profile
+)
+from .tokens import CachedBlacklistRefreshToken, get_tokens_for_user
+
+
+# Response shapes for the API schema, built once and shared by name so
+# the generated document has a single component per shape
+MESSAGE_RESPONSE = inline_serializer(
+    name='MessageResponse',
+    fields={'message': drf_serializers.CharField()}
 )
 
 
@@ -34,16 +43,10 @@ class RegisterView(generics.CreateAPIView):
         serializer.is_valid(raise_exception=True)
         user = serializer.save()
         
-        # Generate tokens
-        refresh = RefreshToken.for_user(user)
-        
         return Response({
             'message': 'Compte créé avec succès.',
-            'user': UserProfileSerializer(user).data,
-            'tokens': {
-                'refresh': str(refresh),
-                'access': str(refresh.access_token),
-            }
+            'user': serialized_profile(user, refresh=True),
+            'tokens': get_tokens_for_user(user)
         }, status=status.HTTP_201_CREATED)
 
 
@@ -86,16 +89,10 @@ class LoginView(APIView):
         
         user = serializer.validated_data['user']
         
-        # Generate tokens
-        refresh = RefreshToken.for_user(user)
-        
         return Response({
             'message': 'Connexion réussie.',
-            'user': UserProfileSerializer(user).data,
-            'tokens': {
-                'refresh': str(refresh),
-                'access': str(refresh.access_token),
-            }
+            'user': serialized_profile(user),
+            'tokens': get_tokens_for_user(user)
         })
 
 
@@ -126,7 +123,7 @@ class ChangePasswordView(APIView):
     
     @extend_schema(
         request=ChangePasswordSerializer,
-        responses={200: inline_serializer(name='ChangePasswordResponse', fields={'message': drf_serializers.CharField()})},
+        responses={200: MESSAGE_RESPONSE},
         summary="Change password",
     )
     def post(self, request):
@@ -154,7 +151,7 @@ class PasswordResetRequestView(APIView):
     
     @extend_schema(
         request=PasswordResetRequestSerializer,
-        responses={200: inline_serializer(name='PasswordResetRequestResponse', fields={'message': drf_serializers.CharField()})},
+        responses={200: MESSAGE_RESPONSE},
         summary="Request password reset",
     )
     def post(self, request):
@@ -184,7 +181,7 @@ class PasswordResetConfirmView(APIView):
     
     @extend_schema(
         request=PasswordResetConfirmSerializer,
-        responses={200: inline_serializer(name='PasswordResetConfirmResponse', fields={'message': drf_serializers.CharField()})},
+        responses={200: MESSAGE_RESPONSE},
         summary="Confirm password reset",
     )
     def post(self, request):
@@ -210,14 +207,14 @@ class LogoutView(APIView):
     
     @extend_schema(
         request=inline_serializer(name='LogoutRequest', fields={'refresh': drf_serializers.CharField(help_text="Refresh token to blacklist")}),
-        responses={200: inline_serializer(name='LogoutResponse', fields={'message': drf_serializers.CharField()})},
+        responses={200: MESSAGE_RESPONSE},
         summary="Logout and blacklist token",
     )
     def post(self, request):
         try:
             refresh_token = request.data.get('refresh')
             if refresh_token:
-                token = RefreshToken(refresh_token)
+                token = CachedBlacklistRefreshToken(refresh_token)
                 token.blacklist()
             return Response({
                 'message': 'Déconnexion réussie.'
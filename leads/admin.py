@@ -3,17 +3,20 @@ Admin configuration for Lead models.
 """
 
 from django.contrib import admin
+from core.admin import SoftDeleteAdminMixin
+from core.utils import bump_list_version
 from .models import ConstructionLead, ContactInquiry
 
 
 @admin.register(ConstructionLead)
-class ConstructionLeadAdmin(admin.ModelAdmin):
+class ConstructionLeadAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Admin for Construction Leads."""
     
     list_display = ['name', 'phone', 'email', 'status', 'has_land', 'interested_in', 'created_at', 'is_deleted']
     list_filter = ['status', 'has_land', 'is_deleted', 'created_at']
     search_fields = ['name', 'email', 'phone', 'location_of_land', 'message']
     list_editable = ['status']
+    autocomplete_fields = ['interested_in']
     date_hierarchy = 'created_at'
     readonly_fields = ['created_at', 'updated_at']
     
@@ -33,26 +36,26 @@ class ConstructionLeadAdmin(admin.ModelAdmin):
         }),
     )
     
-    def get_queryset(self, request):
-        return ConstructionLead.all_objects.all()
-    
     actions = ['mark_as_contacted', 'mark_as_converted', 'mark_as_lost']
     
     @admin.action(description="Marquer comme contacté")
     def mark_as_contacted(self, request, queryset):
         queryset.update(status=ConstructionLead.Status.CONTACTED)
+        bump_list_version(ConstructionLead)
     
     @admin.action(description="Marquer comme converti")
     def mark_as_converted(self, request, queryset):
         queryset.update(status=ConstructionLead.Status.CONVERTED)
+        bump_list_version(ConstructionLead)
     
     @admin.action(description="Marquer comme perdu")
     def mark_as_lost(self, request, queryset):
         queryset.update(status=ConstructionLead.Status.LOST)
+        bump_list_version(ConstructionLead)
 
 
 @admin.register(ContactInquiry)
-class ContactInquiryAdmin(admin.ModelAdmin):
+class ContactInquiryAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Admin for Contact Inquiries."""
     
     list_display = ['subject', 'name', 'email', 'is_read', 'created_at', 'is_deleted']
@@ -78,15 +81,14 @@ class ContactInquiryAdmin(admin.ModelAdmin):
         }),
     )
     
-    def get_queryset(self, request):
-        return ContactInquiry.all_objects.all()
-    
     actions = ['mark_as_read', 'mark_as_unread']
     
     @admin.action(description="Marquer comme lu")
     def mark_as_read(self, request, queryset):
         queryset.update(is_read=True)
+        bump_list_version(ContactInquiry)
     
     @admin.action(description="Marquer comme non lu")
     def mark_as_unread(self, request, queryset):
         queryset.update(is_read=False)
+        bump_list_version(ContactInquiry)
@@ -4,12 +4,14 @@ Admin API Views for Leads models.
 Staff-only CRUD endpoints for leads and inquiries.
 """
 
-from rest_framework import viewsets, filters
+from rest_framework import mixins, viewsets, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils import timezone
+from core.mixins import ConditionalListMixin
+from core.pagination import CreatedAtCursorPagination
 from .models import ConstructionLead, ContactInquiry
 from .serializers import (
     ConstructionLeadListSerializer, ConstructionLeadDetailSerializer, ConstructionLeadUpdateSerializer,
@@ -17,11 +19,18 @@ from .serializers import (
 )
 
 
-class AdminConstructionLeadViewSet(viewsets.ModelViewSet):
+class AdminConstructionLeadViewSet(
+    ConditionalListMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.UpdateModelMixin,
+    mixins.DestroyModelMixin,
+    viewsets.GenericViewSet
+):
     """
     Admin lead management.
     
-    list: GET /api/admin/leads/
+    list: GET /api/admin/leads/ (ETag / If-None-Match)
     retrieve: GET /api/admin/leads/{id}/
     update: PUT/PATCH /api/admin/leads/{id}/
     destroy: DELETE /api/admin/leads/{id}/ (soft delete)
@@ -32,10 +41,24 @@ class AdminConstructionLeadViewSet(viewsets.ModelViewSet):
     search_fields = ['name', 'email', 'phone', 'location_of_land', 'message']
     ordering_fields = ['created_at', 'status', 'name']
     ordering = ['-created_at']
-    http_method_names = ['get', 'put', 'patch', 'delete', 'head', 'options']  # No POST - leads come from public form
+    pagination_class = CreatedAtCursorPagination
+    # No create - leads come from public form; POST is only for the status actions
+    http_method_names = ['get', 'post', 'put', 'patch', 'delete', 'head', 'options']
+    
+    # Columns the list/detail serializers read; the audit and soft-delete
+    # columns are never shown, so read actions skip them
+    read_fields = [
+        'id', 'name', 'phone', 'email', 'has_land', 'location_of_land',
+        'interested_in', 'interested_in__title', 'message',
+        'status', 'notes', 'created_at', 'updated_at'
+    ]
     
     def get_queryset(self):
-        return ConstructionLead.objects.all()
+        # interested_in_title is read for every row
+        queryset = ConstructionLead.objects.select_related('interested_in')
+        if self.action in ['list', 'retrieve']:
+            queryset = queryset.only(*self.read_fields)
+        return queryset
     
     def get_serializer_class(self):
         if self.action in ['update', 'partial_update']:
@@ -51,6 +74,17 @@ class AdminConstructionLeadViewSet(viewsets.ModelViewSet):
         instance.deleted_by = self.request.user
         instance.save()
     
+    def _set_status(self, lead, status):
+        """
+        Save a lead's new status, writing only the changed columns.
+        
+        Going through save() keeps the auditlog entry and the post_save
+        receivers (list version, automatic conversion to a client).
+        """
+        lead.status = status
+        lead.updated_by = self.request.user
+        lead.save(update_fields=['status', 'updated_by', 'updated_at'])
+    
     @action(detail=True, methods=['post'])
     def contact(self, request, pk=None):
         """
@@ -58,10 +92,7 @@ class AdminConstructionLeadViewSet(viewsets.ModelViewSet):
         
         POST /api/admin/leads/{id}/contact/
         """
-        lead = self.get_object()
-        lead.status = ConstructionLead.StatusChoices.CONTACTED
-        lead.updated_by = request.user
-        lead.save()
+        self._set_status(self.get_object(), ConstructionLead.Status.CONTACTED)
         return Response({'message': 'Lead marqué comme contacté.'})
     
     @action(detail=True, methods=['post'])
@@ -72,9 +103,8 @@ class AdminConstructionLeadViewSet(viewsets.ModelViewSet):
         POST /api/admin/leads/{id}/convert/
         """
         lead = self.get_object()
-        lead.status = ConstructionLead.StatusChoices.CONVERTED
-        lead.updated_by = request.user
-        lead.save()
+        if lead.status != ConstructionLead.Status.CONVERTED:
+            self._set_status(lead, ConstructionLead.Status.CONVERTED)
         return Response({'message': 'Lead marqué comme converti.'})
     
     @action(detail=True, methods=['post'])
@@ -84,18 +114,22 @@ class AdminConstructionLeadViewSet(viewsets.ModelViewSet):
         
         POST /api/admin/leads/{id}/mark_lost/
         """
-        lead = self.get_object()
-        lead.status = ConstructionLead.StatusChoices.LOST
-        lead.updated_by = request.user
-        lead.save()
+        self._set_status(self.get_object(), ConstructionLead.Status.LOST)
         return Response({'message': 'Lead marqué comme perdu.'})
 
 
-class AdminContactInquiryViewSet(viewsets.ModelViewSet):
+class AdminContactInquiryViewSet(
+    ConditionalListMixin,
+    mixins.ListModelMixin,
+    mixins.RetrieveModelMixin,
+    mixins.UpdateModelMixin,
+    mixins.DestroyModelMixin,
+    viewsets.GenericViewSet
+):
     """
     Admin contact inquiry management.
     
-    list: GET /api/admin/inquiries/
+    list: GET /api/admin/inquiries/ (ETag / If-None-Match)
     retrieve: GET /api/admin/inquiries/{id}/
     destroy: DELETE /api/admin/inquiries/{id}/ (soft delete)
     """
@@ -105,7 +139,9 @@ class AdminContactInquiryViewSet(viewsets.ModelViewSet):
     search_fields = ['full_name', 'email', 'subject', 'message']
     ordering_fields = ['created_at', 'is_read', 'full_name']
     ordering = ['-created_at']
-    http_method_names = ['get', 'patch', 'delete', 'head', 'options']  # Only read, mark as read, delete
+    pagination_class = CreatedAtCursorPagination
+    # Only read, mark as read/unread (POST actions), delete
+    http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
     
     def get_queryset(self):
         return ContactInquiry.objects.all()
@@ -126,12 +162,21 @@ class AdminContactInquiryViewSet(viewsets.ModelViewSet):
         """Auto-mark as read when viewing detail."""
         instance = self.get_object()
         if not instance.is_read:
-            instance.is_read = True
-            instance.updated_by = request.user
-            instance.save()
+            self._set_read(instance, True)
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
     
+    def _set_read(self, inquiry, is_read):
+        """
+        Save an inquiry's read flag, writing only the changed columns.
+        
+        Going through save() keeps the auditlog entry and the list version
+        bump of the post_save receiver.
+        """
+        inquiry.is_read = is_read
+        inquiry.updated_by = self.request.user
+        inquiry.save(update_fields=['is_read', 'updated_by', 'updated_at'])
+    
     @action(detail=True, methods=['post'])
     def mark_read(self, request, pk=None):
         """
@@ -139,10 +184,7 @@ class AdminContactInquiryViewSet(viewsets.ModelViewSet):
         
         POST /api/admin/inquiries/{id}/mark_read/
         """
-        inquiry = self.get_object()
-        inquiry.is_read = True
-        inquiry.updated_by = request.user
-        inquiry.save()
+        self._set_read(self.get_object(), True)
         return Response({'message': 'Message marqué comme lu.'})
     
     @action(detail=True, methods=['post'])
@@ -152,8 +194,5 @@ class AdminContactInquiryViewSet(viewsets.ModelViewSet):
         
         POST /api/admin/inquiries/{id}/mark_unread/
         """
-        inquiry = self.get_object()
-        inquiry.is_read = False
-        inquiry.updated_by = request.user
-        inquiry.save()
+        self._set_read(self.get_object(), False)
         return Response({'message': 'Message marqué comme non lu.'})
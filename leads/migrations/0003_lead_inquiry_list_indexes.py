@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0002_drop_audit_fk_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='constructionlead',
+            index=models.Index(fields=['status', '-created_at'], name='lead_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='constructionlead',
+            index=models.Index(fields=['is_deleted', '-created_at'], name='lead_deleted_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='constructionlead',
+            index=models.Index(fields=['email'], name='lead_email_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactinquiry',
+            index=models.Index(fields=['is_read', '-created_at'], name='inquiry_read_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactinquiry',
+            index=models.Index(fields=['email'], name='inquiry_email_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0003_lead_inquiry_list_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='contactinquiry',
+            name='inquiry_email_idx',
+        ),
+        migrations.AddField(
+            model_name='contactinquiry',
+            name='dedup_window',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='contactinquiry',
+            name='message_hash',
+            field=models.CharField(blank=True, editable=False, max_length=32),
+        ),
+        migrations.AddConstraint(
+            model_name='contactinquiry',
+            constraint=models.UniqueConstraint(fields=('email', 'subject', 'message_hash', 'dedup_window'), name='inquiry_dedup'),
+        ),
+    ]
@@ -80,9 +80,25 @@ class ConstructionLead(BaseModel):
         verbose_name = "Lead Construction"
         verbose_name_plural = "Leads Construction"
         ordering = ['-created_at']
+        indexes = [
+            # Admin list: filtered by status, newest first
+            models.Index(fields=['status', '-created_at'], name='lead_status_created_idx'),
+            models.Index(fields=['is_deleted', '-created_at'], name='lead_deleted_created_idx'),
+            # Emails are lowercased by the create serializer
+            models.Index(fields=['email'], name='lead_email_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.get_status_display()}"
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the status as loaded so the pre_save signal can tell
+        # whether it changed without re-reading the row
+        if 'status' in field_names:
+            instance._loaded_status = values[field_names.index('status')]
+        return instance
 
 
 class ContactInquiry(BaseModel):
@@ -116,10 +132,37 @@ class ContactInquiry(BaseModel):
         verbose_name="Lu"
     )
     
+    # Duplicate submission guard: the same message is stored once per
+    # window (see ContactInquiryCreateSerializer.create)
+    message_hash = models.CharField(
+        max_length=32,
+        blank=True,
+        editable=False
+    )
+    dedup_window = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        editable=False
+    )
+    
+    # Length of the duplicate submission window
+    DEDUP_WINDOW_SECONDS = 3600
+    
     class Meta:
         verbose_name = "Demande de Contact"
         verbose_name_plural = "Demandes de Contact"
         ordering = ['-created_at']
+        indexes = [
+            # Admin list: unread first filter, newest first
+            models.Index(fields=['is_read', '-created_at'], name='inquiry_read_created_idx'),
+        ]
+        constraints = [
+            # Also serves email lookups (leading column)
+            models.UniqueConstraint(
+                fields=['email', 'subject', 'message_hash', 'dedup_window'],
+                name='inquiry_dedup'
+            ),
+        ]
     
     def __str__(self):
         return f"{self.subject} - {self.name}"
@@ -4,7 +4,12 @@ Serializers for Leads API.
 Public POST endpoints for lead generation.
 """
 
+import hashlib
+import time
+
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
+from core.fields import LowercaseEmailField
 from .models import ConstructionLead, ContactInquiry
 
 
@@ -16,6 +21,8 @@ class ConstructionLeadCreateSerializer(serializers.ModelSerializer):
     Status and notes are managed internally.
     """
     
+    email = LowercaseEmailField(max_length=254)
+    
     class Meta:
         model = ConstructionLead
         fields = [
@@ -23,16 +30,21 @@ class ConstructionLeadCreateSerializer(serializers.ModelSerializer):
             'has_land', 'location_of_land',
             'interested_in', 'message'
         ]
-    
-    def validate_email(self, value):
-        """Normalize email to lowercase."""
-        return value.lower()
+
+
+# Status labels by value, looked up once instead of per row
+_STATUS_DISPLAY = dict(ConstructionLead.Status.choices)
 
 
 class ConstructionLeadListSerializer(serializers.ModelSerializer):
-    """Serializer for listing construction leads (admin use)."""
+    """
+    Serializer for listing construction leads (admin use).
     
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    Rows are built directly from model attributes in to_representation;
+    the declared fields still describe the output for the API schema.
+    """
+    
+    status_display = serializers.SerializerMethodField()
     interested_in_title = serializers.CharField(
         source='interested_in.title', 
         read_only=True, 
@@ -48,6 +60,31 @@ class ConstructionLeadListSerializer(serializers.ModelSerializer):
             'status', 'status_display', 'notes',
             'created_at', 'updated_at'
         ]
+    
+    def get_status_display(self, obj):
+        return _STATUS_DISPLAY.get(obj.status, obj.status)
+    
+    def to_representation(self, instance):
+        # Skips the per-field get_attribute() walk; only the datetimes go
+        # through their fields for timezone and format handling
+        fields = self.fields
+        interested_in = instance.interested_in
+        return {
+            'id': instance.id,
+            'name': instance.name,
+            'phone': instance.phone,
+            'email': instance.email,
+            'has_land': instance.has_land,
+            'location_of_land': instance.location_of_land,
+            'interested_in': instance.interested_in_id,
+            'interested_in_title': interested_in.title if interested_in else None,
+            'message': instance.message,
+            'status': instance.status,
+            'status_display': self.get_status_display(instance),
+            'notes': instance.notes,
+            'created_at': fields['created_at'].to_representation(instance.created_at),
+            'updated_at': fields['updated_at'].to_representation(instance.updated_at),
+        }
 
 
 class ConstructionLeadDetailSerializer(serializers.ModelSerializer):
@@ -84,13 +121,34 @@ class ContactInquiryCreateSerializer(serializers.ModelSerializer):
     Serializer for creating contact inquiries (public contact form).
     """
     
+    email = LowercaseEmailField(max_length=254)
+    
     class Meta:
         model = ContactInquiry
         fields = ['name', 'email', 'phone', 'subject', 'message']
     
-    def validate_email(self, value):
-        """Normalize email to lowercase."""
-        return value.lower()
+    def create(self, validated_data):
+        """
+        Store the inquiry unless the same one was sent in this window.
+        
+        Duplicates hit the inquiry_dedup constraint and are dropped; the
+        caller gets the same response either way, so bots can't tell.
+        Stored inquiries go through save(), so auditlog and the post_save
+        receivers still see them.
+        """
+        instance = ContactInquiry(
+            **validated_data,
+            message_hash=hashlib.blake2b(
+                validated_data['message'].encode(), digest_size=16
+            ).hexdigest(),
+            dedup_window=int(time.time()) // ContactInquiry.DEDUP_WINDOW_SECONDS
+        )
+        try:
+            with transaction.atomic():
+                instance.save()
+        except IntegrityError:
+            pass  # same inquiry already stored in this window
+        return instance
 
 
 class ContactInquiryListSerializer(serializers.ModelSerializer):
@@ -4,11 +4,18 @@ Django Signals for Leads app.
 Handles lead conversion to client and other business logic.
 """
 
-from django.db.models.signals import post_save, pre_save
+import secrets
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
 
-from .models import ConstructionLead
+from clients.models import ClientProfile
+from core.utils import bump_list_version
+from .models import ConstructionLead, ContactInquiry
 
 User = get_user_model()
 
@@ -16,70 +23,114 @@ User = get_user_model()
 @receiver(pre_save, sender=ConstructionLead)
 def track_status_change(sender, instance, **kwargs):
     """Track if status is changing to CONVERTED."""
-    if instance.pk:
-        try:
-            old_instance = ConstructionLead.objects.get(pk=instance.pk)
-            instance._old_status = old_instance.status
-        except ConstructionLead.DoesNotExist:
-            instance._old_status = None
-    else:
+    if not instance.pk:
         instance._old_status = None
+    elif hasattr(instance, '_loaded_status'):
+        # Loaded from the database: the status read then is the old one
+        instance._old_status = instance._loaded_status
+    else:
+        # Built by hand with a pk; read just the status column
+        instance._old_status = ConstructionLead.all_objects.filter(
+            pk=instance.pk
+        ).values_list('status', flat=True).first()
 
 
 @receiver(post_save, sender=ConstructionLead)
-def convert_lead_to_client(sender, instance, created, **kwargs):
+def remember_saved_status(sender, instance, **kwargs):
+    """Treat the saved status as the loaded one for later saves of this instance."""
+    instance._loaded_status = instance.status
+
+
+@receiver([post_save, post_delete], sender=ConstructionLead)
+@receiver([post_save, post_delete], sender=ContactInquiry)
+def invalidate_admin_lists(sender, **kwargs):
+    """Change the admin list ETags when a lead or inquiry is written."""
+    bump_list_version(sender)
+
+
+@receiver(post_save, sender='marketing.PortfolioItem')
+def invalidate_lead_lists(sender, **kwargs):
+    """Lead lists show the title of the portfolio item they came from."""
+    bump_list_version(ConstructionLead)
+
+
+def convert_to_client(lead, converted_by=None):
     """
-    When a lead status changes to CONVERTED, optionally create a client.
+    Create a user account and client profile for a converted lead.
     
-    This signal detects when a lead is converted and can automatically
-    create a ClientProfile. The admin can also do this manually.
+    Args:
+        lead: ConstructionLead being converted
+        converted_by: Admin user performing the conversion
     
-    Note: Full automatic conversion is disabled by default to allow
-    admin to customize the client creation process. Enable by setting
-    AUTO_CONVERT_LEADS = True in settings.
+    Returns:
+        The new ClientProfile, or None if an account already uses the email
     """
-    from django.conf import settings
-    from clients.models import ClientProfile
+    # Check if a client with this email already exists
+    if User.objects.filter(email__iexact=lead.email).exists():
+        return None
     
-    # Check if auto-conversion is enabled
-    if not getattr(settings, 'AUTO_CONVERT_LEADS', False):
-        return
+    name_parts = lead.name.split() if lead.name else []
     
-    # Check if status changed to CONVERTED
-    old_status = getattr(instance, '_old_status', None)
-    if old_status != ConstructionLead.Status.CONVERTED and instance.status == ConstructionLead.Status.CONVERTED:
-        # Check if a client with this email already exists
-        if User.objects.filter(email=instance.email).exists():
-            return
-        
-        # Create user account
-        username = instance.email.split('@')[0]
-        base_username = username
-        counter = 1
-        while User.objects.filter(username=username).exists():
-            username = f"{base_username}{counter}"
-            counter += 1
-        
-        user = User.objects.create_user(
+    # Random suffix instead of probing for a free username one query at
+    # a time; 8 hex chars make a collision practically impossible
+    base_username = lead.email.split('@')[0][:100]
+    username = f"{base_username}-{secrets.token_hex(4)}"
+    
+    with transaction.atomic():
+        user = User(
             username=username,
-            email=instance.email,
-            first_name=instance.name.split()[0] if instance.name else '',
-            last_name=' '.join(instance.name.split()[1:]) if len(instance.name.split()) > 1 else '',
+            email=lead.email,
+            first_name=name_parts[0] if name_parts else '',
+            last_name=' '.join(name_parts[1:]),
             is_active=True
         )
-        
-        # Set a random password (client will need to reset)
-        import secrets
-        temp_password = secrets.token_urlsafe(12)
-        user.set_password(temp_password)
+        # No password until the client sets one through password reset
+        user.set_unusable_password()
         user.save()
         
         # Create client profile
-        ClientProfile.objects.create(
+        client_profile = ClientProfile.objects.create(
             user=user,
-            phone=instance.phone,
-            address=instance.location_of_land or '',
-            created_by=instance.updated_by  # The admin who converted
+            phone=lead.phone,
+            address=lead.location_of_land or '',
+            created_by=converted_by  # The admin who converted
         )
-        
-        # TODO: Send welcome email with password reset link (Phase 5)
+    
+    # TODO: Send welcome email with password reset link (Phase 5)
+    return client_profile
+
+
+def convert_lead_to_client(sender, instance, created, **kwargs):
+    """
+    When a lead status changes to CONVERTED, optionally create a client.
+    
+    This signal detects when a lead is converted and can automatically
+    create a ClientProfile. The admin can also do this manually.
+    
+    Note: Full automatic conversion is disabled by default to allow
+    admin to customize the client creation process. Enable by setting
+    AUTO_CONVERT_LEADS = True in settings. The receiver is only connected
+    while the setting is on, so lead saves don't dispatch to it otherwise.
+    """
+    # Check if status changed to CONVERTED
+    old_status = getattr(instance, '_old_status', None)
+    if old_status != ConstructionLead.Status.CONVERTED and instance.status == ConstructionLead.Status.CONVERTED:
+        convert_to_client(instance, converted_by=instance.updated_by)
+
+
+def _connect_auto_convert(enabled):
+    """Connect or disconnect convert_lead_to_client according to the setting."""
+    if enabled:
+        post_save.connect(convert_lead_to_client, sender=ConstructionLead)
+    else:
+        post_save.disconnect(convert_lead_to_client, sender=ConstructionLead)
+
+
+_connect_auto_convert(getattr(settings, 'AUTO_CONVERT_LEADS', False))
+
+
+@receiver(setting_changed)
+def auto_convert_setting_changed(setting, value, **kwargs):
+    """Follow AUTO_CONVERT_LEADS when it is overridden (tests)."""
+    if setting == 'AUTO_CONVERT_LEADS':
+        _connect_auto_convert(bool(value))
@@ -7,6 +7,7 @@ Public POST endpoints for lead generation.
 from rest_framework import generics, status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
+from core.renderers import ORJSONRenderer
 from .models import ConstructionLead, ContactInquiry
 from .serializers import (
     ConstructionLeadCreateSerializer,
@@ -21,6 +22,8 @@ class ConstructionLeadCreateView(generics.CreateAPIView):
     POST /api/build-for-me/
     """
     permission_classes = [AllowAny]
+    # Public form endpoints: JSON only, even when the browsable API is on
+    renderer_classes = [ORJSONRenderer]
     serializer_class = ConstructionLeadCreateSerializer
     
     def create(self, request, *args, **kwargs):
@@ -44,6 +47,8 @@ class ContactInquiryCreateView(generics.CreateAPIView):
     POST /api/contact/
     """
     permission_classes = [AllowAny]
+    # Public form endpoints: JSON only, even when the browsable API is on
+    renderer_classes = [ORJSONRenderer]
     serializer_class = ContactInquiryCreateSerializer
     
     def create(self, request, *args, **kwargs):
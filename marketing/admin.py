@@ -3,6 +3,8 @@ Admin configuration for Marketing models.
 """
 
 from django.contrib import admin
+from django.contrib.postgres.search import SearchQuery
+from django.db import connections
 from .models import (
     PortfolioItem, PortfolioGalleryImage, PortfolioVideo,
     Service, Partner, Testimonial, BlogPost
@@ -14,6 +16,13 @@ class PortfolioGalleryImageInline(admin.TabularInline):
     model = PortfolioGalleryImage
     extra = 1
     fields = ['image', 'caption', 'order']
+    
+    def get_queryset(self, request):
+        # Only the edited columns (plus updated_at, which a save with
+        # deferred fields would otherwise skip)
+        return super().get_queryset(request).only(
+            'id', 'portfolio_item', 'image', 'caption', 'order', 'updated_at'
+        )
 
 
 class PortfolioVideoInline(admin.TabularInline):
@@ -21,6 +30,11 @@ class PortfolioVideoInline(admin.TabularInline):
     model = PortfolioVideo
     extra = 1
     fields = ['title', 'video_url', 'order']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).only(
+            'id', 'portfolio_item', 'title', 'video_url', 'order', 'updated_at'
+        )
 
 
 @admin.register(PortfolioItem)
@@ -53,6 +67,18 @@ class PortfolioItemAdmin(admin.ModelAdmin):
     def get_queryset(self, request):
         # Show all objects including soft-deleted in admin
         return PortfolioItem.all_objects.all()
+    
+    def get_search_results(self, request, queryset, search_term):
+        results, may_have_duplicates = super().get_search_results(
+            request, queryset, search_term
+        )
+        # On PostgreSQL, also match the trigger-maintained search_vector, so
+        # inflected words ("maisons" for "maison") are found. The substring
+        # matches are kept: the vector only matches whole words.
+        if search_term and connections[queryset.db].vendor == 'postgresql':
+            query = SearchQuery(search_term, config='french', search_type='websearch')
+            results |= queryset.filter(search_vector=query)
+        return results, may_have_duplicates
 
 
 @admin.register(Service)
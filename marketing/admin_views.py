@@ -8,9 +8,11 @@ from rest_framework import viewsets, filters
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils import timezone
+from core.pagination import CreatedAtCursorPagination
+from core.signals import soft_deleted
+from .views import BlogPostViewSet, PortfolioItemViewSet, portfolio_detail_prefetches
 from .models import (
-    PortfolioItem, PortfolioGalleryImage, PortfolioVideo,
-    Service, Partner, Testimonial, BlogPost
+    PortfolioItem, Service, Partner, Testimonial, BlogPost
 )
 from .serializers import (
     PortfolioItemListSerializer, PortfolioItemDetailSerializer, PortfolioItemWriteSerializer,
@@ -27,14 +29,43 @@ class BaseAdminViewSet(viewsets.ModelViewSet):
         serializer.save(created_by=self.request.user)
     
     def perform_update(self, serializer):
-        serializer.save(updated_by=self.request.user)
+        """
+        Write only the columns the request actually changed.
+        
+        A request that changes nothing skips the save entirely; otherwise
+        the UPDATE is limited to the changed columns plus the audit fields,
+        so toggling order or is_featured doesn't rewrite the description.
+        save() still runs, so uploads are stored, and the cache and
+        compression receivers see the change.
+        """
+        instance = serializer.instance
+        changed = [
+            name for name, value in serializer.validated_data.items()
+            if getattr(instance, name) != value
+        ]
+        if not changed:
+            return
+        for name in changed:
+            setattr(instance, name, serializer.validated_data[name])
+        instance.updated_by = self.request.user
+        instance.save(update_fields=[*changed, 'updated_by', 'updated_at'])
     
     def perform_destroy(self, instance):
-        """Soft delete"""
-        instance.is_deleted = True
-        instance.deleted_at = timezone.now()
-        instance.deleted_by = self.request.user
-        instance.save()
+        """
+        Soft delete with a single UPDATE.
+        
+        Skips Model.save(), so the slug logic and the image compression
+        receivers don't run for a row that is going away; soft_deleted
+        takes care of cache invalidation and the audit log.
+        """
+        now = timezone.now()
+        type(instance).all_objects.filter(pk=instance.pk).update(
+            is_deleted=True,
+            deleted_at=now,
+            deleted_by=self.request.user,
+            updated_at=now,
+        )
+        soft_deleted.send(sender=type(instance), instance=instance, user=self.request.user)
 
 
 class AdminPortfolioViewSet(BaseAdminViewSet):
@@ -53,9 +84,19 @@ class AdminPortfolioViewSet(BaseAdminViewSet):
     search_fields = ['title', 'description', 'city']
     ordering_fields = ['created_at', 'title']
     ordering = ['-created_at']
+    pagination_class = CreatedAtCursorPagination
+    
+    # Same list columns as the public endpoint (created_at is the cursor)
+    list_fields = PortfolioItemViewSet.list_fields
     
     def get_queryset(self):
-        return PortfolioItem.objects.prefetch_related('gallery_images', 'videos').all()
+        queryset = PortfolioItem.objects.all()
+        if self.action == 'list':
+            queryset = queryset.only(*self.list_fields)
+        elif self.action == 'retrieve':
+            # Only the detail serializer nests gallery and videos
+            queryset = queryset.prefetch_related(*portfolio_detail_prefetches())
+        return queryset
     
     def get_serializer_class(self):
         if self.action in ['create', 'update', 'partial_update']:
@@ -120,9 +161,15 @@ class AdminBlogPostViewSet(BaseAdminViewSet):
     search_fields = ['title', 'content', 'excerpt']
     ordering_fields = ['created_at', 'published_date', 'title']
     ordering = ['-created_at']
+    pagination_class = CreatedAtCursorPagination
+    
+    list_fields = BlogPostViewSet.list_fields
     
     def get_queryset(self):
-        return BlogPost.objects.all()
+        queryset = BlogPost.objects.all()
+        if self.action == 'list':
+            queryset = queryset.only(*self.list_fields)
+        return queryset
     
     def get_serializer_class(self):
         if self.action in ['create', 'update', 'partial_update']:
@@ -0,0 +1,21 @@
+"""
+Filter sets for Marketing API.
+"""
+
+from django_filters import rest_framework as django_filters
+
+from .models import PortfolioItem
+
+
+class PortfolioItemFilter(django_filters.FilterSet):
+    """
+    Query filters for the public portfolio list.
+    
+    Same filters DjangoFilterBackend would generate from filterset_fields,
+    but the FilterSet class is built once at import instead of on every
+    request.
+    """
+    
+    class Meta:
+        model = PortfolioItem
+        fields = ['category', 'is_featured', 'city', 'year']
@@ -0,0 +1,47 @@
+from django.db import migrations
+
+
+# Admin and API search use icontains, which PostgreSQL runs as
+# UPPER(col::text) LIKE UPPER('%term%'). A btree can't serve a leading
+# wildcard, but a trigram GIN index on the same expressions can.
+SEARCH_INDEXES = {
+    'marketing_portfolio_search_trgm': (
+        'marketing_portfolioitem',
+        ['title', 'description', 'owner', 'city', 'district', 'slug'],
+    ),
+    'marketing_blogpost_search_trgm': (
+        'marketing_blogpost',
+        ['title', 'content', 'excerpt'],
+    ),
+}
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+    for name, (table, columns) in SEARCH_INDEXES.items():
+        expressions = ', '.join(
+            f'UPPER("{column}"::text) gin_trgm_ops' for column in columns
+        )
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ({expressions});'
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in SEARCH_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name};')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('marketing', '0002_drop_audit_fk_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
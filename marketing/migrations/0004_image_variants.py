@@ -0,0 +1,43 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('marketing', '0003_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Fichiers AVIF/WebP/JPEG générés à la compression', verbose_name="Variantes d'image"),
+        ),
+        migrations.AddField(
+            model_name='partner',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Fichiers AVIF/WebP/JPEG générés à la compression', verbose_name="Variantes d'image"),
+        ),
+        migrations.AddField(
+            model_name='portfoliogalleryimage',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Fichiers AVIF/WebP/JPEG générés à la compression', verbose_name="Variantes d'image"),
+        ),
+        migrations.AddField(
+            model_name='portfolioitem',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Fichiers AVIF/WebP/JPEG générés à la compression', verbose_name="Variantes d'image"),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Fichiers AVIF/WebP/JPEG générés à la compression', verbose_name="Variantes d'image"),
+        ),
+        migrations.AddField(
+            model_name='testimonial',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text='Fichiers AVIF/WebP/JPEG générés à la compression', verbose_name="Variantes d'image"),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('marketing', '0004_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['is_deleted', 'is_published', '-published_date'], name='blog_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='partner',
+            index=models.Index(fields=['is_deleted', 'is_active', 'order'], name='partner_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='portfolioitem',
+            index=models.Index(fields=['is_deleted', 'order', '-created_at'], name='portfolio_list_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='portfolioitem',
+            index=models.Index(fields=['category', 'is_featured', 'is_deleted'], name='portfolio_cat_featured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(fields=['is_deleted', 'is_active', 'order'], name='service_active_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testimonial',
+            index=models.Index(fields=['is_deleted', 'is_active', '-is_featured', '-created_at'], name='testimonial_list_idx'),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:38
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# Admin search matches search_vector (see PortfolioItemAdmin). PostgreSQL
+# keeps it current with the built-in tsvector_update_trigger, so no Python
+# code has to remember to refresh it; other databases leave it NULL and
+# the admin falls back to search_fields.
+SEARCH_TRIGGER_SQL = """
+CREATE TRIGGER marketing_portfolio_search_vector_trg
+BEFORE INSERT OR UPDATE ON marketing_portfolioitem
+FOR EACH ROW EXECUTE FUNCTION tsvector_update_trigger(
+    search_vector, 'pg_catalog.french', title, description, owner, city
+);
+"""
+
+
+def create_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(SEARCH_TRIGGER_SQL)
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS marketing_portfolio_search_vector_gin '
+        'ON marketing_portfolioitem USING gin (search_vector);'
+    )
+    # Fill existing rows through the trigger
+    schema_editor.execute('UPDATE marketing_portfolioitem SET title = title;')
+
+
+def drop_search_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'DROP TRIGGER IF EXISTS marketing_portfolio_search_vector_trg ON marketing_portfolioitem;'
+    )
+    schema_editor.execute('DROP INDEX IF EXISTS marketing_portfolio_search_vector_gin;')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('marketing', '0005_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='portfolioitem',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_trigger, drop_search_trigger),
+    ]
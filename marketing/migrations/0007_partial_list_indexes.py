@@ -0,0 +1,61 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('marketing', '0006_portfolio_search_vector'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='blogpost',
+            name='blog_published_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='partner',
+            name='partner_active_order_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='portfolioitem',
+            name='portfolio_list_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='portfolioitem',
+            name='portfolio_cat_featured_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='service',
+            name='service_active_order_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='testimonial',
+            name='testimonial_list_idx',
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_published', '-published_date'], name='blog_alive_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='partner',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_active', 'order'], name='partner_alive_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='portfolioitem',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['order', '-created_at'], name='portfolio_alive_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='portfolioitem',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['category', 'is_featured'], name='portfolio_cat_featured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_active', 'order'], name='service_alive_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testimonial',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['is_active', '-is_featured', '-created_at'], name='testimonial_alive_idx'),
+        ),
+    ]
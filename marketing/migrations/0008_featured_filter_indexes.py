@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-15 23:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('marketing', '0007_partial_list_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='portfolioitem',
+            name='portfolio_cat_featured_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='testimonial',
+            name='testimonial_alive_idx',
+        ),
+        migrations.AddIndex(
+            model_name='portfolioitem',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['category', 'is_featured', '-year'], name='portfolio_cat_feat_year_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testimonial',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_deleted', False)), fields=['-is_featured', '-created_at'], name='testimonial_active_idx'),
+        ),
+    ]
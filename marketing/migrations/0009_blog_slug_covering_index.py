@@ -0,0 +1,36 @@
+from django.db import migrations
+
+
+# BlogPostViewSet revalidates a detail request (ConditionalRetrieveMixin)
+# by reading updated_at for one slug, ordered by published_date. With the
+# filtered and ordered columns INCLUDEd, PostgreSQL answers it with an
+# index-only scan. The index is created here rather than in Meta.indexes
+# because SQLite (development) can't store non-key columns.
+COVERING_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS marketing_blog_slug_revalidate_idx
+ON marketing_blogpost (slug) INCLUDE (updated_at, published_date, is_published)
+WHERE NOT is_deleted;
+"""
+
+
+def create_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(COVERING_INDEX_SQL)
+
+
+def drop_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS marketing_blog_slug_revalidate_idx;')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('marketing', '0008_featured_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_covering_index, drop_covering_index),
+    ]
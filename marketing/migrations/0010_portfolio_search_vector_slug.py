@@ -0,0 +1,37 @@
+from django.db import migrations
+
+
+# Rebuild the admin search trigger of 0006 so search_vector also covers
+# slug, the last of PortfolioItemAdmin.search_fields it left out.
+TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS marketing_portfolio_search_vector_trg ON marketing_portfolioitem;
+CREATE TRIGGER marketing_portfolio_search_vector_trg
+BEFORE INSERT OR UPDATE ON marketing_portfolioitem
+FOR EACH ROW EXECUTE FUNCTION tsvector_update_trigger(
+    search_vector, 'pg_catalog.french', {columns}
+);
+"""
+
+
+def set_trigger_columns(columns):
+    def apply(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        schema_editor.execute(TRIGGER_SQL.format(columns=columns))
+        # Refresh existing rows through the trigger
+        schema_editor.execute('UPDATE marketing_portfolioitem SET title = title;')
+    return apply
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('marketing', '0009_blog_slug_covering_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            set_trigger_columns('title, description, owner, city, slug'),
+            set_trigger_columns('title, description, owner, city'),
+        ),
+    ]
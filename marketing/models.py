@@ -11,9 +11,11 @@ This module contains models for the public website content:
 - BlogPost: Blog articles
 """
 
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils.text import slugify
 from core.models import BaseModel
+from core.utils import unique_slug
 
 
 class PortfolioItem(BaseModel):
@@ -53,6 +55,13 @@ class PortfolioItem(BaseModel):
         upload_to='portfolio/main/',
         verbose_name="Image Principale"
     )
+    image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name="Variantes d'image",
+        help_text="Fichiers AVIF/WebP/JPEG générés à la compression"
+    )
     description = models.TextField(
         blank=True,
         verbose_name="Description"
@@ -119,23 +128,50 @@ class PortfolioItem(BaseModel):
         verbose_name="Mis en avant"
     )
     
+    # Admin full-text search; filled by a PostgreSQL trigger from title,
+    # description, owner, city and slug (see migrations 0006 and 0010)
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False
+    )
+    
     class Meta:
         verbose_name = "Portfolio"
         verbose_name_plural = "Portfolios"
         ordering = ['order', '-created_at']
+        # Partial indexes over live rows only, matching ActiveManager's
+        # is_deleted=False filter (slug is unique already)
+        indexes = [
+            # Public list: display order
+            models.Index(
+                fields=['order', '-created_at'],
+                condition=models.Q(is_deleted=False),
+                name='portfolio_alive_idx'
+            ),
+            # ?category=&is_featured=&year= filters
+            models.Index(
+                fields=['category', 'is_featured', '-year'],
+                condition=models.Q(is_deleted=False),
+                name='portfolio_cat_feat_year_idx'
+            ),
+        ]
     
     def __str__(self):
         return f"{self.title} ({self.get_category_display()})"
     
-    def save(self, *args, **kwargs):
+    def save(self, *args, slug_cache=None, **kwargs):
+        """
+        Save, generating a unique slug from the title if none is set.
+        
+        slug_cache: optional set of existing slugs (see unique_slug) for
+        imports saving many rows.
+        """
         if not self.slug:
-            self.slug = slugify(self.title)
-            # Ensure unique slug
-            original_slug = self.slug
-            counter = 1
-            while PortfolioItem.all_objects.filter(slug=self.slug).exclude(pk=self.pk).exists():
-                self.slug = f"{original_slug}-{counter}"
-                counter += 1
+            self.slug = unique_slug(
+                PortfolioItem.all_objects.exclude(pk=self.pk),
+                slugify(self.title),
+                taken=slug_cache
+            )
         super().save(*args, **kwargs)
 
 
@@ -152,6 +188,13 @@ class PortfolioGalleryImage(BaseModel):
         upload_to='portfolio/gallery/',
         verbose_name="Image"
     )
+    image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name="Variantes d'image",
+        help_text="Fichiers AVIF/WebP/JPEG générés à la compression"
+    )
     caption = models.CharField(
         max_length=255,
         blank=True,
@@ -214,6 +257,13 @@ class Service(BaseModel):
         verbose_name="Icône",
         help_text="SVG ou PNG recommandé"
     )
+    image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name="Variantes d'image",
+        help_text="Fichiers AVIF/WebP/JPEG générés à la compression"
+    )
     short_description = models.TextField(
         verbose_name="Description Courte"
     )
@@ -230,6 +280,13 @@ class Service(BaseModel):
         verbose_name = "Service"
         verbose_name_plural = "Services"
         ordering = ['order']
+        indexes = [
+            models.Index(
+                fields=['is_active', 'order'],
+                condition=models.Q(is_deleted=False),
+                name='service_alive_idx'
+            ),
+        ]
     
     def __str__(self):
         return self.title
@@ -246,6 +303,13 @@ class Partner(BaseModel):
         upload_to='partners/logos/',
         verbose_name="Logo"
     )
+    image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name="Variantes d'image",
+        help_text="Fichiers AVIF/WebP/JPEG générés à la compression"
+    )
     website = models.URLField(
         blank=True,
         verbose_name="Site Web"
@@ -263,6 +327,13 @@ class Partner(BaseModel):
         verbose_name = "Partenaire"
         verbose_name_plural = "Partenaires"
         ordering = ['order']
+        indexes = [
+            models.Index(
+                fields=['is_active', 'order'],
+                condition=models.Q(is_deleted=False),
+                name='partner_alive_idx'
+            ),
+        ]
     
     def __str__(self):
         return self.name
@@ -287,6 +358,13 @@ class Testimonial(BaseModel):
         null=True,
         verbose_name="Photo"
     )
+    image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name="Variantes d'image",
+        help_text="Fichiers AVIF/WebP/JPEG générés à la compression"
+    )
     content = models.TextField(
         verbose_name="Témoignage"
     )
@@ -308,6 +386,15 @@ class Testimonial(BaseModel):
         verbose_name = "Témoignage"
         verbose_name_plural = "Témoignages"
         ordering = ['-is_featured', '-created_at']
+        indexes = [
+            # Public list (?is_featured=): live active rows only,
+            # featured first, newest first
+            models.Index(
+                fields=['-is_featured', '-created_at'],
+                condition=models.Q(is_deleted=False, is_active=True),
+                name='testimonial_active_idx'
+            ),
+        ]
     
     def __str__(self):
         return f"Témoignage de {self.client_name}"
@@ -335,6 +422,13 @@ class BlogPost(BaseModel):
         upload_to='blog/thumbnails/',
         verbose_name="Image de Couverture"
     )
+    image_variants = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        verbose_name="Variantes d'image",
+        help_text="Fichiers AVIF/WebP/JPEG générés à la compression"
+    )
     content = models.TextField(
         verbose_name="Contenu"
     )
@@ -357,17 +451,29 @@ class BlogPost(BaseModel):
         verbose_name = "Article de Blog"
         verbose_name_plural = "Articles de Blog"
         ordering = ['-published_date', '-created_at']
+        indexes = [
+            # Public list: published posts, latest first
+            models.Index(
+                fields=['is_published', '-published_date'],
+                condition=models.Q(is_deleted=False),
+                name='blog_alive_idx'
+            ),
+        ]
     
     def __str__(self):
         return self.title
     
-    def save(self, *args, **kwargs):
+    def save(self, *args, slug_cache=None, **kwargs):
+        """
+        Save, generating a unique slug from the title if none is set.
+        
+        slug_cache: optional set of existing slugs (see unique_slug) for
+        imports saving many rows.
+        """
         if not self.slug:
-            self.slug = slugify(self.title)
-            # Ensure unique slug
-            original_slug = self.slug
-            counter = 1
-            while BlogPost.all_objects.filter(slug=self.slug).exclude(pk=self.pk).exists():
-                self.slug = f"{original_slug}-{counter}"
-                counter += 1
+            self.slug = unique_slug(
+                BlogPost.all_objects.exclude(pk=self.pk),
+                slugify(self.title),
+                taken=slug_cache
+            )
         super().save(*args, **kwargs)
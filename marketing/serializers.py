@@ -5,6 +5,7 @@ Public endpoints - no authentication required.
 """
 
 from rest_framework import serializers
+from core.fields import ImageVariantsField
 from .models import (
     PortfolioItem, PortfolioGalleryImage, PortfolioVideo,
     Service, Partner, Testimonial, BlogPost
@@ -14,9 +15,11 @@ from .models import (
 class PortfolioGalleryImageSerializer(serializers.ModelSerializer):
     """Serializer for portfolio gallery images."""
     
+    variants = ImageVariantsField('image')
+    
     class Meta:
         model = PortfolioGalleryImage
-        fields = ['id', 'image', 'caption', 'order']
+        fields = ['id', 'image', 'variants', 'caption', 'order']
 
 
 class PortfolioVideoSerializer(serializers.ModelSerializer):
@@ -27,31 +30,41 @@ class PortfolioVideoSerializer(serializers.ModelSerializer):
         fields = ['id', 'title', 'video_url', 'order']
 
 
+# Category labels by value, looked up once instead of per row
+_CATEGORY_DISPLAY = dict(PortfolioItem.Category.choices)
+
+
 class PortfolioItemListSerializer(serializers.ModelSerializer):
     """Serializer for portfolio list view (lightweight)."""
     
-    category_display = serializers.CharField(source='get_category_display', read_only=True)
+    category_display = serializers.SerializerMethodField()
+    variants = ImageVariantsField('main_image')
     
     class Meta:
         model = PortfolioItem
         fields = [
             'id', 'title', 'slug', 'category', 'category_display',
-            'main_image', 'area', 'city', 'year', 'is_featured', 'order'
+            'main_image', 'variants', 'area', 'city', 'year',
+            'is_featured', 'order'
         ]
+    
+    def get_category_display(self, obj):
+        return _CATEGORY_DISPLAY.get(obj.category, obj.category)
 
 
 class PortfolioItemDetailSerializer(serializers.ModelSerializer):
     """Serializer for portfolio detail view (full data with nested gallery/videos)."""
     
-    category_display = serializers.CharField(source='get_category_display', read_only=True)
+    category_display = serializers.SerializerMethodField()
     gallery_images = PortfolioGalleryImageSerializer(many=True, read_only=True)
     videos = PortfolioVideoSerializer(many=True, read_only=True)
+    variants = ImageVariantsField('main_image')
     
     class Meta:
         model = PortfolioItem
         fields = [
             'id', 'title', 'slug', 'category', 'category_display',
-            'main_image', 'description',
+            'main_image', 'variants', 'description',
             # Specifications
             'area', 'task', 'owner', 'contractor', 'year', 'usage',
             # Location
@@ -63,6 +76,9 @@ class PortfolioItemDetailSerializer(serializers.ModelSerializer):
             # Timestamps
             'created_at', 'updated_at'
         ]
+    
+    def get_category_display(self, obj):
+        return _CATEGORY_DISPLAY.get(obj.category, obj.category)
 
 
 class PortfolioItemWriteSerializer(serializers.ModelSerializer):
@@ -83,26 +99,32 @@ class PortfolioItemWriteSerializer(serializers.ModelSerializer):
 class ServiceSerializer(serializers.ModelSerializer):
     """Serializer for services."""
     
+    variants = ImageVariantsField('icon')
+    
     class Meta:
         model = Service
-        fields = ['id', 'title', 'icon', 'short_description', 'order']
+        fields = ['id', 'title', 'icon', 'variants', 'short_description', 'order']
 
 
 class PartnerSerializer(serializers.ModelSerializer):
     """Serializer for partners."""
     
+    variants = ImageVariantsField('logo')
+    
     class Meta:
         model = Partner
-        fields = ['id', 'name', 'logo', 'website', 'order']
+        fields = ['id', 'name', 'logo', 'variants', 'website', 'order']
 
 
 class TestimonialSerializer(serializers.ModelSerializer):
     """Serializer for testimonials."""
     
+    variants = ImageVariantsField('photo')
+    
     class Meta:
         model = Testimonial
         fields = [
-            'id', 'client_name', 'role', 'photo', 'content',
+            'id', 'client_name', 'role', 'photo', 'variants', 'content',
             'rating', 'is_featured'
         ]
 
@@ -110,10 +132,12 @@ class TestimonialSerializer(serializers.ModelSerializer):
 class BlogPostListSerializer(serializers.ModelSerializer):
     """Serializer for blog post list view."""
     
+    variants = ImageVariantsField('thumbnail')
+    
     class Meta:
         model = BlogPost
         fields = [
-            'id', 'title', 'slug', 'thumbnail', 'excerpt',
+            'id', 'title', 'slug', 'thumbnail', 'variants', 'excerpt',
             'published_date', 'created_at'
         ]
 
@@ -121,10 +145,12 @@ class BlogPostListSerializer(serializers.ModelSerializer):
 class BlogPostDetailSerializer(serializers.ModelSerializer):
     """Serializer for blog post detail view."""
     
+    variants = ImageVariantsField('thumbnail')
+    
     class Meta:
         model = BlogPost
         fields = [
-            'id', 'title', 'slug', 'thumbnail', 'content', 'excerpt',
+            'id', 'title', 'slug', 'thumbnail', 'variants', 'content', 'excerpt',
             'published_date', 'is_published', 'created_at', 'updated_at'
         ]
 
@@ -7,6 +7,11 @@ Public endpoints - no authentication required.
 from rest_framework import viewsets, generics, filters
 from rest_framework.permissions import AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
+from django.db.models import Prefetch
+from core.filters import TrigramSearchFilter
+from core.mixins import CachedListMixin, ConditionalListMixin, ConditionalRetrieveMixin
+from core.pagination import EstimatedCountPagination
+from .filters import PortfolioItemFilter
 from .models import (
     PortfolioItem, PortfolioGalleryImage, PortfolioVideo,
     Service, Partner, Testimonial, BlogPost
@@ -19,7 +24,34 @@ from .serializers import (
 )
 
 
-class PortfolioItemViewSet(viewsets.ReadOnlyModelViewSet):
+def portfolio_detail_prefetches():
+    """
+    Prefetches for PortfolioItemDetailSerializer.
+    
+    Gallery images and videos are nested in the detail view only; each is
+    loaded in one query, with just the columns the serializer renders.
+    
+    Returns:
+        List of Prefetch objects
+    """
+    return [
+        Prefetch(
+            'gallery_images',
+            queryset=PortfolioGalleryImage.objects.only(
+                'id', 'portfolio_item', 'image', 'image_variants',
+                'caption', 'order'
+            )
+        ),
+        Prefetch(
+            'videos',
+            queryset=PortfolioVideo.objects.only(
+                'id', 'portfolio_item', 'title', 'video_url', 'order'
+            )
+        ),
+    ]
+
+
+class PortfolioItemViewSet(ConditionalListMixin, viewsets.ReadOnlyModelViewSet):
     """
     Public API endpoint for portfolio items.
     
@@ -28,14 +60,27 @@ class PortfolioItemViewSet(viewsets.ReadOnlyModelViewSet):
     """
     permission_classes = [AllowAny]
     lookup_field = 'slug'
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['category', 'is_featured', 'city', 'year']
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, TrigramSearchFilter]
+    filterset_class = PortfolioItemFilter
     search_fields = ['title', 'description', 'city', 'district']
     ordering_fields = ['order', 'created_at', 'year']
     ordering = ['order', '-created_at']
+    pagination_class = EstimatedCountPagination
+    
+    # Columns PortfolioItemListSerializer renders, plus the ordering keys
+    list_fields = [
+        'id', 'title', 'slug', 'category', 'main_image', 'image_variants',
+        'area', 'city', 'year', 'is_featured', 'order', 'created_at'
+    ]
     
     def get_queryset(self):
-        return PortfolioItem.objects.all()
+        queryset = PortfolioItem.objects.all()
+        if self.action == 'list':
+            # Leave the long description out of list rows
+            queryset = queryset.only(*self.list_fields)
+        elif self.action == 'retrieve':
+            queryset = queryset.prefetch_related(*portfolio_detail_prefetches())
+        return queryset
     
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -43,7 +88,7 @@ class PortfolioItemViewSet(viewsets.ReadOnlyModelViewSet):
         return PortfolioItemListSerializer
 
 
-class ServiceListView(generics.ListAPIView):
+class ServiceListView(ConditionalListMixin, CachedListMixin, generics.ListAPIView):
     """
     Public API endpoint for services.
     
@@ -51,12 +96,17 @@ class ServiceListView(generics.ListAPIView):
     """
     permission_classes = [AllowAny]
     serializer_class = ServiceSerializer
+    # Admin writes bump the list version, so entries can live for a day
+    list_cache_timeout = 60 * 60 * 24
+    
+    # Columns ServiceSerializer renders; the audit columns stay unread
+    list_fields = ['id', 'title', 'icon', 'image_variants', 'short_description', 'order']
     
     def get_queryset(self):
-        return Service.objects.filter(is_active=True).order_by('order')
+        return Service.objects.filter(is_active=True).order_by('order').only(*self.list_fields)
 
 
-class PartnerListView(generics.ListAPIView):
+class PartnerListView(ConditionalListMixin, CachedListMixin, generics.ListAPIView):
     """
     Public API endpoint for partners.
     
@@ -64,12 +114,15 @@ class PartnerListView(generics.ListAPIView):
     """
     permission_classes = [AllowAny]
     serializer_class = PartnerSerializer
+    list_cache_timeout = 60 * 60 * 24
+    
+    list_fields = ['id', 'name', 'logo', 'image_variants', 'website', 'order']
     
     def get_queryset(self):
-        return Partner.objects.filter(is_active=True).order_by('order')
+        return Partner.objects.filter(is_active=True).order_by('order').only(*self.list_fields)
 
 
-class TestimonialListView(generics.ListAPIView):
+class TestimonialListView(ConditionalListMixin, CachedListMixin, generics.ListAPIView):
     """
     Public API endpoint for testimonials.
     
@@ -80,26 +133,41 @@ class TestimonialListView(generics.ListAPIView):
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['is_featured']
     
+    list_fields = [
+        'id', 'client_name', 'role', 'photo', 'image_variants', 'content',
+        'rating', 'is_featured'
+    ]
+    
     def get_queryset(self):
-        return Testimonial.objects.filter(is_active=True)
+        return Testimonial.objects.filter(is_active=True).only(*self.list_fields)
 
 
-class BlogPostViewSet(viewsets.ReadOnlyModelViewSet):
+class BlogPostViewSet(ConditionalListMixin, ConditionalRetrieveMixin, viewsets.ReadOnlyModelViewSet):
     """
     Public API endpoint for blog posts.
     
     list: GET /api/blog/
-    retrieve: GET /api/blog/{slug}/
+    retrieve: GET /api/blog/{slug}/ (ETag; unchanged articles get a 304)
     """
     permission_classes = [AllowAny]
     lookup_field = 'slug'
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [filters.OrderingFilter, TrigramSearchFilter]
     search_fields = ['title', 'content', 'excerpt']
     ordering_fields = ['published_date', 'created_at']
     ordering = ['-published_date']
+    pagination_class = EstimatedCountPagination
+    
+    # Columns BlogPostListSerializer renders (content is left out)
+    list_fields = [
+        'id', 'title', 'slug', 'thumbnail', 'image_variants', 'excerpt',
+        'published_date', 'created_at'
+    ]
     
     def get_queryset(self):
-        return BlogPost.objects.filter(is_published=True)
+        queryset = BlogPost.objects.filter(is_published=True)
+        if self.action == 'list':
+            queryset = queryset.only(*self.list_fields)
+        return queryset
     
     def get_serializer_class(self):
         if self.action == 'retrieve':
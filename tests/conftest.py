@@ -2,13 +2,123 @@
 Pytest configuration and fixtures for Belle House Backend tests.
 """
 
+import functools
+
 import pytest
+from django.conf import settings as django_settings
 from django.contrib.auth import get_user_model
 from rest_framework.test import APIClient
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 
 User = get_user_model()
 
+# Hashers from config.settings, before fast_password_hasher changes them
+PASSWORD_HASHERS = list(django_settings.PASSWORD_HASHERS)
+
+# 1x1 RGB PNG for image fields
+TEST_PNG = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0cIDATx\x9cc\xf8\x0f\x00\x00\x01\x01\x00\x05\x18\xd8N\x00\x00\x00\x00IEND\xaeB`\x82'
+
+
+def png_upload(name='test.png'):
+    """Return TEST_PNG as an uploaded file."""
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    return SimpleUploadedFile(name, TEST_PNG, content_type='image/png')
+
+
+@functools.lru_cache(maxsize=None)
+def _jpeg_bytes(size):
+    """Encode a white JPEG of the given size; bytes are immutable, so shared."""
+    from io import BytesIO
+    from PIL import Image
+    
+    buffer = BytesIO()
+    Image.new('RGB', size, 'white').save(buffer, format='JPEG')
+    return buffer.getvalue()
+
+
+def jpeg_upload(name='test.jpg', size=(800, 400)):
+    """Return a white JPEG as an uploaded file, encoded once per size."""
+    from django.core.files.uploadedfile import SimpleUploadedFile
+    return SimpleUploadedFile(name, _jpeg_bytes(size), content_type='image/jpeg')
+
+# Tokens signed once per session. The database is rolled back between
+# tests but fixture users come back with the same pk, and a token only
+# carries the user id, so (pk, username) identifies it. Blacklisting a
+# refresh token writes a database row and a cache entry, and both are
+# reset between tests.
+_access_tokens = {}
+_refresh_tokens = {}
+
+
+def access_token(user):
+    """Return an encoded access token for a user."""
+    key = (user.pk, user.username)
+    if key not in _access_tokens:
+        # An access token alone: no refresh token, so no OutstandingToken row
+        _access_tokens[key] = str(AccessToken.for_user(user))
+    return _access_tokens[key]
+
+
+def refresh_token(user):
+    """Return an encoded refresh token for a user."""
+    key = (user.pk, user.username)
+    if key not in _refresh_tokens:
+        _refresh_tokens[key] = str(RefreshToken.for_user(user))
+    return _refresh_tokens[key]
+
+
+def bearer_token(user):
+    """Return the Authorization header value for a user."""
+    return f'Bearer {access_token(user)}'
+
+
+# Database fixtures below are function-scoped on purpose: pytest-django
+# builds the schema once per session (kept with --reuse-db) and runs each
+# django_db test inside a transaction that is rolled back afterwards, so
+# no test truncates tables. Commit hooks are exercised explicitly with
+# django_capture_on_commit_callbacks.
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache (the database is rolled back too)."""
+    from django.core.cache import cache
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def shared_cache(settings):
+    """The suite runs in one process, so its LocMem cache is as good as shared."""
+    settings.SHARED_CACHE = True
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hasher(settings):
+    """
+    Hash new passwords with MD5; most tests create users.
+    
+    The configured hashers stay listed after it, so hashes they produced
+    still verify. Tests about the production hasher restore the list with
+    settings.PASSWORD_HASHERS = PASSWORD_HASHERS.
+    """
+    settings.PASSWORD_HASHERS = [
+        'django.contrib.auth.hashers.MD5PasswordHasher',
+        *PASSWORD_HASHERS,
+    ]
+
+
+@pytest.fixture(autouse=True)
+def no_notifications(settings):
+    """
+    Don't queue client notifications from save signals.
+    
+    Fixtures create projects, updates and invoices that no test wants
+    notified; notification tests set ENABLE_NOTIFICATIONS back to True.
+    """
+    settings.ENABLE_NOTIFICATIONS = False
+
 
 @pytest.fixture
 def api_client():
@@ -80,19 +190,29 @@ def admin_user(create_user):
 @pytest.fixture
 def auth_client(api_client, regular_user):
     """Return an authenticated API client for regular user."""
-    refresh = RefreshToken.for_user(regular_user)
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+    api_client.credentials(HTTP_AUTHORIZATION=bearer_token(regular_user))
     return api_client
 
 
 @pytest.fixture
 def admin_client(api_client, admin_user):
     """Return an authenticated API client for admin user."""
-    refresh = RefreshToken.for_user(admin_user)
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+    api_client.credentials(HTTP_AUTHORIZATION=bearer_token(admin_user))
     return api_client
 
 
+@pytest.fixture
+def admin_site_client(client, admin_user, settings):
+    """Return a Django test client logged in to the admin site."""
+    # The manifest storage needs collectstatic; plain storage renders without
+    settings.STORAGES = {
+        **settings.STORAGES,
+        'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'},
+    }
+    client.force_login(admin_user)
+    return client
+
+
 @pytest.fixture
 def client_profile(db, regular_user):
     """Create a client profile for the regular user."""
@@ -130,6 +250,42 @@ def sample_project(db, client_profile, admin_user):
     return project
 
 
+@pytest.fixture
+def other_client_project(db, create_user, admin_user):
+    """Create a project belonging to another client."""
+    from clients.models import ClientProfile, ActiveProject
+    from django.utils import timezone
+    from datetime import timedelta
+    
+    other_user = create_user(email='other@example.com', username='otheruser')
+    other_profile = ClientProfile.objects.create(
+        user=other_user,
+        phone='+227 92 22 22 22'
+    )
+    return ActiveProject.objects.create(
+        client=other_profile,
+        project_name='Other Client Project',
+        current_phase='FONDATION',
+        start_date=timezone.now().date(),
+        estimated_completion=timezone.now().date() + timedelta(days=180),
+        created_by=admin_user
+    )
+
+
+@pytest.fixture
+def sample_promotion(db, admin_user, in_memory_storage):
+    """Create an active app promotion."""
+    from clients.models import AppPromotion
+    
+    return AppPromotion.objects.create(
+        title='Special Offer',
+        banner_image=png_upload('banner.png'),
+        is_active=True,
+        order=1,
+        created_by=admin_user
+    )
+
+
 @pytest.fixture
 def sample_invoice(db, sample_project, admin_user):
     """Create a sample invoice."""
@@ -149,20 +305,24 @@ def sample_invoice(db, sample_project, admin_user):
 
 
 @pytest.fixture
-def sample_portfolio_item(db, admin_user):
+def in_memory_storage(settings):
+    """Keep uploaded files in memory instead of writing them to MEDIA_ROOT."""
+    settings.STORAGES = {
+        **settings.STORAGES,
+        'default': {'BACKEND': 'tests.storage.InMemoryStorage'},
+    }
+
+
+@pytest.fixture
+def sample_portfolio_item(db, admin_user, in_memory_storage):
     """Create a sample portfolio item."""
     from marketing.models import PortfolioItem
-    from django.core.files.uploadedfile import SimpleUploadedFile
-    
-    # Create a simple test image
-    image_content = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0cIDATx\x9cc\xf8\x0f\x00\x00\x01\x01\x00\x05\x18\xd8N\x00\x00\x00\x00IEND\xaeB`\x82'
-    test_image = SimpleUploadedFile('test.png', image_content, content_type='image/png')
     
     item = PortfolioItem.objects.create(
         title='Villa Moderne Test',
         slug='villa-moderne-test',
         category='REALIZATION',
-        main_image=test_image,
+        main_image=png_upload(),
         description='A beautiful modern villa',
         area='350 m²',
         task='Conception et Réalisation',
@@ -175,3 +335,54 @@ def sample_portfolio_item(db, admin_user):
         created_by=admin_user
     )
     return item
+
+
+@pytest.fixture
+def sample_service(db, in_memory_storage):
+    """Create an active service."""
+    from marketing.models import Service
+    
+    return Service.objects.create(
+        title='Construction',
+        icon=png_upload('icon.png'),
+        short_description='Construction de maisons',
+        order=1,
+        is_active=True
+    )
+
+
+@pytest.fixture
+def sample_partner(db):
+    """Create an active partner."""
+    from marketing.models import Partner
+    
+    return Partner.objects.create(name='Test Partner', is_active=True, order=1)
+
+
+@pytest.fixture
+def sample_testimonial(db):
+    """Create an active testimonial."""
+    from marketing.models import Testimonial
+    
+    return Testimonial.objects.create(
+        client_name='M. Test',
+        content='Excellent service!',
+        rating=5,
+        is_active=True
+    )
+
+
+@pytest.fixture
+def sample_blog_post(db, in_memory_storage):
+    """Create a published blog post."""
+    from marketing.models import BlogPost
+    from django.utils import timezone
+    
+    return BlogPost.objects.create(
+        title='Test Article',
+        slug='test-article',
+        content='Test content here.',
+        thumbnail=png_upload('thumb.png'),
+        is_published=True,
+        published_date=timezone.now()
+    )
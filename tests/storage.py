@@ -0,0 +1,48 @@
+"""
+In-memory file storage for tests.
+"""
+
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import Storage
+from django.utils.deconstruct import deconstructible
+
+
+@deconstructible
+class InMemoryStorage(Storage):
+    """
+    Dict-backed storage, standing in for Django 5.1's InMemoryStorage.
+    
+    Uploads never reach MEDIA_ROOT, so fixtures that attach an image
+    cost no file-system calls. Contents live as long as the instance,
+    i.e. until the storages handler is reset by a settings change.
+    """
+    
+    def __init__(self):
+        self._files = {}
+    
+    def _open(self, name, mode='rb'):
+        if name not in self._files:
+            raise FileNotFoundError(name)
+        return ContentFile(self._files[name], name=name)
+    
+    def _save(self, name, content):
+        buffer = BytesIO()
+        for chunk in content.chunks():
+            buffer.write(chunk.encode() if isinstance(chunk, str) else chunk)
+        self._files[name] = buffer.getvalue()
+        return name
+    
+    def delete(self, name):
+        self._files.pop(name, None)
+    
+    def exists(self, name):
+        return name in self._files
+    
+    def size(self, name):
+        return len(self._files[name])
+    
+    def url(self, name):
+        return f'{settings.MEDIA_URL}{name}'
@@ -29,6 +29,20 @@ class TestRegistration:
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
     
+    def test_taken_email_check_is_cached(self, regular_user, django_assert_num_queries):
+        """Test that a taken email is answered from the cache on retries."""
+        from core.serializers import user_exists
+        
+        with django_assert_num_queries(1):
+            assert user_exists('email', regular_user.email)
+        with django_assert_num_queries(0):
+            assert user_exists('email', regular_user.email)
+        
+        # Free emails are never cached
+        with django_assert_num_queries(2):
+            assert not user_exists('email', 'free@example.com')
+            assert not user_exists('email', 'free@example.com')
+    
     def test_register_missing_fields(self, api_client):
         """Test registration with missing required fields."""
         url = reverse('register')
@@ -77,6 +91,94 @@ class TestLogin:
         assert 'tokens' in response.data
         assert 'access' in response.data['tokens']
     
+    def test_login_profile_is_cached_until_client_changes(self, api_client, client_profile):
+        """Test that the login profile is reused and dropped on profile save."""
+        from unittest import mock
+        from core.serializers import UserProfileSerializer
+        
+        url = reverse('login')
+        data = {'username': client_profile.user.username, 'password': 'TestPass123!'}
+        
+        with mock.patch.object(
+            UserProfileSerializer, 'to_representation', autospec=True,
+            side_effect=UserProfileSerializer.to_representation
+        ) as to_representation:
+            api_client.post(url, data, format='json')
+            api_client.post(url, data, format='json')
+            assert to_representation.call_count == 1
+            
+            client_profile.phone = '+227 91 11 11 11'
+            client_profile.save()
+            response = api_client.post(url, data, format='json')
+        
+        assert to_representation.call_count == 2
+        assert response.data['user']['phone'] == '+227 91 11 11 11'
+    
+    def test_login_profile_not_cached_without_shared_cache(self, api_client, client_profile, settings):
+        """Test that a per-process cache can't serve another worker's stale profile."""
+        from django.core.cache import cache
+        from core.serializers import profile_cache_key
+        
+        settings.SHARED_CACHE = False
+        data = {'username': client_profile.user.username, 'password': 'TestPass123!'}
+        response = api_client.post(reverse('login'), data, format='json')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert cache.get(profile_cache_key(client_profile.user_id)) is None
+    
+    def test_login_with_email_uses_one_query(self, regular_user, django_assert_num_queries):
+        """Test that email login finds the user in a single query."""
+        from core.serializers import LoginSerializer
+        
+        serializer = LoginSerializer(data={
+            'email': regular_user.email.upper(),
+            'password': 'TestPass123!'
+        })
+        
+        with django_assert_num_queries(1):
+            assert serializer.is_valid()
+        assert serializer.validated_data['user'] == regular_user
+    
+    def test_login_signs_each_token_once(self, api_client, regular_user):
+        """Test that the refresh token is signed once for both the blacklist and the response."""
+        from unittest.mock import patch
+        from rest_framework_simplejwt.backends import TokenBackend
+        from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+        
+        url = reverse('login')
+        data = {
+            'username': regular_user.username,
+            'password': 'TestPass123!'
+        }
+        
+        with patch.object(TokenBackend, 'encode', autospec=True, side_effect=TokenBackend.encode) as mock_encode:
+            response = api_client.post(url, data, format='json')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert mock_encode.call_count == 2
+        outstanding = OutstandingToken.objects.get(user=regular_user)
+        assert outstanding.token == response.data['tokens']['refresh']
+    
+    def test_login_upgrades_pbkdf2_hash_to_bcrypt(self, api_client, regular_user, settings):
+        """Test that a legacy PBKDF2 password is rehashed with bcrypt on login."""
+        from django.contrib.auth.hashers import make_password
+        from tests.conftest import PASSWORD_HASHERS
+        
+        settings.PASSWORD_HASHERS = PASSWORD_HASHERS
+        regular_user.password = make_password('TestPass123!', hasher='pbkdf2_sha256')
+        regular_user.save(update_fields=['password'])
+        
+        url = reverse('login')
+        data = {
+            'username': regular_user.username,
+            'password': 'TestPass123!'
+        }
+        response = api_client.post(url, data, format='json')
+        
+        assert response.status_code == status.HTTP_200_OK
+        regular_user.refresh_from_db()
+        assert regular_user.password.startswith('bcrypt_sha256$')
+    
     def test_login_wrong_password(self, api_client, regular_user):
         """Test login with wrong password."""
         url = reverse('login')
@@ -108,15 +210,41 @@ class TestLogout:
     
     def test_logout_success(self, auth_client, regular_user):
         """Test successful logout."""
-        from rest_framework_simplejwt.tokens import RefreshToken
+        from tests.conftest import refresh_token
         
-        refresh = RefreshToken.for_user(regular_user)
         url = reverse('logout')
-        data = {'refresh': str(refresh)}
+        data = {'refresh': refresh_token(regular_user)}
         response = auth_client.post(url, data, format='json')
         
         assert response.status_code == status.HTTP_200_OK
     
+    def test_logged_out_refresh_token_rejected(self, auth_client, api_client, regular_user):
+        """Test that a refresh token blacklisted at logout can't be refreshed."""
+        from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+        from core.tokens import get_tokens_for_user
+        
+        refresh = get_tokens_for_user(regular_user)['refresh']
+        response = auth_client.post(reverse('logout'), {'refresh': refresh}, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        
+        response = api_client.post(reverse('token_refresh'), {'refresh': refresh}, format='json')
+        
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert BlacklistedToken.objects.count() == 1
+    
+    def test_blacklist_survives_cache_loss(self, auth_client, api_client, regular_user):
+        """Test that a logged-out token stays rejected after the cache is flushed."""
+        from django.core.cache import cache
+        from core.tokens import get_tokens_for_user
+        
+        refresh = get_tokens_for_user(regular_user)['refresh']
+        auth_client.post(reverse('logout'), {'refresh': refresh}, format='json')
+        cache.clear()
+        
+        response = api_client.post(reverse('token_refresh'), {'refresh': refresh}, format='json')
+        
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    
     def test_logout_unauthenticated(self, api_client):
         """Test logout without authentication."""
         url = reverse('logout')
@@ -205,11 +333,10 @@ class TestJWTTokens:
     
     def test_token_refresh(self, api_client, regular_user):
         """Test refreshing JWT token."""
-        from rest_framework_simplejwt.tokens import RefreshToken
+        from tests.conftest import refresh_token
         
-        refresh = RefreshToken.for_user(regular_user)
         url = reverse('token_refresh')
-        data = {'refresh': str(refresh)}
+        data = {'refresh': refresh_token(regular_user)}
         response = api_client.post(url, data, format='json')
         
         assert response.status_code == status.HTTP_200_OK
@@ -217,11 +344,45 @@ class TestJWTTokens:
     
     def test_token_verify(self, api_client, regular_user):
         """Test verifying JWT token."""
-        from rest_framework_simplejwt.tokens import RefreshToken
+        from tests.conftest import access_token
         
-        refresh = RefreshToken.for_user(regular_user)
         url = reverse('token_verify')
-        data = {'token': str(refresh.access_token)}
+        data = {'token': access_token(regular_user)}
         response = api_client.post(url, data, format='json')
         
         assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+class TestPasswordReset:
+    """Tests for password reset request endpoint."""
+    
+    def test_reset_request_does_not_query_users(self, api_client, django_assert_num_queries):
+        """Test that the reset request response never looks the account up."""
+        url = reverse('password_reset')
+        
+        with django_assert_num_queries(0):
+            response = api_client.post(url, {'email': 'Someone@Example.com'}, format='json')
+        
+        assert response.status_code == status.HTTP_200_OK
+
+
+class TestSharedCacheCheck:
+    """Tests for the production cache system check."""
+    
+    def test_warns_without_shared_cache_in_production(self, settings):
+        """Test that DEBUG off without CACHE_URL is reported, not fatal."""
+        from core.checks import check_shared_cache
+        
+        settings.DEBUG = False
+        settings.SHARED_CACHE = False
+        
+        assert [w.id for w in check_shared_cache(None)] == ['core.W001']
+    
+    def test_quiet_with_shared_cache(self, settings):
+        """Test that a configured shared cache passes the check."""
+        from core.checks import check_shared_cache
+        
+        settings.DEBUG = False
+        
+        assert check_shared_cache(None) == []
@@ -122,6 +122,89 @@ class TestInvoiceAutoNumbering:
         num2 = int(response2.data['invoice_number'].split('/')[-1])
         
         assert num2 == num1 + 1
+    
+    def test_invoice_counter_seeded_from_existing_numbers(self, sample_project):
+        """Test that the counter continues after invoices numbered before it existed."""
+        from django.utils import timezone
+        from billing.models import Invoice
+        from core.models import ReferenceCounter
+        from core.utils import reference_sequence
+        
+        year = timezone.now().year
+        # Numbered already, so save() has nothing to generate; one INSERT
+        Invoice.objects.bulk_create([
+            Invoice(
+                project=sample_project,
+                subject=f'Invoice {num}',
+                invoice_number=f'BH/{year}/{num}',
+                issue_date=timezone.now().date(),
+                due_date=timezone.now().date()
+            )
+            for num in (9, 10)
+        ])
+        ReferenceCounter.objects.all().delete()
+        
+        invoice = Invoice.objects.create(
+            project=sample_project,
+            subject='Next invoice',
+            issue_date=timezone.now().date(),
+            due_date=timezone.now().date()
+        )
+        
+        assert invoice.invoice_number == f'BH/{year}/11'
+        sequence = reference_sequence('BH', Invoice, 'invoice_number')
+        assert ReferenceCounter.objects.get(prefix=sequence, year=year).last_number == 11
+    
+    def test_other_models_do_not_share_the_invoice_counter(self, sample_invoice):
+        """Test that generate_reference with the same prefix keeps its own sequence."""
+        from django.utils import timezone
+        from billing.models import Invoice
+        from clients.models import ActiveProject
+        from core.utils import generate_reference
+        
+        year = timezone.now().year
+        invoice_num = int(sample_invoice.invoice_number.split('/')[-1])
+        
+        assert generate_reference('BH', ActiveProject, 'project_name') == f'BH/{year}/001'
+        assert generate_reference('BH', Invoice, 'invoice_number', digits=1) == \
+            f'BH/{year}/{invoice_num + 1}'
+    
+    def test_next_number_is_one_statement(self, db, django_assert_num_queries):
+        """Test that an existing counter is bumped and read in a single query."""
+        from core.models import ReferenceCounter
+        from core.utils import next_reference_number
+        
+        ReferenceCounter.objects.create(prefix='BH', year=2030, last_number=41)
+        
+        with django_assert_num_queries(1):
+            assert next_reference_number('BH', 2030) == 42
+        assert ReferenceCounter.objects.get(prefix='BH', year=2030).last_number == 42
+    
+    def test_failed_save_gives_number_back(self, sample_project):
+        """Test that an invoice whose INSERT fails doesn't burn its number."""
+        from unittest import mock
+        from django.db import IntegrityError
+        from django.utils import timezone
+        from billing.models import Invoice
+        
+        def new_invoice():
+            return Invoice(
+                project=sample_project,
+                subject='Invoice',
+                issue_date=timezone.now().date(),
+                due_date=timezone.now().date()
+            )
+        
+        first = new_invoice()
+        first.save()
+        with mock.patch('django.db.models.Model.save_base', side_effect=IntegrityError):
+            with pytest.raises(IntegrityError):
+                new_invoice().save()
+        second = new_invoice()
+        second.save()
+        
+        first_num = int(first.invoice_number.split('/')[-1])
+        assert second.invoice_number.split('/')[-1] == str(first_num + 1)
 
 
 @pytest.mark.django_db
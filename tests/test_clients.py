@@ -43,13 +43,25 @@ class TestClientProfile:
 class TestMyProjects:
     """Tests for client's projects endpoints."""
     
-    def test_list_my_projects(self, auth_client, sample_project):
-        """Test listing client's projects."""
+    def test_list_my_projects(self, auth_client, sample_project, django_assert_num_queries):
+        """Test listing client's projects in a fixed number of queries."""
+        from clients.models import ActiveProject
+        
+        for i in range(4):
+            ActiveProject.objects.create(
+                client=sample_project.client,
+                project_name=f'Projet {i}',
+                start_date=sample_project.start_date,
+                estimated_completion=sample_project.estimated_completion
+            )
         url = reverse('my-projects-list')
-        response = auth_client.get(url)
+        
+        # user, client profile, COUNT, page
+        with django_assert_num_queries(4):
+            response = auth_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data['results']) >= 1
+        assert len(response.data['results']) == 5
     
     def test_retrieve_my_project(self, auth_client, sample_project):
         """Test retrieving a single project."""
@@ -59,22 +71,29 @@ class TestMyProjects:
         assert response.status_code == status.HTTP_200_OK
         assert response.data['project_name'] == sample_project.project_name
     
-    def test_project_updates(self, auth_client, sample_project, admin_user):
-        """Test getting project updates."""
+    def test_project_updates(
+        self, auth_client, sample_project, admin_user, django_assert_num_queries
+    ):
+        """Test getting project updates in a fixed number of queries."""
         from clients.models import ProjectUpdate
         
-        ProjectUpdate.objects.create(
-            project=sample_project,
-            title='Foundation Complete',
-            description='Foundation work is done.',
-            created_by=admin_user
-        )
-        
+        ProjectUpdate.objects.bulk_create([
+            ProjectUpdate(
+                project=sample_project,
+                title=f'Étape {i}',
+                description='Foundation work is done.',
+                created_by=admin_user
+            )
+            for i in range(5)
+        ])
         url = reverse('my-projects-updates', args=[sample_project.id])
-        response = auth_client.get(url)
+        
+        # user, client profile, project, updates
+        with django_assert_num_queries(4):
+            response = auth_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) >= 1
+        assert len(response.data) == 5
     
     def test_project_invoices(self, auth_client, sample_invoice):
         """Test getting project invoices."""
@@ -83,31 +102,9 @@ class TestMyProjects:
         
         assert response.status_code == status.HTTP_200_OK
     
-    def test_cannot_access_other_client_project(self, auth_client, create_user, admin_user, db):
+    def test_cannot_access_other_client_project(self, auth_client, other_client_project):
         """Test that client cannot access another client's project."""
-        from clients.models import ClientProfile, ActiveProject
-        from django.utils import timezone
-        from datetime import timedelta
-        
-        # Create another user with their own project
-        other_user = create_user(
-            email='other@example.com',
-            username='otheruser'
-        )
-        other_profile = ClientProfile.objects.create(
-            user=other_user,
-            phone='+227 92 22 22 22'
-        )
-        other_project = ActiveProject.objects.create(
-            client=other_profile,
-            project_name='Other Client Project',
-            current_phase='FONDATION',
-            start_date=timezone.now().date(),
-            estimated_completion=timezone.now().date() + timedelta(days=180),
-            created_by=admin_user
-        )
-        
-        url = reverse('my-projects-detail', args=[other_project.id])
+        url = reverse('my-projects-detail', args=[other_client_project.id])
         response = auth_client.get(url)
         
         assert response.status_code == status.HTTP_404_NOT_FOUND
@@ -141,23 +138,8 @@ class TestFCMToken:
 class TestAppPromotions:
     """Tests for app promotions endpoint."""
     
-    def test_list_promotions(self, auth_client, admin_user, db):
+    def test_list_promotions(self, auth_client, sample_promotion):
         """Test listing active promotions."""
-        from clients.models import AppPromotion
-        from django.core.files.uploadedfile import SimpleUploadedFile
-        
-        # Create a test banner image
-        image_content = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0cIDATx\x9cc\xf8\x0f\x00\x00\x01\x01\x00\x05\x18\xd8N\x00\x00\x00\x00IEND\xaeB`\x82'
-        test_banner = SimpleUploadedFile('banner.png', image_content, content_type='image/png')
-        
-        AppPromotion.objects.create(
-            title='Special Offer',
-            banner_image=test_banner,
-            is_active=True,
-            order=1,
-            created_by=admin_user
-        )
-        
         url = reverse('promotions')
         response = auth_client.get(url)
         
@@ -0,0 +1,358 @@
+"""
+Tests for Leads Admin API endpoints.
+"""
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+
+@pytest.fixture
+def sample_leads(db, sample_portfolio_item):
+    """Create a few construction leads interested in a portfolio item."""
+    from leads.models import ConstructionLead
+    
+    return [
+        ConstructionLead.objects.create(
+            name=f'Lead {i}',
+            phone='+227 90 00 00 00',
+            email=f'lead{i}@example.com',
+            interested_in=sample_portfolio_item,
+            message='Je veux construire.'
+        )
+        for i in range(3)
+    ]
+
+
+@pytest.mark.django_db
+class TestPublicLeadForms:
+    """Tests for the public lead submission endpoints."""
+    
+    def test_contact_form_renders_json_for_browsers(self, api_client):
+        """Public forms never render the browsable API."""
+        url = reverse('contact')
+        response = api_client.post(url, {
+            'name': 'Awa',
+            'email': 'Awa@Example.com',
+            'subject': 'Devis',
+            'message': 'Bonjour',
+        }, format='json', HTTP_ACCEPT='text/html,*/*')
+        
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response['Content-Type'] == 'application/json'
+        assert response.json()['data']['email'] == 'awa@example.com'
+    
+    def test_duplicate_contact_submission_is_stored_once(self, api_client):
+        """Resubmitting the same message answers 201 but stores one inquiry."""
+        from leads.models import ContactInquiry
+        
+        url = reverse('contact')
+        data = {
+            'name': 'Awa',
+            'email': 'awa@example.com',
+            'subject': 'Devis',
+            'message': 'Bonjour',
+        }
+        responses = [api_client.post(url, data, format='json') for _ in range(3)]
+        api_client.post(url, {**data, 'message': 'Autre question'}, format='json')
+        
+        assert {r.status_code for r in responses} == {status.HTTP_201_CREATED}
+        assert ContactInquiry.objects.filter(email='awa@example.com').count() == 2
+    
+    def test_contact_submission_is_audited(self, api_client):
+        """Test that a stored inquiry gets its auditlog create entry."""
+        from auditlog.models import LogEntry
+        from leads.models import ContactInquiry
+        
+        data = {'name': 'Awa', 'email': 'awa@example.com', 'subject': 'Devis', 'message': 'Bonjour'}
+        api_client.post(reverse('contact'), data, format='json')
+        
+        inquiry = ContactInquiry.objects.get(email='awa@example.com')
+        assert LogEntry.objects.get_for_object(inquiry).filter(
+            action=LogEntry.Action.CREATE
+        ).exists()
+    
+    def test_orjson_renderer_matches_drf_output(self):
+        """Types orjson doesn't know fall back to DRF's encoder."""
+        import datetime
+        from decimal import Decimal
+        from django.utils.translation import gettext_lazy
+        from rest_framework.renderers import JSONRenderer
+        from core.renderers import ORJSONRenderer
+        
+        data = {
+            'amount': Decimal('1500.50'),
+            'label': gettext_lazy('Nom'),
+            'items': [1, 'é'],
+            'created_at': datetime.datetime(2025, 1, 2, 3, 4, 5, 678000, tzinfo=datetime.timezone.utc),
+            'date': datetime.date(2025, 1, 2),
+            'text': 'ligne\u2028suivante\u2029',
+            'by_year': {2024: 3, 2025: 5},
+        }
+        
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+@pytest.mark.django_db
+class TestAdminConstructionLeads:
+    """Tests for admin construction lead endpoints."""
+    
+    def test_list_leads_query_count_is_constant(
+        self, admin_client, admin_user, sample_leads, django_assert_num_queries
+    ):
+        """Test that interested_in titles don't trigger a query per lead."""
+        url = reverse('admin-leads-list')
+        
+        # user lookup (JWT auth), page; cursor pagination runs no COUNT
+        with django_assert_num_queries(2):
+            response = admin_client.get(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+        titles = {lead['interested_in_title'] for lead in response.data['results']}
+        assert titles == {sample_leads[0].interested_in.title}
+        assert 'count' not in response.data
+    
+    def test_list_pages_with_cursor(self, monkeypatch, admin_client, admin_user, sample_leads):
+        """Test that following the next cursor walks every lead once."""
+        from core.pagination import CreatedAtCursorPagination
+        
+        monkeypatch.setattr(CreatedAtCursorPagination, 'page_size', 2)
+        url = reverse('admin-leads-list')
+        seen = []
+        pages = 0
+        
+        response = admin_client.get(url)
+        while True:
+            seen.extend(lead['id'] for lead in response.data['results'])
+            pages += 1
+            if not response.data['next']:
+                break
+            response = admin_client.get(response.data['next'])
+        
+        assert pages == 2
+        assert sorted(seen) == sorted(lead.id for lead in sample_leads)
+    
+    def test_list_rows_match_detail_serializer(self, sample_leads):
+        """The hand-built list rows match the regular field output."""
+        from leads.serializers import (
+            ConstructionLeadDetailSerializer, ConstructionLeadListSerializer
+        )
+        
+        lead = sample_leads[0]
+        without_interest = sample_leads[1]
+        without_interest.interested_in = None
+        
+        for instance in (lead, without_interest):
+            assert ConstructionLeadListSerializer(instance).data == \
+                ConstructionLeadDetailSerializer(instance).data
+    
+    def test_unchanged_list_returns_not_modified(
+        self, admin_client, admin_user, sample_leads, django_assert_num_queries
+    ):
+        """Test that polling an unchanged list revalidates via ETag."""
+        url = reverse('admin-leads-list')
+        etag = admin_client.get(url)['ETag']
+        
+        # user lookup (JWT auth) only
+        with django_assert_num_queries(1):
+            response = admin_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        
+        # Status actions write with update(), which must still bust the ETag
+        admin_client.post(reverse('admin-leads-mark-lost', args=[sample_leads[0].id]))
+        response = admin_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+    
+    def test_no_etag_without_shared_cache(self, admin_client, sample_leads, settings):
+        """Test that per-process caches don't produce ETags other workers can't bust."""
+        settings.SHARED_CACHE = False
+        
+        response = admin_client.get(reverse('admin-leads-list'))
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert 'ETag' not in response
+    
+    def test_contact_action_updates_status(self, admin_client, admin_user, sample_leads):
+        """Test that marking a lead contacted writes status and auditor."""
+        from leads.models import ConstructionLead
+        
+        lead = sample_leads[0]
+        url = reverse('admin-leads-contact', args=[lead.id])
+        response = admin_client.post(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+        lead.refresh_from_db()
+        assert lead.status == ConstructionLead.Status.CONTACTED
+        assert lead.updated_by == admin_user
+    
+    def test_status_action_is_audited(self, admin_client, admin_user, sample_leads):
+        """Test that status actions leave an auditlog entry with the change."""
+        from auditlog.models import LogEntry
+        
+        lead = sample_leads[0]
+        admin_client.post(reverse('admin-leads-mark-lost', args=[lead.id]))
+        
+        entry = LogEntry.objects.get_for_object(lead).latest('timestamp')
+        assert entry.action == LogEntry.Action.UPDATE
+        assert entry.changes_dict['status'] == ['NEW', 'LOST']
+    
+    def test_admin_cannot_create_leads(self, admin_client):
+        """Test that leads can only be created through the public form."""
+        url = reverse('admin-leads-list')
+        response = admin_client.post(url, {'name': 'Lead'}, format='json')
+        
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+    
+    def test_status_action_unknown_lead(self, admin_client):
+        """Test that actions on a missing lead return 404."""
+        url = reverse('admin-leads-mark-lost', args=[999999])
+        response = admin_client.post(url)
+        
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestLeadDjangoAdmin:
+    """Tests for the Django admin change list of leads."""
+    
+    def test_changelist_hides_deleted_unless_filtered(self, admin_site_client, sample_leads):
+        """Soft-deleted leads only show up through the is_deleted filter."""
+        client = admin_site_client
+        deleted = sample_leads[0]
+        deleted.soft_delete()
+        url = reverse('admin:leads_constructionlead_changelist')
+        
+        response = client.get(url)
+        assert response.status_code == 200
+        assert deleted not in response.context['cl'].result_list
+        assert response.context['cl'].result_count == 2
+        
+        response = client.get(url, {'is_deleted__exact': '1'})
+        assert list(response.context['cl'].result_list) == [deleted]
+        
+        change_url = reverse('admin:leads_constructionlead_change', args=[deleted.id])
+        assert client.get(change_url).status_code == 200
+
+
+    def test_change_form_does_not_list_every_portfolio_item(self, admin_site_client, sample_leads):
+        """interested_in is an autocomplete, not a <select> of the whole portfolio."""
+        from marketing.models import PortfolioItem
+        
+        for i in range(3):
+            PortfolioItem.objects.create(title=f'Villa {i}', category='REALIZATION', description='...')
+        lead = sample_leads[0]
+        url = reverse('admin:leads_constructionlead_change', args=[lead.pk])
+        response = admin_site_client.get(url)
+        
+        assert response.status_code == 200
+        # Only the selected item is rendered
+        assert 'Villa Moderne Test' in response.content.decode()
+        assert 'Villa 0' not in response.content.decode()
+
+
+@pytest.mark.django_db
+class TestAdminContactInquiries:
+    """Tests for admin contact inquiry endpoints."""
+    
+    def test_retrieve_marks_inquiry_read(self, admin_client, admin_user):
+        """Test that opening an inquiry marks it read by the viewing admin."""
+        from auditlog.models import LogEntry
+        from leads.models import ContactInquiry
+        
+        inquiry = ContactInquiry.objects.create(
+            name='Visiteur',
+            email='visiteur@example.com',
+            subject='Devis',
+            message='Bonjour'
+        )
+        
+        url = reverse('admin-inquiries-detail', args=[inquiry.id])
+        response = admin_client.get(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['is_read'] is True
+        inquiry.refresh_from_db()
+        assert inquiry.is_read is True
+        assert inquiry.updated_by == admin_user
+        assert LogEntry.objects.get_for_object(inquiry).filter(
+            action=LogEntry.Action.UPDATE
+        ).exists()
+    
+    def test_mark_unread_is_audited(self, admin_client):
+        """Test that the read flag actions leave an auditlog entry."""
+        from auditlog.models import LogEntry
+        from leads.models import ContactInquiry
+        
+        inquiry = ContactInquiry.objects.create(
+            name='Visiteur', email='visiteur@example.com',
+            subject='Devis', message='Bonjour', is_read=True
+        )
+        url = reverse('admin-inquiries-mark-unread', args=[inquiry.id])
+        response = admin_client.post(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+        entry = LogEntry.objects.get_for_object(inquiry).latest('timestamp')
+        assert entry.changes_dict['is_read'] == ['True', 'False']
+
+
+@pytest.mark.django_db
+class TestLeadConversion:
+    """Tests for automatic lead to client conversion."""
+    
+    def test_converted_lead_creates_client(self, settings, sample_leads):
+        """Test that converting a lead creates a passwordless user and client profile."""
+        from django.contrib.auth import get_user_model
+        from leads.models import ConstructionLead
+        
+        settings.AUTO_CONVERT_LEADS = True
+        lead = sample_leads[0]
+        lead.status = ConstructionLead.Status.CONVERTED
+        lead.save()
+        
+        user = get_user_model().objects.get(email=lead.email)
+        assert user.username.startswith('lead0-')
+        assert not user.has_usable_password()
+        assert user.client_profile.phone == lead.phone
+    
+    def test_auto_convert_receiver_follows_setting(self, settings, sample_leads):
+        """Test that the conversion receiver is only connected while enabled."""
+        from django.contrib.auth import get_user_model
+        from leads.models import ConstructionLead
+        
+        settings.AUTO_CONVERT_LEADS = True
+        settings.AUTO_CONVERT_LEADS = False
+        lead = sample_leads[0]
+        lead.status = ConstructionLead.Status.CONVERTED
+        lead.save()
+        
+        assert not get_user_model().objects.filter(email=lead.email).exists()
+    
+    def test_status_tracking_does_not_reread_loaded_lead(
+        self, sample_leads, django_assert_num_queries
+    ):
+        """Test that saving a lead loaded from the database doesn't SELECT it again."""
+        from leads.models import ConstructionLead
+        
+        lead = ConstructionLead.objects.get(pk=sample_leads[0].pk)
+        lead.status = ConstructionLead.Status.CONTACTED
+        
+        # auditlog's own SELECT + INSERT, then the UPDATE; no status SELECT
+        with django_assert_num_queries(3):
+            lead.save()
+        
+        assert lead._old_status == ConstructionLead.Status.NEW
+    
+    def test_convert_action_creates_client(self, settings, admin_client, admin_user, sample_leads):
+        """Test that the admin convert action still creates the client account."""
+        from django.contrib.auth import get_user_model
+        
+        settings.AUTO_CONVERT_LEADS = True
+        lead = sample_leads[1]
+        url = reverse('admin-leads-convert', args=[lead.id])
+        response = admin_client.post(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+        user = get_user_model().objects.get(email=lead.email)
+        assert user.client_profile.created_by == admin_user
+
@@ -13,12 +13,73 @@ class TestPortfolioEndpoints:
     
     def test_list_portfolio_items(self, api_client, sample_portfolio_item):
         """Test listing published portfolio items."""
+        from marketing.models import PortfolioItem
+        
         url = reverse('portfolio-list')
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
         assert 'results' in response.data
         assert len(response.data['results']) >= 1
+        item = response.data['results'][0]
+        assert item['category_display'] == dict(PortfolioItem.Category.choices)[item['category']]
+    
+    def test_list_etag_changes_when_item_saved(self, api_client, sample_portfolio_item):
+        """Test that the portfolio list revalidates until an item changes."""
+        url = reverse('portfolio-list')
+        etag = api_client.get(url)['ETag']
+        
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+        
+        sample_portfolio_item.title = 'Villa Rénovée'
+        sample_portfolio_item.save()
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'][0]['title'] == 'Villa Rénovée'
+    
+    @pytest.mark.parametrize('url_name', [
+        'portfolio-list', 'blog-list', 'service-list', 'partner-list', 'testimonial-list',
+    ])
+    def test_public_lists_skip_etag_without_shared_cache(self, api_client, settings, url_name):
+        """Test that workers with their own cache don't answer 304s from stale versions."""
+        settings.SHARED_CACHE = False
+        
+        response = api_client.get(reverse(url_name))
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert 'ETag' not in response
+    
+    def test_list_query_count_is_constant(
+        self, api_client, sample_portfolio_item, django_assert_num_queries
+    ):
+        """Test that rendering more items doesn't add per-row queries."""
+        from marketing.models import PortfolioItem
+        
+        PortfolioItem.objects.bulk_create([
+            PortfolioItem(title=f'Villa {i}', slug=f'villa-{i}', main_image='portfolio/v.jpg')
+            for i in range(4)
+        ])
+        
+        # COUNT for the page, then the page itself
+        with django_assert_num_queries(2):
+            response = api_client.get(reverse('portfolio-list'))
+        
+        assert len(response.data['results']) == 5
+    
+    def test_list_leaves_description_out(self, api_client, sample_portfolio_item):
+        """Test that the list query only selects the columns it renders."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        
+        url = reverse('portfolio-list')
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.get(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+        selects = [q['sql'] for q in ctx.captured_queries if 'marketing_portfolioitem' in q['sql']]
+        assert selects and not any('"description"' in sql for sql in selects)
+        assert not any('"task"' in sql for sql in selects)
     
     def test_retrieve_portfolio_item(self, api_client, sample_portfolio_item):
         """Test retrieving a single portfolio item."""
@@ -29,6 +90,26 @@ class TestPortfolioEndpoints:
         assert response.status_code == status.HTTP_200_OK
         assert response.data['title'] == sample_portfolio_item.title
     
+    def test_retrieve_prefetches_gallery_and_videos(
+        self, api_client, sample_portfolio_item, django_assert_num_queries
+    ):
+        """Test that the nested gallery and videos cost one query each."""
+        from marketing.models import PortfolioVideo
+        
+        for i in range(3):
+            PortfolioVideo.objects.create(
+                portfolio_item=sample_portfolio_item,
+                title=f'Visite {i}',
+                video_url='https://example.com/v.mp4'
+            )
+        url = reverse('portfolio-detail', args=[sample_portfolio_item.slug])
+        
+        # item, gallery images, videos
+        with django_assert_num_queries(3):
+            response = api_client.get(url)
+        
+        assert len(response.data['videos']) == 3
+    
     def test_filter_portfolio_by_category(self, api_client, sample_portfolio_item):
         """Test filtering portfolio by category."""
         url = reverse('portfolio-list')
@@ -43,56 +124,161 @@ class TestPortfolioEndpoints:
         
         assert response.status_code == status.HTTP_200_OK
     
+    def test_filter_portfolio_by_city_and_year(self, api_client, sample_portfolio_item):
+        """Test the portfolio filter set's city, year and category choices."""
+        url = reverse('portfolio-list')
+        
+        hit = api_client.get(url, {'city': 'Niamey', 'year': 2024})
+        miss = api_client.get(url, {'city': 'Niamey', 'year': 2020})
+        invalid = api_client.get(url, {'category': 'UNKNOWN'})
+        
+        assert [item['slug'] for item in hit.data['results']] == [sample_portfolio_item.slug]
+        assert miss.data['results'] == []
+        assert invalid.status_code == status.HTTP_400_BAD_REQUEST
+    
     def test_search_portfolio(self, api_client, sample_portfolio_item):
         """Test searching portfolio items."""
         url = reverse('portfolio-list')
         response = api_client.get(url, {'search': 'Villa'})
         
         assert response.status_code == status.HTTP_200_OK
+    
+    def test_search_portfolio_matches_substrings_without_postgres(
+        self, api_client, sample_portfolio_item
+    ):
+        """Test that search keeps SearchFilter matching outside PostgreSQL."""
+        url = reverse('portfolio-list')
+        
+        hit = api_client.get(url, {'search': 'moder'})
+        miss = api_client.get(url, {'search': 'Entrepot'})
+        
+        assert [item['slug'] for item in hit.data['results']] == [sample_portfolio_item.slug]
+        assert miss.data['results'] == []
+    
+    def test_search_portfolio_ranks_by_similarity_on_postgres(self, sample_portfolio_item):
+        """Test that PostgreSQL search orders by trigram rank, then the view ordering."""
+        from unittest.mock import patch
+        from rest_framework.request import Request
+        from rest_framework.test import APIRequestFactory
+        from core.filters import TrigramSearchFilter
+        from marketing.models import PortfolioItem
+        from marketing.views import PortfolioItemViewSet
+        
+        request = Request(APIRequestFactory().get('/', {'search': 'villa'}))
+        queryset = PortfolioItem.objects.order_by('order', '-created_at')
+        
+        with patch('core.filters.connections') as connections:
+            connections.__getitem__.return_value.vendor = 'postgresql'
+            ranked = TrigramSearchFilter().filter_queryset(
+                request, queryset, PortfolioItemViewSet()
+            )
+        
+        assert 'search_rank' in ranked.query.annotations
+        assert ranked.query.order_by == ('-search_rank', 'order', '-created_at')
+    
+    def test_search_lookups_are_resolved_once(self, api_client, sample_portfolio_item):
+        """Test that search field lookups are cached per model after the first search."""
+        from unittest.mock import patch
+        from rest_framework.filters import SearchFilter
+        from core.filters import TrigramSearchFilter
+        from marketing.models import PortfolioItem
+        
+        url = reverse('portfolio-list')
+        api_client.get(url, {'search': 'villa'})
+        
+        with patch.object(SearchFilter, 'construct_search') as construct_search:
+            response = api_client.get(url, {'search': 'moderne'})
+        
+        construct_search.assert_not_called()
+        assert len(response.data['results']) == 1
+        assert TrigramSearchFilter._lookups[(PortfolioItem, 'title')] == 'title__icontains'
 
 
 @pytest.mark.django_db
 class TestServiceEndpoints:
     """Tests for public service endpoints."""
     
-    def test_list_services(self, api_client, db):
+    def test_list_services(self, api_client, sample_service):
         """Test listing services."""
-        from marketing.models import Service
-        from django.core.files.uploadedfile import SimpleUploadedFile
-        
-        # Create a simple test image for icon
-        image_content = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0cIDATx\x9cc\xf8\x0f\x00\x00\x01\x01\x00\x05\x18\xd8N\x00\x00\x00\x00IEND\xaeB`\x82'
-        test_icon = SimpleUploadedFile('icon.png', image_content, content_type='image/png')
+        url = reverse('service-list')
+        response = api_client.get(url)
         
-        Service.objects.create(
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_list_services_is_cached_until_write(
+        self, api_client, django_assert_num_queries
+    ):
+        """Repeat reads come from cache; saving a service invalidates them."""
+        from marketing.models import Service
+
+        service = Service.objects.create(
             title='Construction',
-            icon=test_icon,
             short_description='Construction de maisons',
             order=1,
             is_active=True
         )
-        
         url = reverse('service-list')
+        api_client.get(url)
+
+        with django_assert_num_queries(0):
+            response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+
+        service.title = 'Rénovation'
+        service.save()
+
         response = api_client.get(url)
-        
+        titles = [item['title'] for item in response.data['results']]
+        assert titles == ['Rénovation']
+
+    def test_list_services_not_cached_without_shared_cache(
+        self, api_client, sample_service, settings, django_assert_num_queries
+    ):
+        """Per-process caches would serve stale lists on other workers."""
+        settings.SHARED_CACHE = False
+        url = reverse('service-list')
+        api_client.get(url)
+
+        # count + page, every time
+        with django_assert_num_queries(2):
+            response = api_client.get(url)
         assert response.status_code == status.HTTP_200_OK
+    
+    def test_list_services_not_modified(self, api_client, db, django_assert_num_queries):
+        """Test that revalidating an unchanged list is a 304 without queries."""
+        from marketing.models import Service
+        
+        Service.objects.create(title='Construction', short_description='...')
+        url = reverse('service-list')
+        etag = api_client.get(url)['ETag']
+        
+        with django_assert_num_queries(0):
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    
+    def test_list_services_skips_audit_columns(self, api_client, db):
+        """Test that the list query only selects the rendered columns."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from marketing.models import Service
+        
+        Service.objects.create(title='Construction', short_description='...')
+        
+        with CaptureQueriesContext(connection) as ctx:
+            response = api_client.get(reverse('service-list'))
+        
+        assert response.data['results'][0]['title'] == 'Construction'
+        select = next(q['sql'] for q in ctx.captured_queries if 'ORDER BY' in q['sql'])
+        assert '"created_by_id"' not in select and '"deleted_at"' not in select
 
 
 @pytest.mark.django_db
 class TestTestimonialEndpoints:
     """Tests for public testimonial endpoints."""
     
-    def test_list_testimonials(self, api_client, db):
+    def test_list_testimonials(self, api_client, sample_testimonial):
         """Test listing testimonials."""
-        from marketing.models import Testimonial
-        
-        Testimonial.objects.create(
-            client_name='M. Test',
-            content='Excellent service!',
-            rating=5,
-            is_active=True
-        )
-        
         url = reverse('testimonial-list')
         response = api_client.get(url)
         
@@ -103,49 +289,331 @@ class TestTestimonialEndpoints:
 class TestBlogEndpoints:
     """Tests for public blog endpoints."""
     
-    def test_list_blog_posts(self, api_client, admin_user, db):
+    def test_list_blog_posts(self, api_client, sample_blog_post):
         """Test listing blog posts."""
+        url = reverse('blog-list')
+        response = api_client.get(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+    
+    def test_list_query_count_is_constant(self, api_client, django_assert_num_queries):
+        """Test that rendering more posts doesn't add per-row queries."""
         from marketing.models import BlogPost
-        from django.utils import timezone
-        from django.core.files.uploadedfile import SimpleUploadedFile
         
-        # Create a test thumbnail image
-        image_content = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x02\x00\x00\x00\x90wS\xde\x00\x00\x00\x0cIDATx\x9cc\xf8\x0f\x00\x00\x01\x01\x00\x05\x18\xd8N\x00\x00\x00\x00IEND\xaeB`\x82'
-        test_thumbnail = SimpleUploadedFile('thumb.png', image_content, content_type='image/png')
-        
-        BlogPost.objects.create(
-            title='Test Article',
-            slug='test-article',
-            content='Test content here.',
-            thumbnail=test_thumbnail,
-            is_published=True,
-            published_date=timezone.now()
-        )
+        for i in range(5):
+            BlogPost.objects.create(title=f'Article {i}', content='...', is_published=True)
         
-        url = reverse('blog-list')
+        # COUNT for the page, then the page itself
+        with django_assert_num_queries(2):
+            response = api_client.get(reverse('blog-list'))
+        
+        assert len(response.data['results']) == 5
+    
+    def test_list_leaves_content_out_until_retrieve(self, api_client, db):
+        """Test that only the detail query selects the article body."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from marketing.models import BlogPost
+        
+        post = BlogPost.objects.create(title='Article', content='Corps', is_published=True)
+        
+        with CaptureQueriesContext(connection) as listing:
+            api_client.get(reverse('blog-list'))
+        with CaptureQueriesContext(connection) as detail:
+            response = api_client.get(reverse('blog-detail', args=[post.slug]))
+        
+        assert not any('"content"' in q['sql'] for q in listing.captured_queries)
+        assert any('"content"' in q['sql'] for q in detail.captured_queries)
+        assert response.data['content'] == 'Corps'
+    
+    def test_list_count_is_exact_below_estimate_threshold(self, api_client, db):
+        """Test that small lists (and SQLite) keep the exact COUNT(*)."""
+        from marketing.models import BlogPost
+        
+        for i in range(3):
+            BlogPost.objects.create(title=f'Article {i}', content='...', is_published=True)
+        
+        response = api_client.get(reverse('blog-list'))
+        
+        assert response.data['count'] == 3
+    
+    def test_large_postgres_list_uses_planner_estimate(self, db):
+        """Test that the planner estimate replaces COUNT(*) past the threshold."""
+        from unittest import mock
+        from core import pagination
+        from marketing.models import BlogPost
+        
+        for i in range(3):
+            BlogPost.objects.create(title=f'Article {i}', content='...', is_published=True)
+        
+        paginator = pagination.EstimatedCountPaginator(BlogPost.objects.all(), 20)
+        paginator.estimate_threshold = 2
+        with mock.patch.object(pagination, 'connections') as connections, \
+                mock.patch.object(paginator, '_planner_estimate', return_value=250_000):
+            connections.__getitem__.return_value.vendor = 'postgresql'
+            assert paginator.count == 250_000
+        assert paginator.num_pages == 12_500
+    
+    def test_small_postgres_list_skips_explain(self, db, django_assert_num_queries):
+        """Test that a list under the threshold costs one bounded COUNT and no EXPLAIN."""
+        from unittest import mock
+        from core import pagination
+        from marketing.models import BlogPost
+        
+        for i in range(3):
+            BlogPost.objects.create(title=f'Article {i}', content='...', is_published=True)
+        
+        paginator = pagination.EstimatedCountPaginator(BlogPost.objects.all(), 20)
+        with mock.patch.object(pagination, 'connections') as connections, \
+                mock.patch.object(paginator, '_planner_estimate') as planner_estimate, \
+                django_assert_num_queries(1):
+            connections.__getitem__.return_value.vendor = 'postgresql'
+            assert paginator.count == 3
+        planner_estimate.assert_not_called()
+    
+    def test_retrieve_revalidates_with_etag(self, api_client, django_assert_num_queries):
+        """Test that an unchanged article returns 304 after a single-column read."""
+        from marketing.models import BlogPost
+        
+        post = BlogPost.objects.create(
+            title='Long Article', content='x' * 100_000, is_published=True
+        )
+        url = reverse('blog-detail', args=[post.slug])
         response = api_client.get(url)
+        etag = response['ETag']
+        assert response.data['content'] == post.content
         
+        with django_assert_num_queries(1):
+            response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        
+        post.content = 'Mis à jour'
+        post.save()
+        response = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
         assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+    
+    def test_retrieve_unknown_slug_is_404(self, api_client, db):
+        """Test that a missing article still returns 404."""
+        response = api_client.get(reverse('blog-detail', args=['absent']))
+        
+        assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
 @pytest.mark.django_db
-class TestPartnerEndpoints:
-    """Tests for public partner endpoints."""
+class TestAdminPortfolio:
+    """Tests for admin portfolio endpoints."""
     
-    def test_list_partners(self, api_client, db):
-        """Test listing partners."""
-        from marketing.models import Partner
+    def test_list_skips_gallery_and_videos(
+        self, admin_client, admin_user, sample_portfolio_item, django_assert_num_queries
+    ):
+        """The list serializer doesn't nest them, so they aren't prefetched."""
+        url = reverse('admin-portfolio-list')
         
-        Partner.objects.create(
-            name='Test Partner',
-            is_active=True,
-            order=1
+        # user lookup (JWT auth), page; cursor pagination runs no COUNT
+        with django_assert_num_queries(2):
+            response = admin_client.get(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'][0]['title'] == sample_portfolio_item.title
+    
+    def test_blog_list_pages_with_cursor(self, admin_client, admin_user):
+        """Test that admin blog list uses cursor pages over the list columns."""
+        from marketing.models import BlogPost
+        
+        BlogPost.objects.create(title='Premier', content='...')
+        url = reverse('admin-blog-list')
+        response = admin_client.get(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert 'count' not in response.data
+        assert response.data['next'] is None
+        assert response.data['results'][0]['slug'] == 'premier'
+    
+    def test_retrieve_nests_videos(self, admin_client, admin_user, sample_portfolio_item):
+        """Test that the detail view still returns the nested videos."""
+        from marketing.models import PortfolioVideo
+        
+        PortfolioVideo.objects.create(
+            portfolio_item=sample_portfolio_item,
+            title='Visite',
+            video_url='https://example.com/v.mp4'
         )
+        url = reverse('admin-portfolio-detail', args=[sample_portfolio_item.slug])
+        response = admin_client.get(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert [v['title'] for v in response.data['videos']] == ['Visite']
+        assert response.data['gallery_images'] == []
+    
+    def test_partial_update_writes_only_changed_columns(
+        self, admin_client, admin_user, sample_portfolio_item
+    ):
+        """Test that a toggle updates its column and an unchanged PATCH writes nothing."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
         
+        url = reverse('admin-portfolio-detail', args=[sample_portfolio_item.slug])
+        
+        with CaptureQueriesContext(connection) as ctx:
+            response = admin_client.patch(url, {'order': 7}, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        updates = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('UPDATE "marketing_portfolioitem"')]
+        assert len(updates) == 1
+        assert '"order"' in updates[0] and '"description"' not in updates[0]
+        sample_portfolio_item.refresh_from_db()
+        assert sample_portfolio_item.order == 7
+        assert sample_portfolio_item.updated_by == admin_user
+        
+        with CaptureQueriesContext(connection) as ctx:
+            response = admin_client.patch(url, {'order': 7}, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        assert not any(q['sql'].startswith('UPDATE') for q in ctx.captured_queries)
+    
+    def test_destroy_soft_deletes_without_save(self, admin_client, admin_user):
+        """Test that delete is one UPDATE that still drops cached lists and audits."""
+        from unittest import mock
+        from auditlog.models import LogEntry
+        from marketing.models import Service
+        
+        service = Service.objects.create(title='Construction', short_description='...')
+        admin_client.get(reverse('service-list'))
+        url = reverse('admin-services-detail', args=[service.pk])
+        
+        with mock.patch.object(Service, 'save') as save:
+            response = admin_client.delete(url)
+        
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        save.assert_not_called()
+        service = Service.all_objects.get(pk=service.pk)
+        assert service.is_deleted and service.deleted_by == admin_user
+        assert LogEntry.objects.get_for_object(service).filter(
+            changes__is_deleted=['False', 'True'], actor=admin_user
+        ).exists()
+        assert admin_client.get(reverse('service-list')).data['results'] == []
+
+
+@pytest.mark.django_db
+class TestPortfolioDjangoAdmin:
+    """Tests for the portfolio Django admin pages."""
+    
+    def test_changelist_search_falls_back_without_postgres(
+        self, admin_site_client, sample_portfolio_item
+    ):
+        """Test that search uses search_fields where there is no search_vector."""
+        url = reverse('admin:marketing_portfolioitem_changelist')
+        
+        response = admin_site_client.get(url, {'q': 'Moderne'})
+        
+        assert response.status_code == 200
+        assert list(response.context['cl'].result_list) == [sample_portfolio_item]
+    
+    def test_postgres_search_adds_vector_matches_to_substring_matches(self, rf, admin_user):
+        """Test that PostgreSQL search ORs the search_vector match with search_fields."""
+        from unittest.mock import patch
+        from django.contrib.admin.sites import site
+        from marketing.models import PortfolioItem
+        
+        model_admin = site._registry[PortfolioItem]
+        request = rf.get('/', {'q': 'maisons'})
+        request.user = admin_user
+        queryset = PortfolioItem.all_objects.filter(is_featured=True)
+        
+        with patch('marketing.admin.connections') as connections:
+            connections.__getitem__.return_value.vendor = 'postgresql'
+            results, _ = model_admin.get_search_results(request, queryset, 'maisons')
+        
+        where = str(results.query).split(' WHERE ')[1]
+        substring, vector = where.split(') OR (', 1)
+        assert '"title" LIKE' in substring
+        assert '"search_vector" @@' in vector
+        # The changelist filter applies to both branches
+        assert '"is_featured"' in substring and '"is_featured"' in vector
+    
+    def test_inline_rows_load_only_edited_columns(self, admin_site_client, sample_portfolio_item):
+        """Gallery and video inlines defer the columns they don't show."""
+        from marketing.models import PortfolioVideo
+        
+        video = PortfolioVideo.objects.create(
+            portfolio_item=sample_portfolio_item,
+            title='Visite',
+            video_url='https://example.com/v.mp4'
+        )
+        url = reverse('admin:marketing_portfolioitem_change', args=[sample_portfolio_item.pk])
+        response = admin_site_client.get(url)
+        
+        assert response.status_code == 200
+        formset = next(
+            f for f in response.context['inline_admin_formsets']
+            if f.formset.model is PortfolioVideo
+        ).formset
+        row = formset.forms[0].instance
+        assert row.pk == video.pk
+        assert {'created_by_id', 'is_deleted'} <= row.get_deferred_fields()
+
+
+@pytest.mark.django_db
+class TestSlugGeneration:
+    """Tests for unique slug generation on save."""
+    
+    def test_colliding_titles_get_numbered_slugs(self, django_assert_num_queries):
+        """Colliding titles are numbered, whatever the number of collisions."""
+        from marketing.models import BlogPost
+        from core.utils import unique_slug
+        
+        slugs = []
+        for _ in range(3):
+            post = BlogPost(title='Construire à Niamey', content='...')
+            post.save()
+            slugs.append(post.slug)
+        
+        assert slugs == ['construire-a-niamey', 'construire-a-niamey-1', 'construire-a-niamey-2']
+        
+        with django_assert_num_queries(1):
+            slug = unique_slug(BlogPost.all_objects.all(), 'construire-a-niamey')
+        assert slug == 'construire-a-niamey-3'
+    
+    def test_slug_cache_skips_lookups(self):
+        """Imports can share one set of taken slugs across saves."""
+        from marketing.models import BlogPost
+        
+        taken = set(BlogPost.all_objects.values_list('slug', flat=True))
+        posts = [BlogPost(title='Chantier', content='...') for _ in range(2)]
+        for post in posts:
+            post.save(slug_cache=taken)
+        
+        assert [post.slug for post in posts] == ['chantier', 'chantier-1']
+        assert taken == {'chantier', 'chantier-1'}
+
+
+@pytest.mark.django_db
+class TestPartnerEndpoints:
+    """Tests for public partner endpoints."""
+    
+    def test_list_partners(self, api_client, sample_partner):
+        """Test listing partners."""
         url = reverse('partner-list')
         response = api_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
+    
+    def test_list_partners_is_cached_until_deleted(
+        self, admin_client, sample_partner, django_assert_num_queries
+    ):
+        """Repeat reads come from cache; a soft delete invalidates them."""
+        from rest_framework.test import APIClient
+        
+        public_client = APIClient()
+        url = reverse('partner-list')
+        public_client.get(url)
+        
+        with django_assert_num_queries(0):
+            response = public_client.get(url)
+        assert [item['name'] for item in response.data['results']] == ['Test Partner']
+        
+        admin_client.delete(reverse('admin-partners-detail', args=[sample_partner.pk]))
+        
+        assert public_client.get(url).data['results'] == []
 
 
 @pytest.mark.django_db
@@ -194,3 +662,306 @@ class TestConstructionLead:
         response = api_client.post(url, data, format='json')
         
         assert response.status_code == status.HTTP_201_CREATED
+
+
+@pytest.mark.django_db
+class TestImageCompression:
+    """Tests for background image compression."""
+    
+    def test_partner_logo_compressed_after_commit(
+        self, in_memory_storage, django_capture_on_commit_callbacks
+    ):
+        """Test that uploads are compressed once the save commits, not during it."""
+        from PIL import Image
+        from marketing.models import Partner
+        from tests.conftest import jpeg_upload
+        
+        logo = jpeg_upload('logo.jpg', (1600, 800))
+        
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            partner = Partner.objects.create(name='Test Partner', logo=logo)
+        
+        assert '_compressed' not in partner.logo.name
+        assert len(callbacks) == 1
+        
+        callbacks[0]()
+        partner.refresh_from_db()
+        
+        assert '_compressed' in partner.logo.name
+        with Image.open(partner.logo.storage.open(partner.logo.name)) as img:
+            assert img.size == (400, 200)
+    
+    def test_uploads_in_one_transaction_are_compressed_in_one_batch(
+        self, in_memory_storage, django_capture_on_commit_callbacks
+    ):
+        """Test that a transaction saving several images enqueues one task."""
+        from unittest import mock
+        from core import tasks
+        from marketing.models import Partner
+        from tests.conftest import jpeg_upload
+        
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            partners = [
+                Partner.objects.create(
+                    name=f'Partner {i}',
+                    logo=jpeg_upload(f'logo{i}.jpg', (800, 400))
+                )
+                for i in range(3)
+            ]
+        
+        assert len(callbacks) == 1
+        with mock.patch.object(
+            tasks.compress_images_task, 'delay', wraps=tasks.compress_images_task.delay
+        ) as delay:
+            callbacks[0]()
+        
+        delay.assert_called_once()
+        assert len(delay.call_args.args[0]) == 3
+        for partner in partners:
+            partner.refresh_from_db()
+            assert '_compressed' in partner.logo.name
+    
+    def test_rolled_back_batch_is_not_reused(
+        self, in_memory_storage, django_capture_on_commit_callbacks
+    ):
+        """Test that jobs after a rollback start a new batch that gets sent."""
+        from unittest import mock
+        from django.db import transaction
+        from core import tasks
+        from marketing.models import Partner
+        from tests.conftest import jpeg_upload
+        
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            with pytest.raises(RuntimeError):
+                with transaction.atomic():
+                    Partner.objects.create(name='Rolled back', logo=jpeg_upload('a.jpg'))
+                    raise RuntimeError
+            partner = Partner.objects.create(name='Kept', logo=jpeg_upload('b.jpg'))
+        
+        assert len(callbacks) == 1
+        with mock.patch.object(tasks.compress_images_task, 'delay') as delay:
+            callbacks[0]()
+        
+        (jobs,), _ = delay.call_args
+        assert [job[1] for job in jobs] == [partner.pk]
+    
+    def test_failed_send_does_not_suppress_upload(
+        self, in_memory_storage, django_capture_on_commit_callbacks
+    ):
+        """Test that an upload the broker never took is queued on the next save."""
+        from unittest import mock
+        from core import tasks
+        from marketing.models import Partner
+        from tests.conftest import jpeg_upload
+        
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            partner = Partner.objects.create(name='Test Partner', logo=jpeg_upload('logo.jpg'))
+        with mock.patch.object(tasks.compress_images_task, 'delay', side_effect=OSError):
+            with pytest.raises(OSError):
+                callbacks[0]()
+        
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            partner.save()
+        with mock.patch.object(tasks.compress_images_task, 'delay') as delay:
+            callbacks[0]()
+            # Sent once, so saving again doesn't queue it a second time
+            with django_capture_on_commit_callbacks(execute=True):
+                partner.save()
+        
+        delay.assert_called_once()
+    
+    def test_compression_skips_row_with_newer_upload(self, in_memory_storage):
+        """Test that a stale compression doesn't overwrite a newer image."""
+        from unittest import mock
+        from core import utils
+        from core.tasks import compress_image_task
+        from marketing.models import Partner
+        from tests.conftest import jpeg_upload
+        
+        partner = Partner.objects.create(
+            name='Test Partner',
+            logo=jpeg_upload('old.jpg', (800, 400))
+        )
+        real_compress = utils.compress_image_variants
+        
+        def upload_while_compressing(*args, **kwargs):
+            Partner.objects.filter(pk=partner.pk).update(logo='partners/new.jpg')
+            return real_compress(*args, **kwargs)
+        
+        with mock.patch.object(utils, 'compress_image_variants', side_effect=upload_while_compressing):
+            assert compress_image_task('marketing.Partner', partner.pk, 'logo', [400, 200]) is False
+        
+        partner.refresh_from_db()
+        assert partner.logo.name == 'partners/new.jpg'
+        assert not any('_compressed' in name for name in partner.logo.storage._files)
+    
+    def test_identical_upload_reuses_compressed_file(self, in_memory_storage):
+        """Test that the same bytes at the same size are compressed once."""
+        from unittest import mock
+        from core import utils
+        from core.tasks import compress_image_task
+        from marketing.models import Partner
+        from tests.conftest import jpeg_upload
+        
+        partners = [
+            Partner.objects.create(
+                name=f'Partner {i}',
+                logo=jpeg_upload('logo.jpg', (800, 400))
+            )
+            for i in range(2)
+        ]
+        
+        with mock.patch.object(
+            utils, 'compress_image_variants', wraps=utils.compress_image_variants
+        ) as compress:
+            for partner in partners:
+                assert compress_image_task('marketing.Partner', partner.pk, 'logo', [400, 200])
+        
+        assert compress.call_count == 1
+        names = {Partner.objects.get(pk=p.pk).logo.name for p in partners}
+        assert len(names) == 1 and '_compressed' in names.pop()
+    
+    def test_compression_stores_variant_manifest(self, api_client, in_memory_storage):
+        """Test that AVIF/WebP variants are stored and exposed with the fallback."""
+        from PIL import Image, features
+        from core.tasks import compress_image_task
+        from marketing.models import Partner
+        from tests.conftest import jpeg_upload
+        
+        partner = Partner.objects.create(
+            name='Test Partner',
+            logo=jpeg_upload('logo.jpg', (800, 400))
+        )
+        
+        assert compress_image_task('marketing.Partner', partner.pk, 'logo', [400, 200])
+        
+        partner.refresh_from_db()
+        expected = {'jpg'} | {ext for ext in ('avif', 'webp') if features.check(ext)}
+        assert set(partner.image_variants) == expected
+        assert partner.image_variants['jpg'] == partner.logo.name
+        for ext, name in partner.image_variants.items():
+            with Image.open(partner.logo.storage.open(name)) as img:
+                assert img.format.lower() == ('jpeg' if ext == 'jpg' else ext)
+                assert img.size == (400, 200)
+        
+        response = api_client.get(reverse('partner-list'))
+        variants = response.data['results'][0]['variants']
+        assert set(variants) == expected
+        assert variants['jpg'].startswith('http://testserver/')
+    
+    def test_resaving_before_compression_does_not_queue_again(
+        self, in_memory_storage, django_capture_on_commit_callbacks
+    ):
+        """Test that one upload is queued once however often the row is saved."""
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from marketing.models import Partner
+        
+        logo = SimpleUploadedFile('logo.jpg', b'not really a jpeg', content_type='image/jpeg')
+        
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            partner = Partner.objects.create(name='Test Partner', logo=logo)
+            partner.order = 2
+            partner.save()
+        
+        assert len(callbacks) == 1
+    
+    def test_compressed_jpeg_is_progressive(self):
+        """Test that JPEG output is a resized, progressive encode."""
+        from PIL import Image
+        from core.utils import compress_image
+        from tests.conftest import jpeg_upload
+        
+        upload = jpeg_upload('large.jpg', (6000, 3000))
+        
+        compressed = compress_image(upload, max_size=(1200, 1200))
+        
+        with Image.open(compressed) as img:
+            assert img.size == (1200, 600)
+            assert img.info.get('progressive')
+    
+    def test_unreadable_image_is_logged(self, caplog):
+        """Test that a Pillow failure is logged rather than printed."""
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        from core.utils import compress_image
+        
+        upload = SimpleUploadedFile('broken.jpg', b'not an image', content_type='image/jpeg')
+        
+        with caplog.at_level('ERROR', logger='core.utils'):
+            assert compress_image(upload) is None
+        
+        assert 'Image compression error' in caplog.text
+
+
+class TestVipsCompression:
+    """Tests for the libvips branch of compress_image_variants, with pyvips mocked."""
+    
+    @pytest.fixture
+    def vips(self, monkeypatch):
+        from unittest import mock
+        from core import utils
+        
+        fake = mock.Mock()
+        fake.Error = type('Error', (Exception,), {})
+        img = fake.Image.thumbnail_buffer.return_value
+        img.flatten.return_value = img
+        img.hasalpha.return_value = True
+        img.jpegsave_buffer.return_value = b'jpeg'
+        img.pngsave_buffer.return_value = b'png'
+        img.heifsave_buffer.return_value = b'avif'
+        img.webpsave_buffer.return_value = b'webp'
+        monkeypatch.setattr(utils, 'pyvips', fake)
+        return fake
+    
+    def test_jpeg_is_flattened_and_saved_as_jpeg(self, vips):
+        """Test that JPEG sources lose their alpha and unsupported variants are skipped."""
+        from core.utils import compress_image_variants
+        from tests.conftest import jpeg_upload
+        
+        img = vips.Image.thumbnail_buffer.return_value
+        img.get.return_value = 'jpegload_buffer'
+        img.heifsave_buffer.side_effect = vips.Error('no AVIF encoder')
+        
+        fallback, variants = compress_image_variants(jpeg_upload('photo.jpg'))
+        
+        img.flatten.assert_called_once()
+        assert fallback.name == 'photo_compressed.jpg'
+        assert fallback.read() == b'jpeg'
+        assert {ext: f.read() for ext, f in variants.items()} == {'webp': b'webp'}
+    
+    def test_png_stays_png(self, vips):
+        """Test that PNG sources keep their format and transparency."""
+        from core.utils import compress_image_variants
+        from tests.conftest import png_upload
+        
+        img = vips.Image.thumbnail_buffer.return_value
+        img.get.return_value = 'pngload_buffer'
+        
+        fallback, _ = compress_image_variants(png_upload('logo.png'))
+        
+        img.flatten.assert_not_called()
+        assert fallback.name == 'logo_compressed.png'
+        assert fallback.read() == b'png'
+    
+    def test_gif_falls_back_to_pillow(self, vips):
+        """Test that GIF sources are left to Pillow."""
+        from core.utils import compress_image_variants
+        from tests.conftest import jpeg_upload
+        
+        vips.Image.thumbnail_buffer.return_value.get.return_value = 'gifload_buffer'
+        
+        fallback, _ = compress_image_variants(jpeg_upload('photo.jpg'))
+        
+        assert fallback.read()[:2] == b'\xff\xd8'  # encoded by Pillow
+    
+    def test_vips_error_falls_back_to_pillow(self, vips, caplog):
+        """Test that an image libvips can't read is compressed by Pillow and logged."""
+        from core.utils import compress_image_variants
+        from tests.conftest import jpeg_upload
+        
+        vips.Image.thumbnail_buffer.side_effect = vips.Error('corrupt')
+        
+        with caplog.at_level('WARNING', logger='core.utils'):
+            fallback, _ = compress_image_variants(jpeg_upload('photo.jpg'))
+        
+        assert fallback.read()[:2] == b'\xff\xd8'
+        assert 'libvips' in caplog.text
@@ -0,0 +1,18 @@
+"""
+Tests for database migrations.
+
+The suite builds its test database from the models (--nomigrations in
+pytest.ini), so this is what catches a model change without a migration.
+"""
+
+import pytest
+from django.core.management import call_command
+
+
+@pytest.mark.django_db
+class TestMigrations:
+    """Tests that migrations match the models."""
+    
+    def test_no_missing_migrations(self):
+        """Test that makemigrations has nothing left to generate."""
+        call_command('makemigrations', '--check', '--dry-run', verbosity=0)
@@ -6,17 +6,12 @@ import pytest
 from unittest.mock import patch, MagicMock
 
 
-@pytest.mark.django_db
-class TestNotificationService:
-    """Tests for core notification functions."""
+class TestNotificationImports:
+    """Smoke test for the helpers other apps import."""
     
-    def test_compress_image_function_exists(self):
-        """Test that compress_image function is importable."""
+    def test_helpers_are_importable(self):
+        """Test that compression and notification helpers are importable."""
         from core.utils import compress_image
-        assert callable(compress_image)
-    
-    def test_notification_functions_exist(self):
-        """Test that notification functions are importable."""
         from core.notifications import (
             send_push_notification,
             send_push_to_multiple,
@@ -27,13 +22,15 @@ class TestNotificationService:
             notify_welcome
         )
         
-        assert callable(send_push_notification)
-        assert callable(send_push_to_multiple)
-        assert callable(send_email)
-        assert callable(send_simple_email)
-        assert callable(notify_project_update)
-        assert callable(notify_new_invoice)
-        assert callable(notify_welcome)
+        assert all(callable(helper) for helper in [
+            compress_image, send_push_notification, send_push_to_multiple,
+            send_email, send_simple_email, notify_project_update,
+            notify_new_invoice, notify_welcome
+        ])
+
+
+class TestNotificationService:
+    """Tests for core notification functions."""
     
     @patch('core.notifications.get_firebase_app')
     def test_push_notification_no_firebase(self, mock_firebase):
@@ -50,6 +47,94 @@ class TestNotificationService:
         
         assert result is False
     
+    def test_firebase_disabled_is_decided_once(self, settings, caplog):
+        """Test that missing credentials are only checked on the first push."""
+        from core.notifications import get_firebase_app
+        
+        settings.FIREBASE_CREDENTIALS_PATH = None
+        
+        with patch('core.notifications._firebase_state', 'uninit'):
+            assert get_firebase_app() is None
+            assert get_firebase_app() is None
+        
+        warnings = [r for r in caplog.records if 'not configured' in r.getMessage()]
+        assert len(warnings) == 1
+    
+    @patch('core.notifications.get_firebase_app', return_value=MagicMock())
+    def test_push_notification_sent_on_push_loop(self, mock_firebase):
+        """Test that a single push goes through the async HTTP/2 client."""
+        from core.notifications import send_push_notification
+        
+        async def send_each_async(messages):
+            return MagicMock(responses=[MagicMock(success=True, message_id='msg-1')])
+        
+        mock_messaging = MagicMock()
+        mock_messaging.send_each_async = MagicMock(side_effect=send_each_async)
+        
+        with patch('core.notifications._messaging', mock_messaging):
+            result = send_push_notification(
+                fcm_token='token',
+                title='Test',
+                body='Test message'
+            )
+        
+        assert result is True
+        mock_messaging.send_each_async.assert_called_once()
+        mock_messaging.send.assert_not_called()
+    
+    @patch('core.notifications.get_firebase_app', return_value=MagicMock())
+    def test_push_to_multiple_sends_in_batches(self, mock_firebase):
+        """Test that multicast pushes are split into batches of 100 tokens."""
+        from core.notifications import send_push_to_multiple
+        
+        async def send_each_for_multicast_async(message):
+            return MagicMock(success_count=len(message.tokens), failure_count=0)
+        
+        mock_messaging = MagicMock()
+        mock_messaging.send_each_for_multicast_async = MagicMock(
+            side_effect=send_each_for_multicast_async
+        )
+        mock_messaging.MulticastMessage.side_effect = lambda **kwargs: MagicMock(**kwargs)
+        
+        with patch('core.notifications._messaging', mock_messaging):
+            result = send_push_to_multiple(
+                fcm_tokens=[f'token-{i}' for i in range(250)],
+                title='Test',
+                body='Test message'
+            )
+        
+        assert result == {'success_count': 250, 'failure_count': 0}
+        assert mock_messaging.send_each_for_multicast_async.call_count == 3
+    
+    def test_access_token_shared_between_credentials(self):
+        """Test that only the first credential mints an FCM access token."""
+        from datetime import datetime, timedelta
+        from django.core.cache import cache
+        from core.notifications import FCM_ACCESS_TOKEN_CACHE_KEY, _share_access_token
+        
+        cache.delete(FCM_ACCESS_TOKEN_CACHE_KEY)
+        expiry = datetime.utcnow() + timedelta(hours=1)
+        
+        def mint(credential):
+            def refresh(request):
+                credential.token, credential.expiry = 'access-token', expiry
+            return refresh
+        
+        first, second = MagicMock(expiry=None), MagicMock(expiry=None)
+        first.refresh = MagicMock(side_effect=mint(first))
+        second.refresh = MagicMock(side_effect=mint(second))
+        first_refresh, second_refresh = first.refresh, second.refresh
+        _share_access_token(first)
+        _share_access_token(second)
+        
+        first.refresh(None)
+        second.refresh(None)
+        
+        assert first_refresh.call_count == 1
+        assert second_refresh.call_count == 0
+        assert second.token == 'access-token'
+        cache.delete(FCM_ACCESS_TOKEN_CACHE_KEY)
+    
     def test_push_notification_no_token(self):
         """Test push notification with no token."""
         from core.notifications import send_push_notification
@@ -70,7 +155,10 @@ class TestNotificationService:
         mock_email = MagicMock()
         mock_email_class.return_value = mock_email
         
-        with patch('core.notifications.render_to_string', return_value='<html>Test</html>'):
+        mock_template = MagicMock()
+        mock_template.render.return_value = '<html>Test</html>'
+        
+        with patch('core.notifications.get_email_template', return_value=mock_template):
             result = send_email(
                 to_email='test@example.com',
                 subject='Test Subject',
@@ -80,61 +168,151 @@ class TestNotificationService:
         
         assert result is True
         mock_email.send.assert_called_once()
+    
+    def test_send_email_batch_uses_one_connection(self, mailoutbox):
+        """Test that a batch of emails is sent over a single connection."""
+        from django.core.mail import get_connection
+        from core.notifications import send_email_batch
+        
+        messages = [
+            {
+                'to_email': f'client{i}@example.com',
+                'subject': 'Bienvenue',
+                'template_name': 'welcome',
+                'context': {'client_name': f'Client {i}'}
+            }
+            for i in range(3)
+        ]
+        
+        with patch('core.notifications.get_connection', wraps=get_connection) as mock_conn:
+            sent = send_email_batch(messages)
+        
+        assert sent == 3
+        assert mock_conn.call_count == 1
+        assert [m.to for m in mailoutbox] == [[f'client{i}@example.com'] for i in range(3)]
+
+
+def create_project_update(project, user):
+    """Create a ProjectUpdate for a notification signal test."""
+    from clients.models import ProjectUpdate
+    
+    return ProjectUpdate.objects.create(
+        project=project,
+        title='Test Update',
+        description='Progress report',
+        created_by=user
+    )
+
+
+def create_invoice(project, user):
+    """Create an Invoice for a notification signal test."""
+    from billing.models import Invoice
+    from django.utils import timezone
+    from datetime import timedelta
+    
+    return Invoice.objects.create(
+        project=project,
+        subject='Test Invoice',
+        issue_date=timezone.now().date(),
+        due_date=timezone.now().date() + timedelta(days=30),
+        tax_percentage=18,
+        created_by=user
+    )
 
 
 @pytest.mark.django_db
 class TestNotificationSignals:
     """Tests for notification signal handlers."""
     
-    @patch('core.notifications.send_push_notification')
-    @patch('core.notifications.send_email')
-    def test_project_update_triggers_notification(
-        self, mock_email, mock_push, sample_project, admin_user
+    @pytest.fixture(autouse=True)
+    def enable_notifications(self, settings):
+        settings.ENABLE_NOTIFICATIONS = True
+    
+    @pytest.mark.parametrize('create, notifier', [
+        (create_project_update, 'notify_project_update'),
+        (create_invoice, 'notify_new_invoice'),
+    ], ids=['project_update', 'invoice'])
+    def test_creation_triggers_notification(
+        self, create, notifier, sample_project, admin_user, django_capture_on_commit_callbacks
     ):
-        """Test that creating a project update triggers notification."""
+        """Test that creating an update or invoice notifies the client once."""
+        with patch(f'core.notifications.{notifier}', return_value=True) as mock_notify:
+            with django_capture_on_commit_callbacks(execute=True):
+                instance = create(sample_project, admin_user)
+        
+        mock_notify.assert_called_once()
+        assert mock_notify.call_args[0][0].pk == instance.pk
+    
+    @patch('core.notifications.notify_project_update')
+    def test_project_update_notification_runs_after_commit(
+        self, mock_notify, sample_project, admin_user, django_capture_on_commit_callbacks
+    ):
+        """Test that the notification task is only dispatched on commit."""
         from clients.models import ProjectUpdate
         
-        # Mock successful notifications
-        mock_push.return_value = True
-        mock_email.return_value = True
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            update = ProjectUpdate.objects.create(
+                project=sample_project,
+                title='Test Update',
+                description='Progress report',
+                created_by=admin_user
+            )
+            mock_notify.assert_not_called()
+        
+        assert len(callbacks) == 1
+        mock_notify.assert_called_once()
+        assert mock_notify.call_args[0][0].pk == update.pk
+    
+    @patch('core.notifications.send_push_notification', return_value=True)
+    @patch('core.notifications.send_email', return_value=True)
+    def test_invoice_notification_not_sent_twice(self, mock_email, mock_push, sample_invoice):
+        """Test that a retried invoice notification is skipped."""
+        from core.notifications import notify_new_invoice
+        
+        assert notify_new_invoice(sample_invoice) is True
+        assert notify_new_invoice(sample_invoice) is False
         
-        # Create project update
-        update = ProjectUpdate.objects.create(
-            project=sample_project,
-            title='Test Update',
-            description='Progress report',
-            created_by=admin_user
-        )
+        mock_email.assert_called_once()
+    
+    @patch('core.notifications.send_push_notification', return_value=False)
+    @patch('core.notifications.send_email', return_value=False)
+    def test_failed_invoice_notification_is_retried(self, mock_email, mock_push, sample_invoice):
+        """Test that the task retries when the email could not be sent."""
+        from celery.exceptions import MaxRetriesExceededError
+        from core.tasks import notify_new_invoice_task
+        
+        result = notify_new_invoice_task.apply(args=[sample_invoice.pk])
         
-        # Signal should have been triggered
-        assert update.id is not None
+        # First attempt plus max_retries, each re-claiming the notification
+        assert mock_email.call_count == notify_new_invoice_task.max_retries + 1
+        assert isinstance(result.result, MaxRetriesExceededError)
     
-    @patch('core.notifications.send_push_notification')
-    @patch('core.notifications.send_email')
-    def test_invoice_creation_triggers_notification(
-        self, mock_email, mock_push, sample_project, admin_user
+    def test_invoice_notification_loads_items_once(
+        self, sample_invoice, mailoutbox, django_assert_num_queries
     ):
-        """Test that creating an invoice triggers notification."""
-        from billing.models import Invoice
-        from django.utils import timezone
-        from datetime import timedelta
-        
-        mock_push.return_value = True
-        mock_email.return_value = True
-        
-        invoice = Invoice.objects.create(
-            project=sample_project,
-            subject='Test Invoice',
-            issue_date=timezone.now().date(),
-            due_date=timezone.now().date() + timedelta(days=30),
-            tax_percentage=18,
-            created_by=admin_user
-        )
+        """Test that invoice totals and the email template share one items query."""
+        from billing.models import Invoice, InvoiceItem
+        from core.notifications import notify_new_invoice
+        
+        InvoiceItem.objects.bulk_create([
+            InvoiceItem(
+                invoice=sample_invoice,
+                description=f'Travaux {i}',
+                quantity=1,
+                unit_price=1000
+            )
+            for i in range(3)
+        ])
+        invoice = Invoice.objects.select_related(
+            'project__client__user'
+        ).get(pk=sample_invoice.pk)
+        
+        with django_assert_num_queries(1):
+            assert notify_new_invoice(invoice) is True
         
-        assert invoice.invoice_number is not None
+        assert len(mailoutbox) == 1
 
 
-@pytest.mark.django_db
 class TestEmailTemplates:
     """Tests for email template rendering."""
     
@@ -209,3 +387,26 @@ class TestEmailTemplates:
         
         assert 'Test User' in html
         assert 'reset?token=abc123' in html
+    
+    def test_plain_text_body_uses_txt_template(self):
+        """Test that emails use the .txt companion instead of stripped HTML."""
+        from core.notifications import build_email
+        
+        email = build_email(
+            to_email='test@example.com',
+            subject='Test',
+            template_name='project_update',
+            context={
+                'client_name': 'Test Client',
+                'project_name': 'Villa Test',
+                'update_title': 'Foundation Complete',
+                'update_description': 'Work is progressing well.',
+                'current_phase': 'Foundation',
+                'progress': 25
+            }
+        )
+        
+        assert 'Villa Test' in email.body
+        assert 'Progression: 25%' in email.body
+        assert 'font-family' not in email.body
+